@@ -35,8 +35,16 @@ are derived using:
   (c) Sector-specific trackers (Gallagher Re for insurtech, etc.)
 
 All figures are in BILLIONS of USD. Estimates are marked with comments.
+
+The per-category dicts are the authoring format. For aggregation, the same
+numbers are available as a dense years x categories NumPy matrix
+(funding_matrix(), with an aligned confidence_matrix()) plus vectorized
+totals/shares/YoY/slice helpers that also accept stacked scenario arrays of
+shape (..., years, categories).
 """
 
+from functools import lru_cache
+
 # =============================================================================
 # TOTAL GLOBAL FINTECH INVESTMENT BY YEAR (VC + PE + M&A combined)
 # Source: KPMG Pulse of Fintech
@@ -274,15 +282,12 @@ def get_funding_dataframe():
     """Return a pandas DataFrame with years as rows and categories as columns."""
     import pandas as pd
 
-    data = {}
-    for category, yearly_data in FUNDING_BY_CATEGORY.items():
-        data[category] = {year: yearly_data.get(year, 0) for year in YEARS}
-
-    df = pd.DataFrame(data, index=YEARS)
+    matrix = funding_matrix()
+    df = pd.DataFrame(matrix, index=YEARS, columns=CATEGORIES)
     df.index.name = "Year"
 
     # Add totals
-    df["Category Sum"] = df.sum(axis=1)
+    df["Category Sum"] = year_totals(matrix)
 
     # Add KPMG total for reference
     df["KPMG Total (VC+PE+M&A)"] = [
@@ -370,15 +375,13 @@ def plot_category_heatmap(save_path=None):
     """Generate a heatmap showing funding intensity by category and year."""
     import matplotlib.pyplot as plt
     import numpy as np
-    import pandas as pd
 
-    df = get_funding_dataframe()
-    categories = list(FUNDING_BY_CATEGORY.keys())
-    plot_df = df[categories]
+    values = funding_matrix().T  # categories x years
+    categories = CATEGORIES
 
     fig, ax = plt.subplots(figsize=(16, 8))
 
-    im = ax.imshow(plot_df.T.values, cmap="YlOrRd", aspect="auto")
+    im = ax.imshow(values, cmap="YlOrRd", aspect="auto")
 
     ax.set_xticks(range(len(YEARS)))
     ax.set_xticklabels(YEARS)
@@ -386,12 +389,10 @@ def plot_category_heatmap(save_path=None):
     ax.set_yticklabels(categories)
 
     # Add value labels
-    for i in range(len(categories)):
-        for j in range(len(YEARS)):
-            val = plot_df.iloc[j, i]
-            text_color = "white" if val > 15 else "black"
-            ax.text(j, i, f"${val:.1f}B", ha="center", va="center",
-                    fontsize=7, color=text_color, fontweight="bold")
+    for (i, j), val in np.ndenumerate(values):
+        text_color = "white" if val > 15 else "black"
+        ax.text(j, i, f"${val:.1f}B", ha="center", va="center",
+                fontsize=7, color=text_color, fontweight="bold")
 
     plt.colorbar(im, ax=ax, label="Investment ($ Billions)")
     ax.set_title(
@@ -515,6 +516,101 @@ CONFIDENCE = {
 }
 
 
+# =============================================================================
+# COLUMNAR STORE (years x categories)
+# =============================================================================
+# Built once from the dicts above. Arrays are read-only; copy before editing a
+# scenario variant. Helpers take an optional `matrix` of shape
+# (..., len(YEARS), len(CATEGORIES)) so stacked scenarios reduce in one call.
+
+CATEGORIES = list(FUNDING_BY_CATEGORY.keys())
+
+# Confidence ratings as ordered integer codes; -1 marks an unrated cell.
+CONFIDENCE_CODES = {"L": 0, "M": 1, "H": 2}
+
+
+@lru_cache(maxsize=None)
+def funding_matrix():
+    """Funding in $B as a float64 array, rows = YEARS, columns = CATEGORIES."""
+    import numpy as np
+
+    matrix = np.array(
+        [[FUNDING_BY_CATEGORY[cat].get(year, 0) for cat in CATEGORIES] for year in YEARS],
+        dtype=np.float64,
+    )
+    matrix.flags.writeable = False
+    return matrix
+
+
+@lru_cache(maxsize=None)
+def confidence_matrix():
+    """CONFIDENCE as int8 codes (see CONFIDENCE_CODES), aligned with funding_matrix()."""
+    import numpy as np
+
+    matrix = np.array(
+        [
+            [CONFIDENCE_CODES.get(CONFIDENCE.get(cat, {}).get(year), -1) for cat in CATEGORIES]
+            for year in YEARS
+        ],
+        dtype=np.int8,
+    )
+    matrix.flags.writeable = False
+    return matrix
+
+
+def year_totals(matrix=None):
+    """Sum across categories for each year -> shape (..., years)."""
+    matrix = funding_matrix() if matrix is None else matrix
+    return matrix.sum(axis=-1)
+
+
+def category_totals(matrix=None):
+    """Sum across years for each category -> shape (..., categories)."""
+    matrix = funding_matrix() if matrix is None else matrix
+    return matrix.sum(axis=-2)
+
+
+def category_shares(matrix=None):
+    """Each category's share of its year's category sum (0 where the year is empty)."""
+    import numpy as np
+
+    matrix = funding_matrix() if matrix is None else matrix
+    totals = matrix.sum(axis=-1, keepdims=True)
+    return np.divide(matrix, totals, out=np.zeros(np.shape(matrix)), where=totals > 0)
+
+
+def yoy_growth(matrix=None):
+    """Year-over-year growth per category -> shape (..., years - 1, categories); NaN where prior year is 0."""
+    import numpy as np
+
+    matrix = funding_matrix() if matrix is None else matrix
+    prior = matrix[..., :-1, :]
+    change = matrix[..., 1:, :] - prior
+    return np.divide(change, prior, out=np.full(np.shape(change), np.nan), where=prior != 0)
+
+
+def funding_slice(years=None, categories=None, matrix=None):
+    """Sub-matrix for the given years and/or category names, in the order given."""
+    matrix = funding_matrix() if matrix is None else matrix
+    if years is not None:
+        matrix = matrix[..., [YEARS.index(y) for y in years], :]
+    if categories is not None:
+        matrix = matrix[..., [CATEGORIES.index(c) for c in categories]]
+    return matrix
+
+
+def confidence_weighted_share(level="H", matrix=None):
+    """Share of each year's category funding sitting in cells rated at least `level`."""
+    import numpy as np
+
+    matrix = funding_matrix() if matrix is None else matrix
+    rated = confidence_matrix() >= CONFIDENCE_CODES[level]
+    totals = matrix.sum(axis=-1)
+    return np.divide(
+        (matrix * rated).sum(axis=-1), totals, out=np.zeros(np.shape(totals)), where=totals > 0
+    )
+
+
 # =============================================================================
 # PRINT SUMMARY TABLE
 # =============================================================================
@@ -531,26 +627,22 @@ if __name__ == "__main__":
     print(header)
     print("-" * 130)
 
-    grand_total_by_year = {y: 0 for y in YEARS}
+    matrix = funding_matrix()
+    by_category = category_totals(matrix)
+    by_year = year_totals(matrix)
 
-    for cat_name, cat_data in FUNDING_BY_CATEGORY.items():
+    for i, cat_name in enumerate(CATEGORIES):
         row = f"{cat_name:<30}"
-        row_total = 0
-        for y in YEARS:
-            val = cat_data.get(y, 0)
-            row += f"{val:>8.1f}"
-            row_total += val
-            grand_total_by_year[y] += val
-        row += f"{row_total:>10.1f}"
+        row += "".join(f"{val:>8.1f}" for val in matrix[:, i])
+        row += f"{by_category[i]:>10.1f}"
         print(row)
 
     print("-" * 130)
 
     # Category sum row
     row = f"{'CATEGORY SUM':<30}"
-    for y in YEARS:
-        row += f"{grand_total_by_year[y]:>8.1f}"
-    row += f"{sum(grand_total_by_year.values()):>10.1f}"
+    row += "".join(f"{val:>8.1f}" for val in by_year)
+    row += f"{by_year.sum():>10.1f}"
     print(row)
 
     # KPMG total row
@@ -565,6 +657,11 @@ if __name__ == "__main__":
         row += f"{TOTAL_FINTECH_VC_FUNDING[y][0]:>8.1f}"
     print(row)
 
+    # Share of category funding backed by high-confidence figures
+    row = f"{'High-confidence share':<30}"
+    row += "".join(f"{share * 100:>7.0f}%" for share in confidence_weighted_share("H", matrix))
+    print(row)
+
     print("=" * 130)
     print()
     print("Note: Categories overlap (e.g., BNPL straddles Payments & Lending;")
@@ -8,23 +8,26 @@ ainvest, ChainCatcher, and other public sources.
 All data points include source annotations. Dates are approximate where
 exact dates were not available.
 
+Tables are stored as plain row lists and turned into DataFrames lazily: the
+first access to e.g. CHAIN_DATA builds (and caches) that one frame, so
+importing this module does not import pandas or parse every date column.
+
 Usage:
-    uv run python x402_data.py  # prints summary tables
+    uv run python x402_data.py                 # prints summary tables
+    uv run python x402_data.py --import-budget # fail if `import x402_data` is slow
 
     # In other scripts:
-    from x402_data import *
+    from x402_data import CHAIN_DATA, FACILITATOR_SHARE
 """
 
-import pandas as pd
-import numpy as np
-from datetime import datetime
+import sys
 
 # =============================================================================
 # 1. DAILY TRANSACTION DATA (key data points, not continuous series)
 # =============================================================================
 # Sources: Dune Analytics (hashed_official), PANews, Stacy Muur, Cryptonomist
 
-DAILY_TX_MILESTONES = pd.DataFrame([
+_DAILY_TX_MILESTONES_ROWS = [
     {"date": "2025-05-06", "daily_tx": 50,       "note": "Launch day (est.)", "source": "x402.org"},
     {"date": "2025-06-01", "daily_tx": 200,      "note": "Early adoption", "source": "est. from PANews trajectory"},
     {"date": "2025-07-01", "daily_tx": 500,      "note": "Post-hackathon (200+ projects)", "source": "est."},
@@ -42,30 +45,28 @@ DAILY_TX_MILESTONES = pd.DataFrame([
     {"date": "2026-01-11", "daily_tx": 1023400,  "note": "Solana flips Base daily", "source": "Cryptonomist"},
     {"date": "2026-01-20", "daily_tx": 900000,   "note": "Stabilized", "source": "est."},
     {"date": "2026-02-01", "daily_tx": 850000,   "note": "Recent steady state", "source": "est."},
-])
-DAILY_TX_MILESTONES["date"] = pd.to_datetime(DAILY_TX_MILESTONES["date"])
+]
 
 
 # =============================================================================
 # 2. CUMULATIVE TRANSACTION DATA
 # =============================================================================
 
-CUMULATIVE_TX = pd.DataFrame([
+_CUMULATIVE_TX_ROWS = [
     {"date": "2025-05-06", "cumulative_tx": 0,         "cumulative_volume_usd": 0,          "source": "Launch"},
     {"date": "2025-10-26", "cumulative_tx": 1446000,   "cumulative_volume_usd": 1590000,    "source": "PANews / Dune"},
     {"date": "2025-11-15", "cumulative_tx": 40000000,  "cumulative_volume_usd": 10000000,   "source": "Stacy Muur / Dune"},
     {"date": "2025-12-01", "cumulative_tx": 75000000,  "cumulative_volume_usd": 24000000,   "source": "CryptSlate"},
     {"date": "2025-12-15", "cumulative_tx": 100000000, "cumulative_volume_usd": 35000000,   "source": "x402.org ('over 100M')"},
     {"date": "2026-01-15", "cumulative_tx": 157600000, "cumulative_volume_usd": 600000000,  "source": "Cryptonomist (119M Base + 38.6M Sol); ainvest ($600M)"},
-])
-CUMULATIVE_TX["date"] = pd.to_datetime(CUMULATIVE_TX["date"])
+]
 
 
 # =============================================================================
 # 3. CHAIN SPLIT DATA
 # =============================================================================
 
-CHAIN_DATA = pd.DataFrame([
+_CHAIN_DATA_ROWS = [
     # Base dominated early, Solana catching up
     {"date": "2025-10-26", "base_tx": 1400000,   "solana_tx": 46000,     "base_pct": 96.8, "solana_pct": 3.2,  "source": "PANews"},
     {"date": "2025-11-15", "base_tx": 38000000,  "solana_tx": 2000000,   "base_pct": 95.0, "solana_pct": 5.0,  "source": "est."},
@@ -73,8 +74,7 @@ CHAIN_DATA = pd.DataFrame([
     {"date": "2025-12-15", "base_tx": 85000000,  "solana_tx": 15000000,  "base_pct": 85.0, "solana_pct": 15.0, "source": "est."},
     {"date": "2026-01-11", "base_tx": 110000000, "solana_tx": 35000000,  "base_pct": 75.9, "solana_pct": 24.1, "source": "Cryptonomist"},
     {"date": "2026-01-15", "base_tx": 119000000, "solana_tx": 38600000,  "base_pct": 75.5, "solana_pct": 24.5, "source": "Cryptonomist"},
-])
-CHAIN_DATA["date"] = pd.to_datetime(CHAIN_DATA["date"])
+]
 
 # Daily chain split on Jan 11, 2026 (the day Solana flipped Base)
 CHAIN_DAILY_JAN11 = {
@@ -90,7 +90,7 @@ CHAIN_DAILY_JAN11 = {
 # 4. FACILITATOR MARKET SHARE DATA
 # =============================================================================
 
-FACILITATOR_SHARE = pd.DataFrame([
+_FACILITATOR_SHARE_ROWS = [
     # Early period: Coinbase dominant
     {"date": "2025-10-01", "coinbase": 70, "dexter": 5,    "payai": 15,  "daydreams": 5,  "others": 5,  "source": "est. from reports"},
     {"date": "2025-11-01", "coinbase": 60, "dexter": 10,   "payai": 18,  "daydreams": 7,  "others": 5,  "source": "est."},
@@ -98,29 +98,27 @@ FACILITATOR_SHARE = pd.DataFrame([
     {"date": "2025-12-10", "coinbase": 31, "dexter": 30.7, "payai": 20,  "daydreams": 13, "others": 5.3, "source": "ChainCatcher / Dune"},
     {"date": "2026-01-01", "coinbase": 28, "dexter": 45,   "payai": 15,  "daydreams": 7,  "others": 5,  "source": "est."},
     {"date": "2026-01-15", "coinbase": 25, "dexter": 50,   "payai": 13,  "daydreams": 7,  "others": 5,  "source": "est. (Dexter ~50% daily)"},
-])
-FACILITATOR_SHARE["date"] = pd.to_datetime(FACILITATOR_SHARE["date"])
+]
 
 # Facilitator cumulative stats
-FACILITATOR_CUMULATIVE = pd.DataFrame([
+_FACILITATOR_CUMULATIVE_ROWS = [
     {"name": "Coinbase CDP",  "cumulative_tx": 10000000, "cumulative_volume_usd": 1004000,  "fee_model": "$0.001/tx after 1K free/mo", "source": "PANews / Dune"},
     {"name": "Dexter",        "cumulative_tx": 10000000, "cumulative_volume_usd": None,      "fee_model": "Not disclosed", "source": "ecosystem reports"},
     {"name": "PayAI",         "cumulative_tx": 10000000, "cumulative_volume_usd": 219000,    "fee_model": "Gas-free; opt. 1% buyer fee", "source": "PANews / Dune"},
     {"name": "DayDreams",     "cumulative_tx": 10000000, "cumulative_volume_usd": None,      "fee_model": "Not disclosed", "source": "ecosystem reports"},
     {"name": "Stakefy",       "cumulative_tx": None,     "cumulative_volume_usd": None,      "fee_model": "0.5% per tx", "source": "Stakefy docs"},
     {"name": "Stake Capital", "cumulative_tx": None,     "cumulative_volume_usd": 2350000,   "fee_model": "Not disclosed", "source": "Stake Capital"},
-])
+]
 
 
 # =============================================================================
 # 5. USER METRICS
 # =============================================================================
 
-USER_METRICS = pd.DataFrame([
+_USER_METRICS_ROWS = [
     {"date": "2025-10-23", "buyers": 4000,  "sellers": 1078, "source": "PANews / Dune"},
     {"date": "2025-10-26", "buyers": 74000, "sellers": 1405, "source": "PANews / Dune (70K added in 3 days)"},
-])
-USER_METRICS["date"] = pd.to_datetime(USER_METRICS["date"])
+]
 
 # 90-day Dune dashboard snapshot (as of late Oct 2025)
 DUNE_90DAY = {
@@ -179,7 +177,7 @@ PAYMENT_METRICS = {
 # 8. VALUE CHAIN ECONOMICS (per $0.01 payment)
 # =============================================================================
 
-VALUE_CHAIN = pd.DataFrame([
+_VALUE_CHAIN_ROWS = [
     {"layer": "Application (seller)",    "amount_per_001": 0.0088, "pct_of_payment": 88.0, "margin_pct": "70-90%"},
     {"layer": "Facilitator",             "amount_per_001": 0.0010, "pct_of_payment": 10.0, "margin_pct": "50-75%"},
     {"layer": "Chain sequencer (Base)",  "amount_per_001": 0.0010, "pct_of_payment": 1.0,  "margin_pct": ">90%"},
@@ -187,21 +185,20 @@ VALUE_CHAIN = pd.DataFrame([
     {"layer": "Protocol (x402)",         "amount_per_001": 0.0000, "pct_of_payment": 0.0,  "margin_pct": "N/A"},
     {"layer": "RPC provider",            "amount_per_001": 0.0001, "pct_of_payment": 0.1,  "margin_pct": "60-70%"},
     {"layer": "USDC issuer (Circle)",    "amount_per_001": 0.0000, "pct_of_payment": 0.0,  "margin_pct": "~95% (float)"},
-])
+]
 
 
 # =============================================================================
 # 9. ECOSYSTEM TOKEN MARKET CAP (speculative / narrative-driven)
 # =============================================================================
 
-ECOSYSTEM_MCAP = pd.DataFrame([
+_ECOSYSTEM_MCAP_ROWS = [
     {"date": "2025-10-15", "mcap_usd": 100000000,   "source": "CoinGecko est."},
     {"date": "2025-10-26", "mcap_usd": 780000000,   "source": "CoinGecko"},
     {"date": "2025-11-05", "mcap_usd": 12000000000,  "source": "CoinGecko (1300% gain in ~2 weeks)"},
     {"date": "2025-12-01", "mcap_usd": 5000000000,   "source": "est. post-correction"},
     {"date": "2026-01-15", "mcap_usd": 10500000000,  "source": "CoinGecko"},
-])
-ECOSYSTEM_MCAP["date"] = pd.to_datetime(ECOSYSTEM_MCAP["date"])
+]
 
 
 # =============================================================================
@@ -216,10 +213,100 @@ FORECASTS = {
 }
 
 
+# =============================================================================
+# LAZY DATAFRAMES
+# =============================================================================
+# name -> (rows, date columns). Frames are built on first attribute access and
+# cached in the module namespace, so later lookups are plain dict hits.
+
+_LAZY_FRAMES = {
+    "DAILY_TX_MILESTONES": (_DAILY_TX_MILESTONES_ROWS, ("date",)),
+    "CUMULATIVE_TX": (_CUMULATIVE_TX_ROWS, ("date",)),
+    "CHAIN_DATA": (_CHAIN_DATA_ROWS, ("date",)),
+    "FACILITATOR_SHARE": (_FACILITATOR_SHARE_ROWS, ("date",)),
+    "FACILITATOR_CUMULATIVE": (_FACILITATOR_CUMULATIVE_ROWS, ()),
+    "USER_METRICS": (_USER_METRICS_ROWS, ("date",)),
+    "VALUE_CHAIN": (_VALUE_CHAIN_ROWS, ()),
+    "ECOSYSTEM_MCAP": (_ECOSYSTEM_MCAP_ROWS, ("date",)),
+}
+
+__all__ = [
+    *_LAZY_FRAMES,
+    "CHAIN_DAILY_JAN11",
+    "DUNE_90DAY",
+    "DEVELOPER_METRICS",
+    "PAYMENT_METRICS",
+    "FORECASTS",
+    "load_frame",
+]
+
+# Wall-clock budget for `import x402_data` in a fresh interpreter.
+IMPORT_BUDGET_MS = 25.0
+
+
+def load_frame(name: str):
+    """Return the named table as a DataFrame, building it on first use."""
+    module = sys.modules[__name__]
+    if name in vars(module):
+        return vars(module)[name]
+    rows, date_columns = _LAZY_FRAMES[name]
+
+    import pandas as pd
+
+    frame = pd.DataFrame(rows)
+    for col in date_columns:
+        frame[col] = pd.to_datetime(frame[col])
+    setattr(module, name, frame)
+    return frame
+
+
+def __getattr__(name: str):
+    if name in _LAZY_FRAMES:
+        return load_frame(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_FRAMES))
+
+
+def measure_import_ms(runs: int = 5) -> float:
+    """Best-of-N time to import this module in a fresh interpreter (no pandas)."""
+    import subprocess
+    from pathlib import Path
+
+    probe = (
+        "import sys, time; sys.path.insert(0, sys.argv[1]); "
+        "t = time.perf_counter(); import x402_data; dt = time.perf_counter() - t; "
+        "assert 'pandas' not in sys.modules, 'x402_data imported pandas eagerly'; "
+        "print(dt * 1000)"
+    )
+    data_dir = str(Path(__file__).resolve().parent)
+    timings = []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", probe, data_dir], capture_output=True, text=True, check=True
+        )
+        timings.append(float(out.stdout.strip()))
+    return min(timings)
+
+
 # =============================================================================
 # PRINT SUMMARY
 # =============================================================================
 if __name__ == "__main__":
+    if "--import-budget" in sys.argv[1:]:
+        elapsed = measure_import_ms()
+        status = "ok" if elapsed <= IMPORT_BUDGET_MS else "OVER BUDGET"
+        print(f"import x402_data: {elapsed:.2f} ms (budget {IMPORT_BUDGET_MS:.0f} ms) {status}")
+        sys.exit(0 if elapsed <= IMPORT_BUDGET_MS else 1)
+
+    DAILY_TX_MILESTONES = load_frame("DAILY_TX_MILESTONES")
+    CUMULATIVE_TX = load_frame("CUMULATIVE_TX")
+    CHAIN_DATA = load_frame("CHAIN_DATA")
+    FACILITATOR_SHARE = load_frame("FACILITATOR_SHARE")
+    VALUE_CHAIN = load_frame("VALUE_CHAIN")
+
     print("=" * 80)
     print("x402 PROTOCOL ADOPTION DATA SUMMARY")
     print("=" * 80)
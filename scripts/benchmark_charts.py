@@ -0,0 +1,319 @@
+"""
+Benchmark every registered chart generator and data builder.
+
+Each generator script (every script in scripts/chart_registry.py, which
+includes gen_x402_value_accrual.py) and each data module is measured in its
+own fresh interpreter, phase by phase:
+  - import_deps_s:   importing matplotlib / numpy / pandas,
+  - import_s:        importing the script itself (module-level work included;
+                     null for scripts registered to run whole, func=None),
+  - build_s:         zero-argument data builders (build_* functions that are
+                     not chart builders, plus listed data-module builders),
+  - render_s:        running the registered chart jobs minus time in savefig,
+  - savefig_s:       time inside Figure.savefig,
+  - peak_rss_mb:     peak resident set size of that interpreter.
+
+The children run in a temporary copy of the source files (what git tracks,
+without .git, .venv or .cache), so every file a generator writes - charts,
+data/*.csv, caches - lands in the copy, the committed outputs are never
+touched, and every run starts from cold caches.
+
+Results are written as JSON. With --baseline, any phase that is both
+--tolerance slower (relative) and --min-delta slower (absolute) than the
+baseline is reported as a regression and the run exits 1.
+
+Usage:
+    uv run python scripts/benchmark_charts.py
+    uv run python scripts/benchmark_charts.py "scripts/gen_x402_*" --repeat 3
+    uv run python scripts/benchmark_charts.py --baseline .cache/benchmarks/baseline.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import fnmatch
+import inspect
+import io
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from chart_registry import CHART_JOBS, FIGURE_SAVE_KWARGS, ROOT
+
+
+DEFAULT_OUTPUT = ROOT / ".cache" / "benchmarks" / "latest.json"
+PHASES = ("import_deps_s", "import_s", "build_s", "render_s", "savefig_s", "peak_rss_mb")
+DEFAULT_TOLERANCE = 0.25
+DEFAULT_MIN_DELTA = {"peak_rss_mb": 25.0}
+DEFAULT_MIN_DELTA_SECONDS = 0.10
+
+# Data modules have no chart jobs; these are the builders worth timing.
+DATA_MODULE_BUILDERS = {
+    "data/x402_data.py": [f"load_frame:{name}" for name in (
+        "DAILY_TX_MILESTONES", "CUMULATIVE_TX", "CHAIN_DATA", "FACILITATOR_SHARE",
+        "FACILITATOR_CUMULATIVE", "USER_METRICS", "VALUE_CHAIN", "ECOSYSTEM_MCAP",
+    )],
+    "data/fintech_funding_data.py": ["funding_matrix", "confidence_matrix", "get_funding_dataframe"],
+}
+
+
+def benchmark_targets() -> list[str]:
+    return list(dict.fromkeys(job.script for job in CHART_JOBS)) + list(DATA_MODULE_BUILDERS)
+
+
+def _data_builders(module) -> list[str]:
+    """Zero-argument build_* functions defined in the module, excluding chart builders."""
+    names = []
+    for name, obj in vars(module).items():
+        if not (name.startswith("build_") and inspect.isfunction(obj)):
+            continue
+        if obj.__module__ != module.__name__ or name.startswith("build_chart"):
+            continue
+        params = inspect.signature(obj).parameters.values()
+        if all(p.default is not inspect.Parameter.empty for p in params):
+            names.append(name)
+    return names
+
+
+def _peak_rss_mb() -> float | None:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def _measure(script: str) -> dict:
+    """Child-process body: time each phase of one script in this fresh interpreter."""
+    os.environ["MPLBACKEND"] = "Agg"
+    result: dict = {"script": script, "jobs": [], "builders": {}}
+    quiet = contextlib.redirect_stdout(io.StringIO())
+
+    start = time.perf_counter()
+    import matplotlib
+    import matplotlib.pyplot as plt
+    from matplotlib.figure import Figure
+    import numpy  # noqa: F401
+    import pandas  # noqa: F401
+
+    result["import_deps_s"] = time.perf_counter() - start
+
+    from chart_registry import load_script
+
+    savefig_time = [0.0]
+    original_savefig = Figure.savefig
+
+    def timed_savefig(self, fname, *args, **kwargs):
+        t = time.perf_counter()
+        try:
+            return original_savefig(self, fname, *args, **kwargs)
+        finally:
+            savefig_time[0] += time.perf_counter() - t
+
+    Figure.savefig = timed_savefig
+    jobs = [j for j in CHART_JOBS if j.script == script]
+    # Scripts that only run whole (func=None) draw at import; time them as render.
+    importable = not jobs or any(j.func for j in jobs)
+    module, rc = None, {}
+    if importable:
+        start = time.perf_counter()
+        with quiet:
+            module, rc = load_script(script)
+        result["import_s"] = time.perf_counter() - start
+
+    builders = DATA_MODULE_BUILDERS.get(script) or (_data_builders(module) if module else [])
+    start = time.perf_counter()
+    with quiet, matplotlib.rc_context(rc):
+        for spec in builders:
+            name, _, arg = spec.partition(":")
+            t = time.perf_counter()
+            getattr(module, name)(*([arg] if arg else []))
+            result["builders"][spec] = round(time.perf_counter() - t, 4)
+    result["build_s"] = time.perf_counter() - start
+
+    render_total = 0.0
+    try:
+        for job in jobs:
+            before = savefig_time[0]
+            t = time.perf_counter()
+            with quiet:
+                if job.func is None:
+                    import runpy
+
+                    matplotlib.rcdefaults()
+                    with matplotlib.rc_context():
+                        runpy.run_path(str(ROOT / script), run_name="__main__")
+                else:
+                    with matplotlib.rc_context(rc):
+                        figure = getattr(module, job.func)()
+                        if job.returns_figure:
+                            figure.savefig(job.outputs[0], **FIGURE_SAVE_KWARGS)
+            plt.close("all")
+            elapsed = time.perf_counter() - t
+            saving = savefig_time[0] - before
+            render_total += elapsed - saving
+            result["jobs"].append(
+                {"job": job.name, "render_s": round(elapsed - saving, 4), "savefig_s": round(saving, 4)}
+            )
+    finally:
+        Figure.savefig = original_savefig
+
+    result["render_s"] = render_total
+    result["savefig_s"] = savefig_time[0]
+    result.setdefault("import_s", None)
+    result["peak_rss_mb"] = _peak_rss_mb()
+    for key in PHASES:
+        if isinstance(result.get(key), float) and key != "peak_rss_mb":
+            result[key] = round(result[key], 4)
+    return result
+
+
+COPY_IGNORE = (".git", "__pycache__", ".venv", "venv", ".cache", "*.egg-info", ".*_cache")
+
+
+def copy_tree(dest: Path) -> Path:
+    """
+    Copy the source files of the working tree to dest/repo for the children to write into.
+
+    Only what git would track is copied (tracked files plus untracked, non-ignored
+    ones), so .venv, .cache (pickle caches, manifests, ingest state) and other
+    build output neither inflate the copy nor warm the cold-path timings.
+    """
+    repo = dest / "repo"
+    try:
+        listed = subprocess.run(
+            ["git", "ls-files", "-z", "--cached", "--others", "--exclude-standard"],
+            cwd=ROOT, capture_output=True, check=True,
+        ).stdout.decode("utf-8").split("\0")
+    except (OSError, subprocess.CalledProcessError):
+        return Path(shutil.copytree(ROOT, repo, ignore=shutil.ignore_patterns(*COPY_IGNORE)))
+    for rel in filter(None, listed):
+        src = ROOT / rel
+        if src.is_file():  # deleted but still tracked
+            (repo / rel).parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(src, repo / rel)
+    return repo
+
+
+def run_target(script: str, repeat: int, root: Path = ROOT) -> dict:
+    """Run the child measurement `repeat` times in the tree at root; keep the fastest value per phase."""
+    runs = []
+    for _ in range(repeat):
+        proc = subprocess.run(
+            [sys.executable, str(root / "scripts" / Path(__file__).name), "--child", script],
+            capture_output=True,
+            text=True,
+            cwd=root,
+        )
+        if proc.returncode != 0:
+            return {"script": script, "error": (proc.stderr or proc.stdout).strip()[-4000:]}
+        runs.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+    best = dict(runs[0])
+    for key in PHASES:
+        values = [r[key] for r in runs if r.get(key) is not None]
+        best[key] = min(values) if values else None
+    best["repeat"] = repeat
+    return best
+
+
+def compare(current: dict, baseline: dict, tolerance: float, min_delta_s: float) -> list[str]:
+    """Regressions of current vs baseline, as printable lines."""
+    base_by_script = {r["script"]: r for r in baseline.get("results", [])}
+    regressions = []
+    for r in current["results"]:
+        old = base_by_script.get(r["script"])
+        if old is None or "error" in r or "error" in old:
+            continue
+        for key in PHASES:
+            new_v, old_v = r.get(key), old.get(key)
+            if new_v is None or old_v is None:
+                continue
+            floor = DEFAULT_MIN_DELTA.get(key, min_delta_s)
+            if new_v > old_v * (1 + tolerance) and new_v - old_v > floor:
+                regressions.append(f"{r['script']}: {key} {old_v:.3f} -> {new_v:.3f} (+{(new_v / old_v - 1) * 100 if old_v else float('inf'):.0f}%)")
+    return regressions
+
+
+def print_table(report: dict) -> None:
+    header = f"{'script':<52}" + "".join(f"{k.replace('_s', '').replace('_mb', ''):>12}" for k in PHASES)
+    print(header)
+    print("-" * len(header))
+    for r in report["results"]:
+        if "error" in r:
+            print(f"{r['script']:<52} ERROR")
+            continue
+        cells = "".join(f"{r[k]:>12.3f}" if isinstance(r.get(k), (int, float)) else f"{'-':>12}" for k in PHASES)
+        print(f"{r['script']:<52}{cells}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("patterns", nargs="*", help="Glob(s) matched against repo-relative script paths")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per script; the fastest is kept")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="Where to write the JSON report")
+    parser.add_argument("--baseline", type=Path, help="Earlier JSON report to compare against")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="Allowed relative slowdown")
+    parser.add_argument("--min-delta", type=float, default=DEFAULT_MIN_DELTA_SECONDS, help="Ignore slowdowns below this many seconds")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(_measure(args.child)))
+        return 0
+
+    targets = [t for t in benchmark_targets() if not args.patterns or any(fnmatch.fnmatch(t, p) for p in args.patterns)]
+    if not targets:
+        print(f"No scripts match: {' '.join(args.patterns)}")
+        return 1
+
+    report = {
+        "created_utc": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "results": [],
+    }
+    with tempfile.TemporaryDirectory(prefix="chart-bench-") as tmp:
+        root = copy_tree(Path(tmp))
+        for script in targets:
+            print(f"benchmarking {script}...", flush=True)
+            report["results"].append(run_target(script, args.repeat, root))
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    print()
+    print_table(report)
+    print(f"\nSaved: {args.output}")
+
+    failed = [r["script"] for r in report["results"] if "error" in r]
+    for r in report["results"]:
+        if "error" in r:
+            print(f"\nERROR: {r['script']}\n{r['error']}")
+
+    if args.baseline:
+        if not args.baseline.exists():
+            print(f"No baseline at {args.baseline}; skipping comparison.")
+        else:
+            regressions = compare(report, json.loads(args.baseline.read_text(encoding="utf-8")), args.tolerance, args.min_delta)
+            if regressions:
+                print(f"\n{len(regressions)} regression(s) vs {args.baseline}:")
+                for line in regressions:
+                    print(f"  {line}")
+                return 1
+            print(f"\nNo regressions vs {args.baseline}.")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
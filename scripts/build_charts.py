@@ -0,0 +1,362 @@
+"""
+Build every registered chart/dataset generator in parallel.
+
+Jobs come from scripts/chart_registry.py and run on a process pool sized to
+the machine's core count. Each worker imports matplotlib/pandas once and
+reuses them for every job it picks up, so a full refresh pays the import cost
+per core rather than per script.
+
+Builds are incremental: .cache/chart_manifest.json records, per output file,
+the hashes of the source objects and input files its job depends on (see
+scripts/chart_fingerprint.py) plus the hash of the output itself. A job is
+skipped when none of those changed and its outputs are still on disk.
+
+--watch keeps one warm process (plotting stack imported, generator scripts
+loaded) and polls the repo's Python sources, data/ files and declared job
+inputs. On a change it recomputes fingerprints, reruns only the jobs whose
+dependencies changed (editing CHAIN_DATA rebuilds chart 3, editing
+data/category_company_map.csv rebuilds the category-company map) and
+records them in the manifest. Run a normal build first; watch mode only
+reacts to edits made while it runs.
+
+Usage:
+    uv run python scripts/build_charts.py                 # changed jobs only
+    uv run python scripts/build_charts.py "x402_*"        # subset by job name/output glob
+    uv run python scripts/build_charts.py --force         # ignore the manifest
+    uv run python scripts/build_charts.py --dry-run       # show what would rebuild and why
+    uv run python scripts/build_charts.py --record-only   # trust committed outputs, write manifest
+    uv run python scripts/build_charts.py --jobs 4
+    uv run python scripts/build_charts.py --list
+    uv run python scripts/build_charts.py --watch "fintech_*"
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from chart_fingerprint import file_sha256, job_dependencies
+from chart_registry import (
+    JOBS_BY_NAME,
+    ROOT,
+    ChartJob,
+    invalidate_changed_modules,
+    load_script,
+    run_job,
+    select_jobs,
+)
+
+
+MANIFEST_PATH = ROOT / ".cache" / "chart_manifest.json"
+MANIFEST_VERSION = 1
+
+WATCH_GLOBS = ("*.py", "scripts/*.py", "data/*.py", "data/*.csv")
+DEFAULT_WATCH_INTERVAL = 0.5
+
+
+# =============================================================================
+# Build manifest
+# =============================================================================
+
+def load_manifest(path: Path) -> dict:
+    if not path.exists():
+        return {"version": MANIFEST_VERSION, "outputs": {}}
+    manifest = json.loads(path.read_text(encoding="utf-8"))
+    if manifest.get("version") != MANIFEST_VERSION:
+        return {"version": MANIFEST_VERSION, "outputs": {}}
+    return manifest
+
+
+def save_manifest(manifest: dict, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    tmp.replace(path)
+
+
+def stale_reasons(job: ChartJob, deps: dict[str, str], manifest: dict) -> list[str]:
+    """Why a job must rebuild; empty when every output is current."""
+    reasons: list[str] = []
+    for rel in job.outputs:
+        entry = manifest["outputs"].get(rel)
+        out = ROOT / rel
+        if entry is None:
+            reasons.append(f"{rel}: not in manifest")
+        elif not out.exists():
+            reasons.append(f"{rel}: missing on disk")
+        elif entry.get("sha256") != file_sha256(out):
+            reasons.append(f"{rel}: modified outside the build")
+        else:
+            recorded = entry.get("dependencies", {})
+            changed = sorted(
+                k for k in recorded.keys() | deps.keys() if recorded.get(k) != deps.get(k)
+            )
+            reasons.extend(f"{rel}: {k} changed" for k in changed)
+    return reasons
+
+
+def record_outputs(job: ChartJob, deps: dict[str, str], manifest: dict) -> None:
+    for rel in job.outputs:
+        out = ROOT / rel
+        if out.exists():
+            manifest["outputs"][rel] = {
+                "job": job.name,
+                "dependencies": deps,
+                "sha256": file_sha256(out),
+            }
+
+
+def _worker_init() -> None:
+    os.environ.setdefault("MPLBACKEND", "Agg")
+
+
+def _run_in_worker(name: str) -> tuple[str, float, str, str | None]:
+    """Pool entry point: run one job by name, never raise."""
+    job = JOBS_BY_NAME[name]
+    start = time.perf_counter()
+    try:
+        elapsed, log = run_job(job)
+        return name, elapsed, log, None
+    except Exception:
+        return name, time.perf_counter() - start, "", traceback.format_exc()
+
+
+def build(
+    jobs: list[ChartJob],
+    workers: int,
+    verbose: bool = False,
+    manifest: dict | None = None,
+    deps_by_job: dict[str, dict[str, str]] | None = None,
+    on_job_done=None,
+) -> int:
+    """Run jobs on a process pool and print a per-job timing report."""
+    os.environ.setdefault("MPLBACKEND", "Agg")
+    if not jobs:
+        print("Nothing to build.")
+        return 0
+    timings: dict[str, float] = {}
+    failures: dict[str, str] = {}
+
+    print(f"Building {len(jobs)} job(s) on {workers} worker(s)...")
+    wall_start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_worker_init) as pool:
+        futures = [pool.submit(_run_in_worker, job.name) for job in jobs]
+        for future in as_completed(futures):
+            name, elapsed, log, error = future.result()
+            timings[name] = elapsed
+            status = "FAIL" if error else "ok"
+            print(f"  [{status:>4}] {name:<45} {elapsed:7.2f}s")
+            if verbose and log:
+                print(log.rstrip())
+            if error:
+                failures[name] = error
+            elif manifest is not None and deps_by_job is not None:
+                record_outputs(JOBS_BY_NAME[name], deps_by_job[name], manifest)
+                if on_job_done is not None:
+                    on_job_done()
+    wall = time.perf_counter() - wall_start
+
+    serial = sum(timings.values())
+    print()
+    print(f"{'job':<45} {'seconds':>8}  outputs")
+    print("-" * 80)
+    for name, elapsed in sorted(timings.items(), key=lambda kv: kv[1], reverse=True):
+        print(f"{name:<45} {elapsed:8.2f}  {len(JOBS_BY_NAME[name].outputs)}")
+    print("-" * 80)
+    print(f"wall={wall:.2f}s  sum(job)={serial:.2f}s  speedup={serial / wall if wall else 0:.1f}x")
+
+    for name, error in failures.items():
+        print(f"\nFAIL: {name}\n{error}")
+    return 1 if failures else 0
+
+
+# =============================================================================
+# Watch mode
+# =============================================================================
+
+def _watched_files(jobs: list[ChartJob]) -> set[Path]:
+    files = {path for pattern in WATCH_GLOBS for path in ROOT.glob(pattern)}
+    files.update(ROOT / rel for job in jobs for rel in job.inputs)
+    return files
+
+
+def _snapshot(files: set[Path]) -> dict[Path, tuple[int, int] | None]:
+    stamps: dict[Path, tuple[int, int] | None] = {}
+    for path in files:
+        try:
+            st = path.stat()
+            stamps[path] = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            stamps[path] = None
+    return stamps
+
+
+def rebuild_in_process(
+    jobs: list[ChartJob],
+    deps_by_job: dict[str, dict[str, str]],
+    manifest_path: Path,
+    verbose: bool = False,
+) -> list[str]:
+    """Run jobs serially in this (warm) process and record them; returns failed job names."""
+    reloaded = invalidate_changed_modules()
+    if reloaded:
+        print(f"  reloaded: {', '.join(reloaded)}")
+    manifest = load_manifest(manifest_path)
+    failed: list[str] = []
+    for job in jobs:
+        try:
+            elapsed, log = run_job(job)
+        except Exception:
+            failed.append(job.name)
+            print(f"  [FAIL] {job.name}\n{traceback.format_exc()}")
+            continue
+        record_outputs(job, deps_by_job[job.name], manifest)
+        print(f"  [  ok] {job.name:<45} {elapsed:7.2f}s")
+        if verbose and log:
+            print(log.rstrip())
+    save_manifest(manifest, manifest_path)
+    return failed
+
+
+def watch(
+    jobs: list[ChartJob],
+    interval: float = DEFAULT_WATCH_INTERVAL,
+    manifest_path: Path = MANIFEST_PATH,
+    verbose: bool = False,
+) -> int:
+    """
+    Poll for source/input changes and re-render affected jobs until interrupted.
+    Outputs written into watched folders (data/*.csv) show up on the next poll,
+    so jobs that read them rebuild in turn.
+    """
+    os.environ.setdefault("MPLBACKEND", "Agg")
+    import matplotlib.pyplot  # noqa: F401  (warm the plotting stack once)
+
+    for script in dict.fromkeys(job.script for job in jobs if job.func):
+        try:
+            load_script(script)
+        except Exception as exc:
+            print(f"warning: could not preload {script}: {exc}")
+
+    deps_by_job = {job.name: job_dependencies(job) for job in jobs}
+    snapshot = _snapshot(_watched_files(jobs))
+    print(f"Watching {len(snapshot)} file(s) for {len(jobs)} job(s) every {interval:g}s; Ctrl-C to stop.")
+    try:
+        while True:
+            time.sleep(interval)
+            current = _snapshot(_watched_files(jobs))
+            if current == snapshot:
+                continue
+            # Debounce: editors and cp write in several steps; act once stats settle.
+            while True:
+                time.sleep(interval)
+                settled = _snapshot(_watched_files(jobs))
+                if settled == current:
+                    break
+                current = settled
+            changed = sorted(
+                path.relative_to(ROOT).as_posix()
+                for path in current.keys() | snapshot.keys()
+                if current.get(path) != snapshot.get(path)
+            )
+            snapshot = current
+            try:
+                new_deps = {job.name: job_dependencies(job) for job in jobs}
+            except SyntaxError as exc:
+                print(f"{exc.filename}:{exc.lineno}: {exc.msg}; waiting for the next save")
+                continue
+
+            affected = [job for job in jobs if new_deps[job.name] != deps_by_job.get(job.name)]
+            print(f"changed: {', '.join(changed)} -> {len(affected)} job(s)")
+            if not affected:
+                deps_by_job = new_deps
+                continue
+            start = time.perf_counter()
+            failed = rebuild_in_process(affected, new_deps, manifest_path, verbose)
+            deps_by_job = new_deps
+            for name in failed:
+                deps_by_job.pop(name)  # retry on the next change
+            print(f"  rebuilt {len(affected) - len(failed)}/{len(affected)} in {time.perf_counter() - start:.2f}s")
+    except KeyboardInterrupt:
+        return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("patterns", nargs="*", help="Glob(s) matched against job names and output paths")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1, help="Worker processes")
+    parser.add_argument("--list", action="store_true", help="List matching jobs and exit")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Echo generator stdout")
+    parser.add_argument("--force", action="store_true", help="Rebuild even if the manifest says up to date")
+    parser.add_argument("--dry-run", action="store_true", help="Print stale jobs and reasons, build nothing")
+    parser.add_argument("--manifest", type=Path, default=MANIFEST_PATH, help="Build manifest path")
+    parser.add_argument(
+        "--record-only",
+        action="store_true",
+        help="Record existing outputs as built from the current sources without rendering",
+    )
+    parser.add_argument("--watch", action="store_true", help="Rebuild affected jobs whenever their sources change")
+    parser.add_argument(
+        "--interval", type=float, default=DEFAULT_WATCH_INTERVAL, help="Watch polling interval in seconds"
+    )
+    args = parser.parse_args()
+
+    jobs = select_jobs(args.patterns)
+    if not jobs:
+        print(f"No jobs match: {' '.join(args.patterns)}")
+        return 1
+
+    if args.list:
+        for job in jobs:
+            target = f"{job.script}:{job.func}" if job.func else job.script
+            print(f"{job.name:<45} {target}")
+            for out in job.outputs:
+                print(f"{'':<47}-> {out}")
+        return 0
+
+    if args.watch:
+        return watch(jobs, args.interval, args.manifest, args.verbose)
+
+    manifest = load_manifest(args.manifest)
+    deps_by_job = {job.name: job_dependencies(job) for job in jobs}
+    stale: list[ChartJob] = []
+    for job in jobs:
+        reasons = ["--force"] if args.force else stale_reasons(job, deps_by_job[job.name], manifest)
+        if reasons:
+            stale.append(job)
+            if args.dry_run or args.verbose:
+                print(f"{job.name}: rebuild")
+                for reason in reasons[:5]:
+                    print(f"    {reason}")
+                if len(reasons) > 5:
+                    print(f"    ... {len(reasons) - 5} more")
+    print(f"{len(stale)} of {len(jobs)} job(s) out of date.")
+    if args.dry_run:
+        return 0
+    if args.record_only:
+        for job in stale:
+            record_outputs(job, deps_by_job[job.name], manifest)
+        save_manifest(manifest, args.manifest)
+        print(f"Recorded {len(stale)} job(s) in {args.manifest}")
+        return 0
+
+    return build(
+        stale,
+        workers=max(1, min(args.jobs, len(stale))),
+        verbose=args.verbose,
+        manifest=manifest,
+        deps_by_job=deps_by_job,
+        on_job_done=lambda: save_manifest(manifest, args.manifest),
+    )
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,264 @@
+"""
+Static content fingerprints for registered chart jobs.
+
+A job's dependencies are the source it can actually reach: the generator
+function, the module-level helpers/constants it references (transitively),
+module-level setup statements such as plt.style.use(), and the named objects
+it imports from local modules such as data/x402_data.py. Each dependency is
+hashed from ast.unparse() of its defining statements, so comment-only or
+formatting-only edits do not count as changes. Non-Python inputs declared on
+the job (CSVs) are hashed by file content.
+
+Editing CHAIN_DATA in data/x402_data.py therefore changes the fingerprint of
+chart 3 only, not of every script that imports x402_data. A whole-module
+`import x402_data` reaches only the attributes read off it (x402_data.X); the
+whole module only where the module object itself is passed on. Names served
+by a module-level __getattr__ are resolved through the module's registry dict
+(e.g. x402_data._LAZY_FRAMES) to the row lists they are built from.
+"""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+
+from chart_registry import ROOT, ChartJob
+
+
+MODULE_SETUP = "<module>"
+
+
+def file_sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _is_main_guard(stmt: ast.stmt) -> bool:
+    return (
+        isinstance(stmt, ast.If)
+        and isinstance(stmt.test, ast.Compare)
+        and isinstance(stmt.test.left, ast.Name)
+        and stmt.test.left.id == "__name__"
+    )
+
+
+def _bound_names(stmt: ast.stmt) -> list[str]:
+    """Top-level names a statement defines or mutates (X = ..., X["c"] = ...)."""
+    if isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+        return [stmt.name]
+    if isinstance(stmt, ast.Import):
+        return [(a.asname or a.name).split(".")[0] for a in stmt.names]
+    if isinstance(stmt, ast.ImportFrom):
+        return [a.asname or a.name for a in stmt.names if a.name != "*"]
+
+    targets: list[ast.expr] = []
+    if isinstance(stmt, ast.Assign):
+        targets = list(stmt.targets)
+    elif isinstance(stmt, (ast.AnnAssign, ast.AugAssign)):
+        targets = [stmt.target]
+
+    names = []
+    while targets:
+        t = targets.pop()
+        if isinstance(t, (ast.Tuple, ast.List)):
+            targets.extend(t.elts)
+        elif isinstance(t, ast.Starred):
+            targets.append(t.value)
+        else:
+            while isinstance(t, (ast.Subscript, ast.Attribute)):
+                t = t.value
+            if isinstance(t, ast.Name):
+                names.append(t.id)
+    return names
+
+
+def _used_names(node: ast.AST) -> set[str]:
+    return {n.id for n in ast.walk(node) if isinstance(n, ast.Name)}
+
+
+def _attribute_uses(node: ast.AST, name: str) -> set[str] | None:
+    """Attributes read off `name` (x402_data.CHAIN_DATA -> CHAIN_DATA); None if it is also used bare."""
+    attrs = {
+        n.attr for n in ast.walk(node)
+        if isinstance(n, ast.Attribute) and isinstance(n.value, ast.Name) and n.value.id == name
+    }
+    uses = sum(1 for n in ast.walk(node) if isinstance(n, ast.Name) and n.id == name)
+    accesses = sum(
+        1 for n in ast.walk(node)
+        if isinstance(n, ast.Attribute) and isinstance(n.value, ast.Name) and n.value.id == name
+    )
+    return attrs if uses == accesses else None
+
+
+@dataclass
+class ModuleIndex:
+    path: Path
+    bindings: dict[str, list[ast.stmt]] = field(default_factory=dict)
+    setup: list[ast.stmt] = field(default_factory=list)
+    body: list[ast.stmt] = field(default_factory=list)
+
+
+@lru_cache(maxsize=None)
+def _index_cached(path: Path, mtime_ns: int, size: int) -> ModuleIndex:
+    tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    index = ModuleIndex(path)
+    for i, stmt in enumerate(tree.body):
+        if _is_main_guard(stmt):
+            continue
+        if i == 0 and isinstance(stmt, ast.Expr) and isinstance(stmt.value, ast.Constant):
+            continue  # module docstring
+        index.body.append(stmt)
+        names = _bound_names(stmt)
+        if names:
+            for name in names:
+                index.bindings.setdefault(name, []).append(stmt)
+        else:
+            index.setup.append(stmt)
+    return index
+
+
+def index_module(path: Path) -> ModuleIndex:
+    st = path.stat()
+    return _index_cached(path, st.st_mtime_ns, st.st_size)
+
+
+def resolve_local_module(module: str, importer: Path) -> Path | None:
+    """Map an import name to a repo source file, mirroring the scripts' sys.path setup."""
+    rel = Path(*module.split("."))
+    for base in (importer.parent, ROOT / "data", ROOT / "scripts", ROOT):
+        candidate = (base / rel).with_suffix(".py")
+        if candidate.exists():
+            return candidate
+    return None
+
+
+def _lazy_entry(index: ModuleIndex, name: str) -> tuple[str, ast.expr] | None:
+    """(registry name, registry value) for a name a module serves via __getattr__."""
+    if "__getattr__" not in index.bindings:
+        return None
+    for stmt in index.body:
+        if isinstance(stmt, ast.Assign) and isinstance(stmt.value, ast.Dict):
+            for key, value in zip(stmt.value.keys, stmt.value.values):
+                if isinstance(key, ast.Constant) and key.value == name:
+                    return _bound_names(stmt)[0], value
+    return None
+
+
+def _module_import(index: ModuleIndex, name: str) -> Path | None:
+    """The local module `name` is bound to by a plain `import` in this module, if any."""
+    for stmt in index.bindings.get(name, []):
+        if isinstance(stmt, ast.Import):
+            for alias in stmt.names:
+                if (alias.asname or alias.name.split(".")[0]) == name:
+                    return resolve_local_module(alias.name, index.path)
+    return None
+
+
+def _label(path: Path, name: str) -> str:
+    return f"{path.relative_to(ROOT).as_posix()}:{name}"
+
+
+def trace_sources(path: Path, roots: list[str] | None) -> dict[str, list[ast.stmt]]:
+    """
+    Collect the statements reachable from `roots` in `path`, following imports
+    into local modules. roots=None means the whole module body (script jobs).
+    Returns {"<file>:<name>": [stmts]}.
+    """
+    found: dict[str, list[ast.stmt]] = {}
+    seen: set[tuple[Path, str]] = set()
+    queue: list[tuple[Path, str | None]] = []
+
+    def queue_uses(mod_path: Path, stmt: ast.stmt) -> None:
+        # `import x402_data` then `x402_data.CHAIN_DATA` reaches CHAIN_DATA only;
+        # passing the module object around reaches all of it.
+        index = index_module(mod_path)
+        for n in _used_names(stmt):
+            queue.append((mod_path, n))
+            target = _module_import(index, n)
+            if target is not None:
+                attrs = _attribute_uses(stmt, n)
+                queue.extend((target, a) for a in (index_module(target).bindings if attrs is None else attrs))
+
+    def visit_module(mod_path: Path) -> None:
+        if (mod_path, MODULE_SETUP) in seen:
+            return
+        seen.add((mod_path, MODULE_SETUP))
+        index = index_module(mod_path)
+        if index.setup:
+            found[_label(mod_path, MODULE_SETUP)] = list(index.setup)
+            for stmt in index.setup:
+                queue_uses(mod_path, stmt)
+
+    visit_module(path)
+    if roots is None:
+        index = index_module(path)
+        queue.extend((path, n) for n in index.bindings)
+    else:
+        queue.extend((path, r) for r in roots)
+
+    while queue:
+        mod_path, name = queue.pop()
+        if (mod_path, name) in seen:
+            continue
+        seen.add((mod_path, name))
+        index = index_module(mod_path)
+        stmts = index.bindings.get(name)
+        if not stmts:
+            lazy = _lazy_entry(index, name)
+            if lazy is None:
+                continue  # builtin or third-party attribute
+            # Hash this registry entry plus the rows it names, then the loader;
+            # the registry dict as a whole would drag in every other table.
+            registry, entry = lazy
+            found[_label(mod_path, name)] = [entry] + [
+                s for n in sorted(_used_names(entry)) for s in index.bindings.get(n, [])
+            ]
+            seen.add((mod_path, registry))
+            queue.append((mod_path, "__getattr__"))
+            continue
+        found[_label(mod_path, name)] = stmts
+        for stmt in stmts:
+            if isinstance(stmt, ast.ImportFrom) and stmt.level == 0 and stmt.module:
+                target = resolve_local_module(stmt.module, mod_path)
+                if target is not None:
+                    visit_module(target)
+                    queue.extend(
+                        (target, a.name) for a in stmt.names if (a.asname or a.name) == name
+                    )
+                continue
+            if isinstance(stmt, ast.Import):
+                for alias in stmt.names:
+                    target = resolve_local_module(alias.name, mod_path)
+                    if target is not None and (alias.asname or alias.name.split(".")[0]) == name:
+                        visit_module(target)  # names are queued where the module is used
+                continue
+            queue_uses(mod_path, stmt)
+
+        # Star imports make every name of the source module reachable.
+        for stmt in index.body:
+            if isinstance(stmt, ast.ImportFrom) and any(a.name == "*" for a in stmt.names):
+                target = resolve_local_module(stmt.module or "", mod_path)
+                if target is not None and (target, "*") not in seen:
+                    seen.add((target, "*"))
+                    visit_module(target)
+                    queue.extend((target, n) for n in index_module(target).bindings)
+    return found
+
+
+def job_dependencies(job: ChartJob) -> dict[str, str]:
+    """Return {dependency label: sha256} for every source object and input file of a job."""
+    roots = None if job.func is None else [job.func]
+    deps: dict[str, str] = {}
+    for label, stmts in trace_sources(ROOT / job.script, roots).items():
+        src = "\n".join(ast.unparse(s) for s in sorted(stmts, key=lambda s: s.lineno))
+        deps[label] = hashlib.sha256(src.encode("utf-8")).hexdigest()
+    for rel in job.inputs:
+        path = ROOT / rel
+        deps[rel] = file_sha256(path) if path.exists() else "missing"
+    return dict(sorted(deps.items()))
@@ -0,0 +1,93 @@
+"""
+Shared drawing primitives for the chart generators.
+
+gradient_area() fills the area under a curve with a colour whose alpha varies
+with height *relative to the curve* (0 at the baseline, 1 on the curve), the
+look chart 6 used to get from 40 stacked fill_between bands. Instead of one
+polygon per band it draws a single image:
+
+  - the colour/alpha ramp is a tiny RGBA lookup table (one row per band),
+    built once per (colour, alphas) and shared by every chart that uses it,
+  - each image pixel picks its band from y / curve(x), vectorised over a grid
+    sized to the axes' pixel box, so the image maps ~1:1 onto output pixels,
+  - the image is clipped to the area-under-curve polygon.
+
+One image instead of dozens of antialiased polygons renders faster, has no
+hairline seams between bands, and compresses better in PNG.
+
+Usage:
+    from chart_primitives import gradient_area
+    gradient_area(ax, x_num, y, "#7c3aed", alphas=np.linspace(0.03, 0.42, 40))
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+import numpy as np
+from matplotlib.colors import to_rgb
+from matplotlib.patches import Polygon
+
+
+@lru_cache(maxsize=64)
+def gradient_texture(color: str, alphas: tuple[float, ...]) -> np.ndarray:
+    """RGBA lookup table, bottom band first, plus a transparent row for pixels above the curve."""
+    table = np.zeros((len(alphas) + 1, 4))
+    table[:-1, :3] = to_rgb(color)
+    table[:-1, 3] = alphas
+    table.setflags(write=False)
+    return table
+
+
+def gradient_area(ax, x, y, color: str, alphas, zorder: float = 1, resolution: tuple[int, int] | None = None):
+    """
+    Fill between 0 and y(x) with `color`, band i of len(alphas) equal-height
+    bands (as fractions of y at each x) drawn at alpha alphas[i].
+
+    x must be numeric (e.g. mdates.date2num for dates). resolution is the image
+    (columns, rows); by default the axes' size in pixels. Returns the image.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    table = gradient_texture(color, tuple(float(a) for a in alphas))
+    bands = len(table) - 1
+
+    if resolution is None:
+        bbox = ax.get_window_extent()
+        resolution = (max(int(bbox.width), 2), max(int(bbox.height), 2))
+    cols, rows = resolution
+    # Pad the image by a pixel on each side; the clip path sets the exact edge,
+    # so image-to-pixel snapping cannot leave a gap along the boundary.
+    dx = (x.max() - x.min()) / cols
+    dy = y.max() / rows
+    x0, x1, top = x.min() - dx, x.max() + dx, y.max() + dy
+
+    # Curve height at each pixel column, and each pixel row's height as a fraction of it.
+    xc = x0 + (np.arange(cols + 2) + 0.5) * (x1 - x0) / (cols + 2)
+    yc = (np.arange(rows + 1) + 0.5) * top / (rows + 1)
+    height = np.interp(xc, x, y)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        frac = yc[:, None] / height[None, :]
+    band = np.where(np.isfinite(frac), np.floor(frac * bands), bands)
+    image = table[np.clip(band, 0, bands).astype(np.intp)]
+
+    data_lim = ax.dataLim.frozen()
+    im = ax.imshow(
+        image,
+        origin="lower",
+        extent=(x0, x1, 0.0, top),
+        aspect="auto",
+        interpolation="nearest",
+        zorder=zorder,
+    )
+    # imshow pins the autoscale limits to the (padded) image; make the area
+    # count toward autoscaling exactly as a fill_between of it would.
+    im.sticky_edges.x[:] = []
+    im.sticky_edges.y[:] = []
+    ax.dataLim.set(data_lim)
+    ax.update_datalim([(x.min(), 0.0), (x.max(), y.max())])
+
+    outline = np.column_stack([np.r_[x[0], x, x[-1]], np.r_[0.0, y, 0.0]])
+    clip = Polygon(outline, closed=True, transform=ax.transData, facecolor="none", edgecolor="none")
+    im.set_clip_path(clip)
+    return im
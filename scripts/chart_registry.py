@@ -0,0 +1,338 @@
+"""
+Registry of every chart/dataset generator in this repo.
+
+Each ChartJob names one schedulable unit of work: a function in a generator
+script (or, for scripts without callable entry points, the script itself)
+plus the repo-relative files it writes. Build tooling imports this module to
+discover jobs instead of invoking the generator scripts one by one.
+
+Usage:
+    from chart_registry import CHART_JOBS, run_job
+"""
+
+from __future__ import annotations
+
+import contextlib
+import fnmatch
+import importlib.util
+import io
+import runpy
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# savefig settings shared by the scripts whose chart functions return a Figure
+# and leave saving to their __main__ block.
+FIGURE_SAVE_KWARGS = {"dpi": 260, "bbox_inches": "tight", "facecolor": "white"}
+
+
+@dataclass(frozen=True)
+class ChartJob:
+    """One independently schedulable generator call."""
+
+    name: str
+    script: str
+    func: str | None
+    outputs: tuple[str, ...]
+    returns_figure: bool = False
+    # Non-Python files the job reads (Python sources are traced statically).
+    inputs: tuple[str, ...] = ()
+
+
+def _figure(name: str, script: str, func: str, output: str) -> ChartJob:
+    return ChartJob(name, script, func, (output,), returns_figure=True)
+
+
+CHART_JOBS: list[ChartJob] = [
+    # -- fintech ---------------------------------------------------------------
+    _figure("fintech_funding_by_category", "scripts/generate_charts.py", "chart1_stacked_bar",
+            "charts/fintech/fintech_funding_by_category.png"),
+    _figure("fintech_market_map", "scripts/generate_charts.py", "chart2_market_map",
+            "charts/fintech/fintech_market_map.png"),
+    _figure("fintech_funding_heatmap", "scripts/generate_charts.py", "chart3_heatmap",
+            "charts/fintech/fintech_funding_heatmap.png"),
+    _figure("fintech_funding_mix_percent_by_category", "scripts/generate_charts.py",
+            "chart4_stacked_percent_mix", "charts/fintech/fintech_funding_mix_percent_by_category.png"),
+    _figure("fintech_funding_vs_revenue", "scripts/generate_fintech_scatter.py", "generate_scatter",
+            "charts/fintech/fintech_funding_vs_revenue.png"),
+    _figure("fintech_funding_vs_revenue_by_cohort", "scripts/generate_fintech_scatter.py",
+            "generate_cohort_subplots", "charts/fintech/fintech_funding_vs_revenue_by_cohort.png"),
+    _figure("fintech_vc_vs_revenue_breakdown_2026", "scripts/generate_fintech_scatter.py",
+            "generate_latest_breakdown_chart", "charts/fintech/fintech_vc_vs_revenue_breakdown_2026.png"),
+    ChartJob(
+        "fintech_stage_pack",
+        "scripts/generate_fintech_stage_charts.py",
+        "main",
+        (
+            "charts/fintech/fintech_funding_by_stage_over_time.png",
+            "charts/fintech/fintech_category_maturity_heatmap_late_stage_share.png",
+            "charts/fintech/fintech_stage_mix_by_category_2025.png",
+            "data/fintech_funding_stage_year_category_estimated.csv",
+            "data/fintech_stage_breakdown_by_year_category_wide_estimated.csv",
+            "data/fintech_stage_totals_by_year_estimated.csv",
+            "data/fintech_category_maturity_late_stage_share_estimated.csv",
+        ),
+    ),
+    ChartJob(
+        "fintech_stage_uncertainty",
+        "scripts/generate_fintech_stage_uncertainty.py",
+        "export_bands",
+        ("data/fintech_stage_totals_by_year_uncertainty_estimated.csv",),
+    ),
+    ChartJob(
+        "fintech_category_company_map",
+        "scripts/generate_fintech_category_company_map.py",
+        "generate_chart",
+        ("charts/fintech/fintech_category_company_map.png",),
+        inputs=("data/category_company_map.csv",),
+    ),
+    ChartJob(
+        "fintech_cohort_outcome_pack",
+        "scripts/generate_fintech_cohort_outcome_split.py",
+        "main",
+        (
+            "charts/fintech/fintech_cohort_outcome_split_estimated.png",
+            "charts/fintech/fintech_cohort_type_group_mix_estimated.png",
+            "data/fintech_cohort_outcome_split_estimated.csv",
+            "data/fintech_cohort_outcome_driver_anchors.csv",
+            "data/fintech_cohort_company_type_classification.csv",
+            "data/fintech_cohort_type_group_mix_estimated.csv",
+        ),
+    ),
+    ChartJob(
+        "fintech_coverage_gap_pack",
+        "scripts/generate_fintech_coverage_gap_charts.py",
+        "main",
+        (
+            "charts/fintech/fintech_geographic_opportunity_dashboard.png",
+            "charts/fintech/fintech_failure_risk_kpi_dashboard.png",
+            "charts/fintech/fintech_value_creation_vs_destruction_cases.png",
+            "data/fintech_geographic_opportunity_metrics.csv",
+            "data/fintech_failure_risk_kpis.csv",
+            "data/fintech_value_creation_vs_destruction_cases.csv",
+        ),
+    ),
+    ChartJob(
+        "fintech_market_size_projection",
+        "scripts/generate_fintech_macro_charts.py",
+        "chart_market_size_projection",
+        ("charts/fintech/fintech_market_size_projection.png",),
+    ),
+    ChartJob(
+        "fintech_vc_vs_deals_trend",
+        "scripts/generate_fintech_macro_charts.py",
+        "chart_vc_vs_deals_trend",
+        ("charts/fintech/fintech_vc_vs_deals_trend.png",),
+    ),
+    # -- agent economy ---------------------------------------------------------
+    _figure("agent_economy_funding_vs_revenue", "scripts/generate_agent_scatter.py", "generate_scatter",
+            "charts/agent-economy/agent_economy_funding_vs_revenue.png"),
+    # -- intersection ----------------------------------------------------------
+    ChartJob(
+        "protocol_launch_timeline",
+        "scripts/generate_intersection_charts.py",
+        "chart_protocol_launch_timeline",
+        ("charts/intersection/01_protocol_launch_timeline.png",),
+    ),
+    ChartJob(
+        "protocol_capability_matrix",
+        "scripts/generate_intersection_charts.py",
+        "chart_protocol_capability_matrix",
+        ("charts/intersection/02_protocol_capability_matrix.png",),
+    ),
+    ChartJob(
+        "layer_funding_heatmap",
+        "scripts/generate_intersection_charts.py",
+        "chart_layer_funding_heatmap",
+        ("charts/intersection/03_layer_funding_heatmap.png",),
+    ),
+    ChartJob(
+        "agent_commerce_readiness_roadmap",
+        "scripts/generate_intersection_charts.py",
+        "chart_agent_commerce_readiness_roadmap",
+        ("charts/intersection/04_agent_commerce_readiness_roadmap.png",),
+    ),
+    ChartJob(
+        "startup_opportunity_scorecard",
+        "scripts/generate_agent_fintech_opportunity_matrix.py",
+        "main",
+        (
+            "data/agent_fintech_startup_opportunity_matrix.csv",
+            "charts/intersection/05_startup_opportunity_scorecard.png",
+        ),
+    ),
+    ChartJob(
+        "opportunity_weight_sweep",
+        "scripts/generate_opportunity_weight_sweep.py",
+        "export_rank_stability",
+        ("data/agent_fintech_opportunity_rank_stability.csv",),
+    ),
+    # -- x402 ------------------------------------------------------------------
+    # data/x402_daily_tx_reconstructed.csv is not an input: build_chart_1 rewrites it when the
+    # x402_data anchors change, and those anchors are already traced into the fingerprint.
+    ChartJob("x402_01_daily_tx_trajectory", "scripts/gen_x402_charts_1_2.py", "build_chart_1",
+             ("charts/x402/x402_01_daily_tx_trajectory.png",)),
+    ChartJob("x402_02_cumulative_growth", "scripts/gen_x402_charts_1_2.py", "build_chart_2",
+             ("charts/x402/x402_02_cumulative_growth.png",)),
+    ChartJob("x402_03_chain_split", "scripts/gen_x402_charts_3_4.py", "make_chart3",
+             ("charts/x402/x402_03_chain_split.png",)),
+    ChartJob("x402_04_facilitator_share", "scripts/gen_x402_charts_3_4.py", "make_chart4",
+             ("charts/x402/x402_04_facilitator_share.png",)),
+    ChartJob("x402_05_value_chain", "scripts/gen_x402_charts_5_6.py", "build_chart_5",
+             ("charts/x402/x402_05_value_chain.png",)),
+    ChartJob("x402_06_ecosystem_mcap", "scripts/gen_x402_charts_5_6.py", "build_chart_6",
+             ("charts/x402/x402_06_ecosystem_mcap.png",)),
+    ChartJob("x402_07_developer_adoption", "scripts/gen_x402_charts_7_8.py", "build_chart_7",
+             ("charts/x402/x402_07_developer_adoption.png",)),
+    ChartJob("x402_08_buyer_seller_ratio", "scripts/gen_x402_charts_7_8.py", "build_chart_8",
+             ("charts/x402/x402_08_buyer_seller_ratio.png",)),
+    ChartJob("x402_09_buyer_seller_ratio_deep", "gen_x402_value_accrual.py", "chart_buyer_seller_ratio",
+             ("charts/x402/x402_09_buyer_seller_ratio_deep.png",)),
+    ChartJob("x402_10_value_accrual_stack", "gen_x402_value_accrual.py", "chart_value_stack",
+             ("charts/x402/x402_10_value_accrual_stack.png",)),
+    ChartJob("x402_11_coinbase_flywheel", "gen_x402_value_accrual.py", "chart_coinbase_flywheel",
+             ("charts/x402/x402_11_coinbase_flywheel.png",)),
+    ChartJob("x402_12_layer_revenue_sensitivity", "scripts/generate_x402_sensitivity_charts.py",
+             "chart_layer_revenue_sensitivity", ("charts/x402/x402_12_layer_revenue_sensitivity.png",)),
+    ChartJob("x402_13_coinbase_revenue_scenarios", "scripts/generate_x402_sensitivity_charts.py",
+             "chart_coinbase_revenue_scenarios", ("charts/x402/x402_13_coinbase_revenue_scenarios.png",)),
+    ChartJob("x402_14_risk_matrix", "scripts/generate_x402_sensitivity_charts.py",
+             "chart_risk_matrix", ("charts/x402/x402_14_risk_matrix.png",)),
+]
+
+JOBS_BY_NAME = {job.name: job for job in CHART_JOBS}
+
+
+def select_jobs(patterns: list[str] | None = None) -> list[ChartJob]:
+    """Return jobs whose name or any output path matches a glob pattern."""
+    if not patterns:
+        return list(CHART_JOBS)
+    selected = []
+    for job in CHART_JOBS:
+        candidates = (job.name, job.script, *job.outputs, *(Path(o).stem for o in job.outputs))
+        if any(fnmatch.fnmatch(c, p) for p in patterns for c in candidates):
+            selected.append(job)
+    return selected
+
+
+# =============================================================================
+# In-process runner
+# =============================================================================
+# Several generator scripts call plt.style.use()/rcParams.update() at import
+# time, which would leak into unrelated charts rendered later in the same
+# process. Each script is therefore imported from matplotlib defaults and the
+# resulting rcParams are snapshotted and re-applied around every job.
+
+_LOADED: dict[str, tuple[ModuleType, dict]] = {}
+
+# Repo-local modules imported by generator scripts, with the (mtime_ns, size)
+# of their source when imported. Long-lived processes use this to notice edits.
+_REPO_MODULES: dict[str, tuple[Path, tuple[int, int] | None]] = {}
+
+
+def _ensure_import_paths(script_path: Path) -> None:
+    for p in (ROOT, ROOT / "data", script_path.parent):
+        if str(p) not in sys.path:
+            sys.path.insert(0, str(p))
+
+
+def _source_stamp(path: Path) -> tuple[int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _record_repo_modules(before: set[str]) -> None:
+    for name in set(sys.modules) - before:
+        file = getattr(sys.modules[name], "__file__", None)
+        if not file:
+            continue
+        path = Path(file).resolve()
+        if ROOT in path.parents and ".venv" not in path.parts:
+            _REPO_MODULES[name] = (path, _source_stamp(path))
+
+
+def load_script(script: str) -> tuple[ModuleType, dict]:
+    """Import a generator script once per process; return (module, rc snapshot)."""
+    cached = _LOADED.get(script)
+    if cached is not None:
+        return cached
+
+    import matplotlib
+
+    path = ROOT / script
+    _ensure_import_paths(path)
+    matplotlib.rcdefaults()
+    before = set(sys.modules)
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[path.stem] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        sys.modules.pop(path.stem, None)
+        raise
+    finally:
+        _record_repo_modules(before)
+
+    rc = dict(matplotlib.rcParams.copy())
+    rc.pop("backend", None)
+    loaded = (module, rc)
+    _LOADED[script] = loaded
+    return loaded
+
+
+def invalidate_changed_modules() -> list[str]:
+    """
+    Drop every loaded generator and repo-local module if any of their sources
+    changed on disk, so the next load_script() re-imports fresh code and data.
+    Scripts bind data objects at import (from x402_data import ...), so a data
+    module edit invalidates all scripts, not just the module. Returns the
+    repo-relative paths that changed.
+    """
+    changed = sorted(
+        path.relative_to(ROOT).as_posix()
+        for path, stamp in _REPO_MODULES.values()
+        if _source_stamp(path) != stamp
+    )
+    if changed:
+        for name in _REPO_MODULES:
+            sys.modules.pop(name, None)
+        _REPO_MODULES.clear()
+        _LOADED.clear()
+    return changed
+
+
+def run_job(job: ChartJob, quiet: bool = True) -> tuple[float, str]:
+    """Run one job in the current process; return (seconds, captured stdout)."""
+    import matplotlib
+    import matplotlib.pyplot as plt
+
+    log = io.StringIO()
+    redirect = contextlib.redirect_stdout(log) if quiet else contextlib.nullcontext()
+    start = time.perf_counter()
+    with redirect:
+        if job.func is None:
+            path = ROOT / job.script
+            _ensure_import_paths(path)
+            matplotlib.rcdefaults()
+            with matplotlib.rc_context():
+                runpy.run_path(str(path), run_name="__main__")
+        else:
+            module, rc = load_script(job.script)
+            with matplotlib.rc_context(rc):
+                result = getattr(module, job.func)()
+                if job.returns_figure:
+                    out = ROOT / job.outputs[0]
+                    out.parent.mkdir(parents=True, exist_ok=True)
+                    result.savefig(out, **FIGURE_SAVE_KWARGS)
+                    print(f"Saved: {out}")
+        plt.close("all")
+    return time.perf_counter() - start, log.getvalue()
@@ -6,6 +6,18 @@ Modes:
   - weekly: source-health + citation due dates + metadata schema checks
   - monthly: regulatory/rails tracker freshness checks
   - quarterly: TAM harmonization freshness checks
+  - all: every cadence above in one process; each governed file is read and
+    parsed once into a shared cache and the cadences run on a thread pool
+
+Parsed facts (headers, last verified / next refresh dates) are kept in
+.cache/governance/state.json with each file's mtime, size and hash, so a
+rerun only reads files that changed. --stale-within N lists everything the
+checks will start failing on within N days, answered from that index.
+
+Usage:
+  python scripts/check_governance_refresh.py --mode weekly
+  python scripts/check_governance_refresh.py --mode all --report .cache/governance/report.json
+  python scripts/check_governance_refresh.py --stale-within 14
 """
 
 from __future__ import annotations
@@ -13,9 +25,15 @@ from __future__ import annotations
 import argparse
 import csv
 import datetime as dt
+import hashlib
+import io
+import json
 import re
-import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Callable
 
 
 ROOT = Path(__file__).resolve().parent.parent
@@ -31,6 +49,44 @@ REQUIRED_METADATA_COLUMNS = {
     "status",
 }
 
+CITATION_MATRIX = "research/memo-citation-backfill-matrix.csv"
+X402_KPI = "data/x402_kpi_canonical.csv"
+X402_SLA_DAYS = 7
+GOVERNED_CSVS = [
+    "data/fintech_geographic_opportunity_metrics.csv",
+    "data/fintech_failure_risk_kpis.csv",
+    "data/fintech_value_creation_vs_destruction_cases.csv",
+    "data/fintech_funding_stage_year_category_estimated.csv",
+    "data/fintech_stage_breakdown_by_year_category_wide_estimated.csv",
+    "data/fintech_stage_totals_by_year_estimated.csv",
+    "data/fintech_category_maturity_late_stage_share_estimated.csv",
+    "data/fintech_stage_totals_by_year_uncertainty_estimated.csv",
+    "data/agent_fintech_opportunity_rank_stability.csv",
+]
+MILESTONE_TRACKER = "research/milestone-status-tracker.csv"
+MONTHLY_TRACKERS = [
+    ("research/regulatory-tracker-us-2026.md", 35),
+    ("research/rails-metrics-pack-2026Q1.md", 35),
+    ("research/public-private-kpi-refresh-2026Q1.md", 35),
+    ("research/source-registry.md", 35),
+]
+QUARTERLY_TRACKERS = [
+    ("research/market-size-harmonization-2026Q1.md", 95),
+    ("research/source-governance-policy.md", 120),
+]
+
+STATE_PATH = ROOT / ".cache" / "governance" / "state.json"
+STATE_VERSION = 1
+
+LAST_VERIFIED_PATTERNS = [
+    re.compile(pattern, flags=re.IGNORECASE)
+    for pattern in (
+        r"Last verified:\s*(\d{4}-\d{2}-\d{2})",
+        r"Last updated:\s*(\d{4}-\d{2}-\d{2})",
+        r"Effective date:\s*(\d{4}-\d{2}-\d{2})",
+    )
+]
+
 
 def parse_date(value: str) -> dt.date | None:
     value = (value or "").strip()
@@ -44,22 +100,9 @@ def parse_date(value: str) -> dt.date | None:
     return None
 
 
-def read_header(path: Path) -> set[str]:
-    with path.open("r", encoding="utf-8", newline="") as f:
-        reader = csv.reader(f)
-        row = next(reader, [])
-    return set(row)
-
-
-def extract_last_verified(path: Path) -> dt.date | None:
-    text = path.read_text(encoding="utf-8")
-    patterns = [
-        r"Last verified:\s*(\d{4}-\d{2}-\d{2})",
-        r"Last updated:\s*(\d{4}-\d{2}-\d{2})",
-        r"Effective date:\s*(\d{4}-\d{2}-\d{2})",
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, text, flags=re.IGNORECASE)
+def last_verified_from_text(text: str) -> dt.date | None:
+    for pattern in LAST_VERIFIED_PATTERNS:
+        match = pattern.search(text)
         if match:
             date_val = parse_date(match.group(1))
             if date_val:
@@ -67,92 +110,210 @@ def extract_last_verified(path: Path) -> dt.date | None:
     return None
 
 
-def check_weekly() -> tuple[list[str], list[str]]:
+def extract_facts(rel: str, data: bytes) -> dict:
+    """The parsed facts the checks need from one governed file.
+
+    CSV: header, newest last_verified_utc and every (claim_id, next_refresh_date).
+    Markdown: the last verified / updated / effective date.
+    """
+    text = data.decode("utf-8")
+    if not rel.endswith(".csv"):
+        d = last_verified_from_text(text)
+        return {"last_verified": d.isoformat() if d else None}
+
+    reader = csv.DictReader(io.StringIO(text, newline=""))
+    last_verified: list[dt.date] = []
+    next_refresh: list[list[str]] = []
+    for row in reader:
+        d = parse_date(row.get("last_verified_utc", ""))
+        if d:
+            last_verified.append(d)
+        due = parse_date(row.get("next_refresh_date", ""))
+        if due:
+            next_refresh.append([row.get("claim_id", "unknown"), due.isoformat()])
+    return {
+        "header": list(reader.fieldnames or []),
+        "max_last_verified_utc": max(last_verified).isoformat() if last_verified else None,
+        "next_refresh": next_refresh,
+    }
+
+
+class GovernanceState:
+    """Persistent index of governed files: mtime, size, sha256 and parsed facts.
+
+    A file whose mtime and size match its entry is not read at all; one whose
+    stat changed is hashed, and only reparsed when the hash changed too.
+    Entries recorded within MTIME_SLACK_NS of the file's mtime are not trusted
+    on stat alone (the file may have been written again in the same tick).
+    """
+
+    MTIME_SLACK_NS = 2_000_000_000
+
+    def __init__(self, path: Path | None = STATE_PATH):
+        self.path = path
+        self.files: dict[str, dict] = {}
+        self.reparsed: list[str] = []
+        self.dirty = False
+        self._lock = threading.Lock()
+        if path is not None and path.exists():
+            try:
+                state = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                state = {}
+            if state.get("version") == STATE_VERSION:
+                self.files = state.get("files", {})
+
+    def facts(self, rel: str, path: Path) -> dict:
+        st = path.stat()
+        with self._lock:
+            entry = self.files.get(rel)
+        if (
+            entry
+            and entry["mtime_ns"] == st.st_mtime_ns
+            and entry["size"] == st.st_size
+            and entry["recorded_ns"] - entry["mtime_ns"] > self.MTIME_SLACK_NS
+        ):
+            return entry["facts"]
+
+        data = path.read_bytes()
+        digest = hashlib.sha256(data).hexdigest()
+        if entry and entry["sha256"] == digest:
+            facts = entry["facts"]
+        else:
+            facts = extract_facts(rel, data)
+            with self._lock:
+                self.reparsed.append(rel)
+        with self._lock:
+            self.files[rel] = {
+                "mtime_ns": st.st_mtime_ns,
+                "size": st.st_size,
+                "sha256": digest,
+                "recorded_ns": time.time_ns(),
+                "facts": facts,
+            }
+            self.dirty = True
+        return facts
+
+    def discard(self, rel: str) -> None:
+        with self._lock:
+            if self.files.pop(rel, None) is not None:
+                self.dirty = True
+
+    def save(self) -> None:
+        if self.path is None or not self.dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        payload = {"version": STATE_VERSION, "files": dict(sorted(self.files.items()))}
+        tmp.write_text(json.dumps(payload, indent=1) + "\n", encoding="utf-8")
+        tmp.replace(self.path)
+        self.dirty = False
+
+
+class ParsedCache:
+    """Governed-file facts loaded at most once per process, shared across cadences.
+
+    Thread-safe: concurrent requests for the same file wait for one load.
+    Facts come from the persistent GovernanceState when the file is unchanged.
+    Missing files come back as None.
+    """
+
+    def __init__(self, root: Path = ROOT, state: GovernanceState | None = None):
+        self.root = root
+        self.state = state if state is not None else GovernanceState(None)
+        self._values: dict[tuple[str, str], object] = {}
+        self._locks: dict[tuple[str, str], threading.Lock] = {}
+        self._guard = threading.Lock()
+
+    def _get(self, kind: str, rel: str, loader: Callable[[Path], object]):
+        key = (kind, rel)
+        with self._guard:
+            if key in self._values:
+                return self._values[key]
+            lock = self._locks.setdefault(key, threading.Lock())
+        with lock:
+            if key not in self._values:
+                path = self.root / rel
+                self._values[key] = loader(path) if path.exists() else None
+            return self._values[key]
+
+    def facts(self, rel: str) -> dict | None:
+        facts = self._get("facts", rel, lambda path: self.state.facts(rel, path))
+        if facts is None:
+            self.state.discard(rel)
+        return facts
+
+    def header(self, rel: str) -> set[str] | None:
+        facts = self.facts(rel)
+        return set(facts["header"]) if facts is not None else None
+
+    def last_verified(self, rel: str) -> dt.date | None:
+        facts = self.facts(rel)
+        return parse_date(facts["last_verified"]) if facts else None
+
+
+def check_weekly(cache: ParsedCache | None = None) -> tuple[list[str], list[str]]:
+    cache = cache or ParsedCache()
     failures: list[str] = []
     warnings: list[str] = []
 
-    matrix_path = ROOT / "research" / "memo-citation-backfill-matrix.csv"
-    if not matrix_path.exists():
-        failures.append("Missing research/memo-citation-backfill-matrix.csv")
+    matrix = cache.facts(CITATION_MATRIX)
+    if matrix is None:
+        failures.append(f"Missing {CITATION_MATRIX}")
     else:
-        with matrix_path.open("r", encoding="utf-8", newline="") as f:
-            for row in csv.DictReader(f):
-                due = parse_date(row.get("next_refresh_date", ""))
-                claim_id = row.get("claim_id", "unknown")
-                if due and due <= TODAY:
-                    failures.append(
-                        f"Citation refresh overdue: {claim_id} (next_refresh_date={due.isoformat()})"
-                    )
-
-    x402_path = ROOT / "data" / "x402_kpi_canonical.csv"
-    if not x402_path.exists():
-        failures.append("Missing data/x402_kpi_canonical.csv")
+        for claim_id, due_iso in matrix["next_refresh"]:
+            due = dt.date.fromisoformat(due_iso)
+            if due <= TODAY:
+                failures.append(
+                    f"Citation refresh overdue: {claim_id} (next_refresh_date={due.isoformat()})"
+                )
+
+    x402 = cache.facts(X402_KPI)
+    if x402 is None:
+        failures.append(f"Missing {X402_KPI}")
     else:
-        last_dates: list[dt.date] = []
-        with x402_path.open("r", encoding="utf-8", newline="") as f:
-            for row in csv.DictReader(f):
-                d = parse_date(row.get("last_verified_utc", ""))
-                if d:
-                    last_dates.append(d)
-        if not last_dates:
+        if not x402["max_last_verified_utc"]:
             failures.append("x402 KPI canonical file has no parseable last_verified_utc values")
         else:
-            age_days = (TODAY - max(last_dates)).days
-            if age_days > 7:
+            age_days = (TODAY - dt.date.fromisoformat(x402["max_last_verified_utc"])).days
+            if age_days > X402_SLA_DAYS:
                 failures.append(
-                    f"x402 KPI canonical data is stale ({age_days} days old; SLA=7 days)"
+                    f"x402 KPI canonical data is stale ({age_days} days old; SLA={X402_SLA_DAYS} days)"
                 )
 
-    governed_csvs = [
-        "data/fintech_geographic_opportunity_metrics.csv",
-        "data/fintech_failure_risk_kpis.csv",
-        "data/fintech_value_creation_vs_destruction_cases.csv",
-        "data/fintech_funding_stage_year_category_estimated.csv",
-        "data/fintech_stage_breakdown_by_year_category_wide_estimated.csv",
-        "data/fintech_stage_totals_by_year_estimated.csv",
-        "data/fintech_category_maturity_late_stage_share_estimated.csv",
-    ]
-    for rel in governed_csvs:
-        path = ROOT / rel
-        if not path.exists():
+    for rel in GOVERNED_CSVS:
+        header = cache.header(rel)
+        if header is None:
             failures.append(f"Missing governed dataset: {rel}")
             continue
-        header = read_header(path)
         missing = sorted(REQUIRED_METADATA_COLUMNS - header)
         if missing:
             failures.append(f"{rel} missing metadata columns: {', '.join(missing)}")
 
-    tracker_path = ROOT / "research" / "milestone-status-tracker.csv"
-    if not tracker_path.exists():
-        failures.append("Missing research/milestone-status-tracker.csv")
+    header = cache.header(MILESTONE_TRACKER)
+    if header is None:
+        failures.append(f"Missing {MILESTONE_TRACKER}")
     else:
-        header = read_header(tracker_path)
         expected = {"milestone_id", "status", "target_window", "milestone"}
         missing = sorted(expected - header)
         if missing:
             failures.append(
-                f"research/milestone-status-tracker.csv missing columns: {', '.join(missing)}"
+                f"{MILESTONE_TRACKER} missing columns: {', '.join(missing)}"
             )
 
     return failures, warnings
 
 
-def check_monthly() -> tuple[list[str], list[str]]:
+def check_monthly(cache: ParsedCache | None = None) -> tuple[list[str], list[str]]:
+    cache = cache or ParsedCache()
     failures: list[str] = []
     warnings: list[str] = []
 
-    targets = [
-        ("research/regulatory-tracker-us-2026.md", 35),
-        ("research/rails-metrics-pack-2026Q1.md", 35),
-        ("research/public-private-kpi-refresh-2026Q1.md", 35),
-        ("research/source-registry.md", 35),
-    ]
-    for rel, max_age in targets:
-        path = ROOT / rel
-        if not path.exists():
+    for rel, max_age in MONTHLY_TRACKERS:
+        if cache.facts(rel) is None:
             failures.append(f"Missing monthly tracker: {rel}")
             continue
-        d = extract_last_verified(path)
+        d = cache.last_verified(rel)
         if not d:
             warnings.append(f"No parseable last verified date in {rel}")
             continue
@@ -163,20 +324,16 @@ def check_monthly() -> tuple[list[str], list[str]]:
     return failures, warnings
 
 
-def check_quarterly() -> tuple[list[str], list[str]]:
+def check_quarterly(cache: ParsedCache | None = None) -> tuple[list[str], list[str]]:
+    cache = cache or ParsedCache()
     failures: list[str] = []
     warnings: list[str] = []
 
-    targets = [
-        ("research/market-size-harmonization-2026Q1.md", 95),
-        ("research/source-governance-policy.md", 120),
-    ]
-    for rel, max_age in targets:
-        path = ROOT / rel
-        if not path.exists():
+    for rel, max_age in QUARTERLY_TRACKERS:
+        if cache.facts(rel) is None:
             failures.append(f"Missing quarterly tracker: {rel}")
             continue
-        d = extract_last_verified(path)
+        d = cache.last_verified(rel)
         if not d:
             warnings.append(f"No parseable date in {rel}")
             continue
@@ -187,33 +344,137 @@ def check_quarterly() -> tuple[list[str], list[str]]:
     return failures, warnings
 
 
+def upcoming_staleness(days: int, cache: ParsedCache | None = None) -> list[tuple[dt.date, str, str]]:
+    """(stale_on, cadence, item) for everything whose check fails on or before TODAY + days.
+
+    stale_on is the first date the corresponding cadence check reports it.
+    """
+    cache = cache or ParsedCache()
+    horizon = TODAY + dt.timedelta(days=days)
+    items: list[tuple[dt.date, str, str]] = []
+
+    matrix = cache.facts(CITATION_MATRIX)
+    if matrix is not None:
+        for claim_id, due_iso in matrix["next_refresh"]:
+            items.append((dt.date.fromisoformat(due_iso), "weekly", f"citation refresh {claim_id}"))
+    x402 = cache.facts(X402_KPI)
+    if x402 is not None and x402["max_last_verified_utc"]:
+        stale_on = dt.date.fromisoformat(x402["max_last_verified_utc"]) + dt.timedelta(days=X402_SLA_DAYS + 1)
+        items.append((stale_on, "weekly", f"{X402_KPI} (SLA={X402_SLA_DAYS} days)"))
+    for cadence, trackers in (("monthly", MONTHLY_TRACKERS), ("quarterly", QUARTERLY_TRACKERS)):
+        for rel, max_age in trackers:
+            d = cache.last_verified(rel)
+            if d:
+                items.append((d + dt.timedelta(days=max_age + 1), cadence, f"{rel} (SLA={max_age} days)"))
+
+    return sorted(item for item in items if item[0] <= horizon)
+
+
+CHECKS: dict[str, Callable[[ParsedCache | None], tuple[list[str], list[str]]]] = {
+    "weekly": check_weekly,
+    "monthly": check_monthly,
+    "quarterly": check_quarterly,
+}
+
+
+def run_checks(modes: list[str], cache: ParsedCache | None = None) -> dict[str, tuple[list[str], list[str]]]:
+    """Run the given cadences against one shared cache, concurrently when there are several."""
+    cache = cache or ParsedCache()
+    if len(modes) <= 1:
+        return {mode: CHECKS[mode](cache) for mode in modes}
+    with ThreadPoolExecutor(max_workers=len(modes)) as pool:
+        futures = {mode: pool.submit(CHECKS[mode], cache) for mode in modes}
+        return {mode: future.result() for mode, future in futures.items()}
+
+
+def build_report(results: dict[str, tuple[list[str], list[str]]]) -> dict:
+    return {
+        "date": TODAY.isoformat(),
+        "ok": not any(failures for failures, _ in results.values()),
+        "modes": {
+            mode: {
+                "ok": not failures,
+                "warnings": warnings,
+                "failures": failures,
+            }
+            for mode, (failures, warnings) in results.items()
+        },
+    }
+
+
+def print_upcoming(days: int, upcoming: list[tuple[dt.date, str, str]]) -> None:
+    print(f"[stale-within {days}d] governance refresh forecast")
+    print(f"date={TODAY.isoformat()}")
+    print(f"items={len(upcoming)}")
+    for stale_on, cadence, item in upcoming:
+        delta = (stale_on - TODAY).days
+        when = f"in {delta} days" if delta > 0 else ("today" if delta == 0 else f"{-delta} days ago")
+        print(f"{'STALE' if delta <= 0 else 'DUE'}: {stale_on.isoformat()} ({when}) [{cadence}] {item}")
+
+
 def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument(
         "--mode",
-        choices=["weekly", "monthly", "quarterly"],
-        required=True,
+        choices=[*CHECKS, "all"],
         help="Refresh cadence mode to validate",
     )
+    parser.add_argument("--report", type=Path, help="Also write a JSON report here ('-' for stdout only)")
+    parser.add_argument(
+        "--stale-within",
+        type=int,
+        metavar="N",
+        help="List items whose checks fail within N days (from the cached index)",
+    )
+    parser.add_argument("--no-state", action="store_true", help="Do not read or write the state cache")
     args = parser.parse_args()
+    if args.mode is None and args.stale_within is None:
+        parser.error("one of --mode or --stale-within is required")
 
-    if args.mode == "weekly":
-        failures, warnings = check_weekly()
-    elif args.mode == "monthly":
-        failures, warnings = check_monthly()
+    state = GovernanceState(None if args.no_state else STATE_PATH)
+    cache = ParsedCache(state=state)
+    if args.mode == "all":
+        modes = list(CHECKS)
     else:
-        failures, warnings = check_quarterly()
-
-    print(f"[{args.mode}] governance refresh check")
-    print(f"date={TODAY.isoformat()}")
-    print(f"warnings={len(warnings)} failures={len(failures)}")
-
-    for msg in warnings:
-        print(f"WARN: {msg}")
-    for msg in failures:
-        print(f"FAIL: {msg}")
-
-    return 1 if failures else 0
+        modes = [args.mode] if args.mode else []
+    results = run_checks(modes, cache)
+    upcoming = upcoming_staleness(args.stale_within, cache) if args.stale_within is not None else None
+    state.save()
+
+    report = build_report(results)
+    report["state"] = {"path": str(state.path) if state.path else None, "reparsed": sorted(state.reparsed)}
+    if upcoming is not None:
+        report["stale_within"] = {
+            "days": args.stale_within,
+            "items": [
+                {"stale_on": stale_on.isoformat(), "cadence": cadence, "item": item}
+                for stale_on, cadence, item in upcoming
+            ],
+        }
+
+    if args.report and str(args.report) == "-":
+        print(json.dumps(report, indent=2))
+        return 0 if report["ok"] else 1
+
+    for mode, (failures, warnings) in results.items():
+        print(f"[{mode}] governance refresh check")
+        print(f"date={TODAY.isoformat()}")
+        print(f"warnings={len(warnings)} failures={len(failures)}")
+
+        for msg in warnings:
+            print(f"WARN: {msg}")
+        for msg in failures:
+            print(f"FAIL: {msg}")
+
+    if upcoming is not None:
+        print_upcoming(args.stale_within, upcoming)
+
+    if args.report:
+        args.report.parent.mkdir(parents=True, exist_ok=True)
+        args.report.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"Saved: {args.report}")
+
+    return 0 if report["ok"] else 1
 
 
 if __name__ == "__main__":
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Cross-memo numeric consistency check.
+
+Canonical metric keys come from two places:
+  - data/x402_kpi_canonical.csv: one key per metric (x402.transactions,
+    x402.volume, ...). "cumulative_transactions" and "transactions" are the
+    same counter, so qualifiers are stripped from metric_name; every row is
+    kept, and the latest highest-confidence row is the reference value.
+  - research/source-registry.md: rows whose Notes quote a figure ("more than
+    60 partners") become keys like ap2.partner, referenced to that source.
+
+Every numeric claim in memos/*.md and research/*.md (from memo_claim_index,
+so units are already normalised: "75.41M", "75,410,000" and "$24.24M" are
+plain values with a kind) is assigned to a key when its line or headings name
+the subject (x402, ap2, ...), its own clause or table cell names the metric,
+its kind matches the key's unit, and it is not a share, ratio, forecast,
+per-period or per-segment figure. A mention conflicts with the
+reference when the values differ by more than TOLERANCE, unless one side is a
+lower bound ("$600M+", "over 100M") the other respects, or the mention is
+dated before the reference (a historical snapshot: reported as "dated").
+
+The corpus is read once through the claim index (re-extracting only edited
+files), so a full check takes well under a second: ~0.1 s with a warm index.
+
+Usage:
+  python scripts/check_metric_consistency.py               # conflicts only; exit 1 if any
+  python scripts/check_metric_consistency.py --all         # every grouped mention
+  python scripts/check_metric_consistency.py --key x402.transactions
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import re
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from check_governance_refresh import X402_KPI
+from memo_claim_index import Claim, Quantity, format_value, open_index, parse_quantity, tokenize
+
+
+ROOT = Path(__file__).resolve().parent.parent
+SOURCE_REGISTRY = "research/source-registry.md"
+
+TOLERANCE = 0.02  # relative; covers "~94K" vs 94.06K style rounding
+CONFIDENCE_RANK = {"high": 3, "medium": 2, "low": 1}
+
+# x402_kpi_canonical.csv unit -> (power of ten, kind, lower bound)
+UNITS = {
+    "K": (3, "count", False),
+    "M": (6, "count", False),
+    "M_plus": (6, "count", True),
+    "USD_M": (6, "usd", False),
+    "USD_M_plus": (6, "usd", True),
+}
+# Qualifiers dropped from metric_name: they describe how a figure was captured, not what it counts.
+METRIC_QUALIFIERS = ("cumulative", "processed", "text")
+# Words in a mention's own clause that make it a different quantity than the headline counter.
+EXCLUDE_TERMS = frozenset(tokenize(
+    "daily day weekly week monthly month annual annualized year per share fee fees revenue "
+    "forecast forecasts projected projection target reach reaches if average growth margin ratio"
+))
+# Innermost headings that introduce per-segment breakdowns (per chain, per facilitator) of a total.
+BREAKDOWN_TERMS = frozenset(tokenize("split breakdown share"))
+# A mention more than this factor away from the reference is a different quantity ("HTTP 402").
+MAGNITUDE_RANGE = 1000.0
+MONTHS = {m: i for i, m in enumerate("jan feb mar apr may jun jul aug sep oct nov dec".split(), start=1)}
+DATE_RE = re.compile(
+    r"\b(?P<iso>20\d\d-[01]\d)(?:-\d\d)?\b"
+    r"|\b(?P<month>jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?(?:\s+\d{1,2}(?:-\d{1,2})?,?)?\s+(?P<year>20\d\d)\b",
+    re.IGNORECASE,
+)
+# source_id tokens that name the publisher or the kind of page, not the subject.
+SOURCE_ID_NOISE = frozenset("google visa mastercard paypal stripe coinbase launch expansion press v2".split())
+QUOTED_FIGURE_RE = re.compile(r'"([^"]*\d[^"]*)"')
+
+
+@dataclass
+class Reference:
+    quantity: Quantity
+    source: str  # where the canonical figure comes from
+    as_of: str
+    confidence: str
+    label: str
+
+
+@dataclass
+class MetricKey:
+    key: str  # "<subject>.<metric>"
+    subject: str  # index term that must appear in the mention's line or headings
+    metric_terms: frozenset[str]  # one must appear in the mention's own clause or cell
+    kind: str
+    references: list[Reference] = field(default_factory=list)
+
+    @property
+    def reference(self) -> Reference:
+        """The latest of the highest-confidence canonical figures."""
+        return max(self.references, key=lambda r: (CONFIDENCE_RANK.get(r.confidence, 0), r.as_of))
+
+
+@dataclass
+class Mention:
+    key: str
+    claim: Claim
+    status: str  # ok / conflict / dated (a snapshot older than the reference)
+    matches: Reference | None  # the canonical figure it repeats, if any
+
+
+# =============================================================================
+# Canonical keys
+# =============================================================================
+
+def _metric_name(name: str) -> str:
+    words = [w for w in name.split("_") if w not in METRIC_QUALIFIERS]
+    return "_".join(words) or name
+
+
+def load_kpi_keys(path: Path = ROOT / X402_KPI) -> dict[str, MetricKey]:
+    keys: dict[str, MetricKey] = {}
+    with path.open(newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            scale, kind, plus = UNITS[row["unit"]]
+            metric = _metric_name(row["metric_name"])
+            key = f"x402.{metric}"
+            if key not in keys:
+                keys[key] = MetricKey(key, "x402", frozenset(tokenize(metric.replace("_", " "))), kind)
+            value = float(f"{row['value']}e{scale}")
+            keys[key].references.append(Reference(
+                Quantity(value, kind, plus),
+                source=row["source_url"],
+                as_of=row["as_of_date_utc"],
+                confidence=row["confidence"],
+                label=f"{row['metric_group']}.{row['metric_name']}",
+            ))
+    return keys
+
+
+def load_registry_keys(path: Path = ROOT / SOURCE_REGISTRY, known_urls: set[str] = frozenset()) -> dict[str, MetricKey]:
+    """Keys for figures quoted in the registry's Notes, for sources not already in the KPI table."""
+    keys: dict[str, MetricKey] = {}
+    for line in path.read_text(encoding="utf-8").splitlines():
+        cells = [c.strip() for c in line.strip().strip("|").split("|")]
+        if len(cells) < 6 or not cells[0].startswith("`"):
+            continue
+        source_id, url, _, verified, status, notes = cells[:6]
+        source_id = source_id.strip("`")
+        if url in known_urls or status.startswith("deprecated"):
+            continue
+        subject = [t for t in source_id.split("_") if t not in SOURCE_ID_NOISE]
+        for quote in QUOTED_FIGURE_RE.findall(notes):
+            parsed = _quoted_figure(quote)
+            if parsed is None or not subject:
+                continue
+            quantity, noun = parsed
+            key = f"{subject[0]}.{noun}"
+            keys.setdefault(key, MetricKey(key, subject[0], frozenset([noun]), quantity.kind)).references.append(
+                Reference(quantity, source=source_id, as_of=verified, confidence="high", label=quote)
+            )
+    return keys
+
+
+def _quoted_figure(quote: str) -> tuple[Quantity, str] | None:
+    """'more than 60 partners' -> (60+, 'partner'): the figure and the last word of its noun phrase."""
+    words = quote.split()
+    for i, word in enumerate(words):
+        quantity = parse_quantity(word)
+        if quantity is None:
+            continue
+        terms = tokenize(" ".join(words[i + 1 :]))
+        if not terms:
+            return None
+        lower_bound = re.search(r"\b(over|more than|at least)\s*$", " ".join(words[:i]), re.IGNORECASE)
+        return quantity._replace(plus=quantity.plus or bool(lower_bound)), terms[-1]
+    return None
+
+
+def load_keys() -> dict[str, MetricKey]:
+    keys = load_kpi_keys()
+    known = {r.source for k in keys.values() for r in k.references}
+    keys.update(load_registry_keys(known_urls=known))
+    return keys
+
+
+# =============================================================================
+# Matching
+# =============================================================================
+
+def agree(mention: Quantity, reference: Quantity) -> bool:
+    if _same(mention, reference):
+        return True
+    if reference.plus and mention.value >= reference.value:
+        return True
+    return mention.plus and mention.value <= reference.value
+
+
+def _same(a: Quantity, b: Quantity) -> bool:
+    return abs(a.value - b.value) <= TOLERANCE * abs(b.value)
+
+
+def _latest_month(text: str) -> str | None:
+    """Latest "YYYY-MM" mentioned in text ("Oct 26, 2025", "Late Jan 2026", "2026-02-09")."""
+    months = []
+    for m in DATE_RE.finditer(text):
+        months.append(m["iso"] or f"{m['year']}-{MONTHS[m['month'][:3].lower()]:02d}")
+    return max(months, default=None)
+
+
+def classify(claim: Claim, keys: dict[str, MetricKey]) -> MetricKey | None:
+    """The key a claim reports, if exactly one fits."""
+    fits = [
+        k for k in keys.values()
+        if k.kind == claim.kind
+        and k.reference.quantity.value / MAGNITUDE_RANGE <= claim.value <= k.reference.quantity.value * MAGNITUDE_RANGE
+    ]
+    if not fits:
+        return None
+    local = set(tokenize(f"{claim.label} {claim.column}"))
+    if local & EXCLUDE_TERMS:
+        return None
+    innermost = claim.heading.rsplit(" > ", 1)[-1]
+    if set(tokenize(innermost)) & BREAKDOWN_TERMS:
+        return None
+    if re.search(rf"{re.escape(claim.raw)}\s?:\s?\d", claim.text):
+        return None  # "53:1" is a ratio
+    scope = set(tokenize(f"{claim.text} {claim.heading}"))
+    fits = [k for k in fits if k.subject in scope and k.metric_terms & local]
+    return fits[0] if len(fits) == 1 else None
+
+
+def check(claims: list[Claim], keys: dict[str, MetricKey]) -> list[Mention]:
+    mentions = []
+    for claim in claims:
+        key = classify(claim, keys)
+        if key is None:
+            continue
+        q, ref = claim.quantity, key.reference
+        matches = next((r for r in key.references if _same(q, r.quantity)), None)
+        if agree(q, ref.quantity):
+            status = "ok"
+        else:
+            # Table rows carry their date in another cell; prose in the clause.
+            month = _latest_month(claim.text if claim.column else claim.label)
+            status = "dated" if month is not None and month < ref.as_of[:7] else "conflict"
+        mentions.append(Mention(key.key, claim, status, matches))
+    return mentions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--all", action="store_true", help="List agreeing mentions too")
+    parser.add_argument("--key", help="Only this metric key, e.g. x402.transactions")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    keys = load_keys()
+    if args.key and args.key not in keys:
+        parser.error(f"unknown key {args.key!r}; known: {', '.join(sorted(keys))}")
+    mentions = check(open_index().claims, keys)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    conflicts = 0
+    for name in sorted(keys):
+        if args.key and name != args.key:
+            continue
+        key = keys[name]
+        group = [m for m in mentions if m.key == name]
+        bad = [m for m in group if m.status == "conflict"]
+        conflicts += len(bad)
+        ref = key.reference
+        print(f"{name}: {format_value(ref.quantity)} ({ref.source}, {ref.as_of}, {ref.confidence}) "
+              f"- {len(group)} mentions, {len(bad)} conflicting")
+        for m in group if args.all else bad:
+            c = m.claim
+            flag = {"ok": "ok   ", "dated": "dated", "conflict": "FAIL "}[m.status]
+            note = f" = {m.matches.label} ({m.matches.confidence})" if m.matches and m.status != "ok" else ""
+            print(f"  {flag} {format_value(c.quantity):>9}  {c.ref}{note}")
+    print(f"\n{len(mentions)} metric mentions, {conflicts} conflicts across {len(keys)} keys ({elapsed:.0f} ms)")
+    return 1 if conflicts else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
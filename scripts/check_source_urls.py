@@ -0,0 +1,531 @@
+#!/usr/bin/env python3
+"""
+Source URL health check for governed datasets.
+
+Collects every `source_url` in research/memo-citation-backfill-matrix.csv,
+data/x402_kpi_canonical.csv and the other data/*.csv files that carry source
+metadata, then checks them concurrently:
+  - external URLs: HEAD (GET when HEAD is refused), following redirects,
+  - repo-relative references (memos/x.md:103, data/x.py): the file must exist.
+
+Concurrency is asyncio over a bounded pool of keep-alive http.client
+connections (stdlib only, so it runs before any dependency install): at most
+--max-connections requests in flight overall and --per-host per host.
+ETag / Last-Modified validators from the previous run are cached in
+.cache/source_health/validators.json and sent as conditional headers to the
+URL that issued them (the final redirect target); a 304 counts as healthy. A redirect target that differs from the previous run is
+flagged, per research/source-governance-policy.md ("Flag 404/redirect
+changes on weekly validation runs").
+
+Results:
+  - ok:   2xx, or 304 against the cached validators,
+  - warn: 401/403/429 (access-restricted or bot-blocked), changed redirect,
+  - fail: any other 4xx/5xx, connection error/timeout, missing local file.
+
+--stub serves every external URL from a local in-process server instead of
+the network (deterministic; honours conditional headers), for exercising the
+checker offline.
+
+Usage:
+  python scripts/check_source_urls.py
+  python scripts/check_source_urls.py --per-host 2 --timeout 10 --report .cache/source_health/report.json
+  python scripts/check_source_urls.py --stub
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import csv
+import datetime as dt
+import hashlib
+import http.client
+import json
+import re
+import ssl
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urljoin, urlsplit
+
+
+ROOT = Path(__file__).resolve().parent.parent
+CACHE_DIR = ROOT / ".cache" / "source_health"
+VALIDATORS_PATH = CACHE_DIR / "validators.json"
+
+SOURCE_FILES = [
+    "research/memo-citation-backfill-matrix.csv",
+    "data/x402_kpi_canonical.csv",
+]
+SOURCE_GLOBS = ["data/*.csv"]
+
+DEFAULT_MAX_CONNECTIONS = 32
+DEFAULT_PER_HOST = 4
+DEFAULT_TIMEOUT = 15.0
+MAX_REDIRECTS = 5
+USER_AGENT = "memo-fintech-agents-source-health/1"
+
+WARN_STATUSES = {401, 403, 429}
+HEAD_REFUSED = {403, 405, 501}
+
+
+@dataclass
+class SourceCheck:
+    url: str
+    references: list[str] = field(default_factory=list)
+    result: str = "fail"
+    status: int | None = None
+    final_url: str | None = None
+    detail: str = ""
+    seconds: float = 0.0
+
+
+# ---------------------------------------------------------------------------
+# Source collection
+# ---------------------------------------------------------------------------
+
+
+def split_source_field(value: str) -> list[str]:
+    """One source_url cell may list several sources: 'a;label:https://b'."""
+    out = []
+    for part in (value or "").split(";"):
+        part = part.strip()
+        if not part:
+            continue
+        if not is_external(part):
+            match = re.search(r"https?://\S+", part)
+            part = match.group(0) if match else part
+        out.append(part)
+    return out
+
+
+def collect_sources(root: Path = ROOT) -> dict[str, list[str]]:
+    """source reference -> ['file:row', ...] across all files with a source_url column."""
+    paths = [root / rel for rel in SOURCE_FILES]
+    for pattern in SOURCE_GLOBS:
+        paths.extend(sorted(root.glob(pattern)))
+
+    sources: dict[str, list[str]] = {}
+    for path in dict.fromkeys(paths):
+        if not path.exists():
+            continue
+        with path.open("r", encoding="utf-8", newline="") as f:
+            reader = csv.DictReader(f)
+            if "source_url" not in (reader.fieldnames or []):
+                continue
+            rel = path.relative_to(root).as_posix()
+            for line_no, row in enumerate(reader, start=2):
+                for source in split_source_field(row.get("source_url", "")):
+                    sources.setdefault(source, []).append(f"{rel}:{line_no}")
+    return sources
+
+
+def is_external(source: str) -> bool:
+    return source.startswith(("http://", "https://"))
+
+
+def check_local(source: str, root: Path = ROOT) -> SourceCheck:
+    """Repo-relative reference, optionally with a :line suffix."""
+    check = SourceCheck(url=source)
+    rel, _, line = source.partition(":")
+    path = root / rel
+    if not path.is_file():
+        check.detail = "file not found"
+        return check
+    if line.isdigit():
+        with path.open("r", encoding="utf-8") as f:
+            n_lines = sum(1 for _ in f)
+        if int(line) > n_lines:
+            check.detail = f"line {line} beyond end of file ({n_lines} lines)"
+            return check
+    check.result = "ok"
+    check.detail = "local"
+    return check
+
+
+# ---------------------------------------------------------------------------
+# Connection pool
+# ---------------------------------------------------------------------------
+
+
+class ConnectionPool:
+    """Keep-alive http.client connections keyed by (scheme, host, port).
+
+    Connections are blocking; callers use them from worker threads. Idle
+    connections are reused; at most `max_idle_per_host` are kept per key.
+    """
+
+    def __init__(self, timeout: float, max_idle_per_host: int):
+        self.timeout = timeout
+        self.max_idle_per_host = max_idle_per_host
+        self._idle: dict[tuple[str, str, int], list[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+        self._ssl = ssl.create_default_context()
+        self.opened = 0
+        self.reused = 0
+
+    def acquire(self, scheme: str, host: str, port: int) -> http.client.HTTPConnection:
+        key = (scheme, host, port)
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                self.reused += 1
+                return idle.pop()
+            self.opened += 1
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, port, timeout=self.timeout, context=self._ssl)
+        return http.client.HTTPConnection(host, port, timeout=self.timeout)
+
+    def release(self, scheme: str, host: str, port: int, conn: http.client.HTTPConnection) -> None:
+        key = (scheme, host, port)
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle_per_host:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def close(self) -> None:
+        with self._lock:
+            for conns in self._idle.values():
+                for conn in conns:
+                    conn.close()
+            self._idle.clear()
+
+
+def _request(
+    pool: ConnectionPool, method: str, url: str, headers: dict[str, str]
+) -> tuple[int, dict[str, str]]:
+    """One blocking request on a pooled connection; returns (status, lower-cased headers)."""
+    parts = urlsplit(url)
+    scheme = parts.scheme
+    host = parts.hostname or ""
+    port = parts.port or (443 if scheme == "https" else 80)
+    target = parts.path or "/"
+    if parts.query:
+        target += f"?{parts.query}"
+
+    for attempt in range(2):
+        conn = pool.acquire(scheme, host, port)
+        try:
+            conn.request(method, target, headers={"User-Agent": USER_AGENT, **headers})
+            resp = conn.getresponse()
+            resp.read()  # drain so the connection can be reused
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            conn.close()
+            if attempt == 0:
+                continue  # stale keep-alive connection; retry once on a fresh one
+            raise
+        except Exception:
+            conn.close()
+            raise
+        response_headers = {k.lower(): v for k, v in resp.getheaders()}
+        if resp.will_close:
+            conn.close()
+        else:
+            pool.release(scheme, host, port, conn)
+        return resp.status, response_headers
+    raise ConnectionError(f"could not reach {url}")
+
+
+def fetch(pool: ConnectionPool, url: str, validators: dict) -> dict:
+    """HEAD (then GET if refused) with conditional headers, following redirects."""
+    conditional = {}
+    if validators.get("etag"):
+        conditional["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        conditional["If-Modified-Since"] = validators["last_modified"]
+
+    # The stored validators came from the final redirect target, so they are
+    # only meaningful on the request to that URL.
+    issuer = validators.get("final_url") or url
+    current = url
+    for _ in range(MAX_REDIRECTS + 1):
+        headers = conditional if current == issuer else {}
+        status, response_headers = _request(pool, "HEAD", current, headers)
+        if status in HEAD_REFUSED:
+            status, response_headers = _request(pool, "GET", current, headers)
+        if status in (301, 302, 303, 307, 308) and response_headers.get("location"):
+            current = urljoin(current, response_headers["location"])
+            continue
+        return {
+            "status": status,
+            "final_url": current,
+            "etag": response_headers.get("etag"),
+            "last_modified": response_headers.get("last-modified"),
+        }
+    raise ConnectionError(f"more than {MAX_REDIRECTS} redirects")
+
+
+# ---------------------------------------------------------------------------
+# Async driver
+# ---------------------------------------------------------------------------
+
+
+def classify(check: SourceCheck, previous: dict) -> None:
+    status = check.status or 0
+    if status == 304 or 200 <= status < 300:
+        check.result = "ok"
+        if status == 304:
+            check.detail = "not modified"
+        old_final = previous.get("final_url")
+        if old_final and check.final_url and old_final != check.final_url:
+            check.result = "warn"
+            check.detail = f"redirect changed: {old_final} -> {check.final_url}"
+        elif check.final_url and check.final_url != check.url:
+            check.detail = f"redirects to {check.final_url}"
+    elif status in WARN_STATUSES:
+        check.result = "warn"
+        check.detail = f"HTTP {status} (access restricted)"
+    else:
+        check.result = "fail"
+        check.detail = f"HTTP {status}"
+
+
+async def check_url(
+    check: SourceCheck,
+    pool: ConnectionPool,
+    global_limit: asyncio.Semaphore,
+    host_limits: dict[str, asyncio.Semaphore],
+    per_host: int,
+    validators: dict[str, dict],
+    stub: StubServer | None = None,
+) -> SourceCheck:
+    host = urlsplit(check.url).hostname or ""
+    host_limit = host_limits.setdefault(host, asyncio.Semaphore(per_host))
+    previous = validators.get(check.url, {})
+    target = stub.rewrite(check.url) if stub else check.url
+    sent = dict(previous)
+    if stub and previous.get("final_url"):
+        sent["final_url"] = stub.rewrite(previous["final_url"])
+
+    async with host_limit, global_limit:
+        start = time.perf_counter()
+        try:
+            response = await asyncio.to_thread(fetch, pool, target, sent)
+        except Exception as exc:  # network errors are results, not crashes
+            check.detail = f"{type(exc).__name__}: {exc}"
+            check.seconds = time.perf_counter() - start
+            return check
+        check.seconds = time.perf_counter() - start
+
+    check.status = response["status"]
+    check.final_url = response["final_url"]
+    if check.final_url == target:
+        check.final_url = check.url
+    elif stub:
+        check.final_url = stub.restore(check.final_url)
+    classify(check, previous)
+
+    if check.result != "fail":
+        entry = dict(previous)
+        if check.status != 304:
+            entry["etag"] = response["etag"]
+            entry["last_modified"] = response["last_modified"]
+        entry["final_url"] = check.final_url
+        entry["status"] = check.status
+        entry["checked_utc"] = dt.datetime.now(dt.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        validators[check.url] = entry
+    return check
+
+
+async def check_all(
+    sources: dict[str, list[str]],
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    per_host: int = DEFAULT_PER_HOST,
+    timeout: float = DEFAULT_TIMEOUT,
+    validators: dict[str, dict] | None = None,
+    stub: StubServer | None = None,
+) -> list[SourceCheck]:
+    validators = {} if validators is None else validators
+    pool = ConnectionPool(timeout=timeout, max_idle_per_host=per_host)
+    global_limit = asyncio.Semaphore(max_connections)
+    host_limits: dict[str, asyncio.Semaphore] = {}
+
+    # asyncio.to_thread uses the default executor; size it to the connection bound.
+    loop = asyncio.get_running_loop()
+    loop.set_default_executor(ThreadPoolExecutor(max_workers=max_connections))
+
+    checks, tasks = [], []
+    for source, refs in sources.items():
+        if is_external(source):
+            check = SourceCheck(url=source, references=refs)
+            tasks.append(check_url(check, pool, global_limit, host_limits, per_host, validators, stub))
+        else:
+            check = check_local(source)
+            check.references = refs
+        checks.append(check)
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        pool.close()
+    checks.sort(key=lambda c: ({"fail": 0, "warn": 1, "ok": 2}[c.result], c.url))
+    return checks
+
+
+# ---------------------------------------------------------------------------
+# Local stub server
+# ---------------------------------------------------------------------------
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Serves /<host>/<path> for rewritten URLs.
+
+    Every resource is 200 with a stable ETag / Last-Modified derived from the
+    original URL, and honours If-None-Match / If-Modified-Since with 304.
+    Paths can force other behaviour for exercising the checker:
+      .../status/<code>   respond with <code>
+      .../redirect/<n>    redirect n times before landing on a 200
+      .../slow/<ms>       sleep before responding
+    """
+
+    protocol_version = "HTTP/1.1"
+    server_version = "SourceHealthStub/1"
+    last_modified = formatdate(0, usegmt=True)
+
+    def _respond(self, include_body: bool) -> None:
+        segments = [s for s in self.path.split("/") if s]
+        status = 200
+        headers: dict[str, str] = {}
+        for key, value in zip(segments, segments[1:]):
+            if key == "slow" and value.isdigit():
+                time.sleep(int(value) / 1000)
+            elif key == "status" and value.isdigit():
+                status = int(value)
+            elif key == "redirect" and value.isdigit() and int(value) > 0:
+                status = 302
+                headers["Location"] = self.path.replace(f"redirect/{value}", f"redirect/{int(value) - 1}")
+
+        etag = '"' + hashlib.sha1(self.path.encode("utf-8")).hexdigest()[:16] + '"'
+        if status == 200:
+            headers["ETag"] = etag
+            headers["Last-Modified"] = self.last_modified
+            if self.headers.get("If-None-Match") == etag or self.headers.get("If-Modified-Since") == self.last_modified:
+                status = 304
+
+        body = b"" if status == 304 else f"stub {status} {self.path}\n".encode("utf-8")
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if include_body and status != 304:
+            self.wfile.write(body)
+
+    def do_HEAD(self) -> None:
+        self._respond(include_body=False)
+
+    def do_GET(self) -> None:
+        self._respond(include_body=True)
+
+    def log_message(self, fmt: str, *args) -> None:
+        pass
+
+
+class StubServer:
+    """Context manager running StubHandler on 127.0.0.1 in a background thread."""
+
+    def __init__(self, handler: type[BaseHTTPRequestHandler] = StubHandler):
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self.httpd.daemon_threads = True
+        self.base = f"http://127.0.0.1:{self.httpd.server_port}"
+
+    def rewrite(self, url: str) -> str:
+        parts = urlsplit(url)
+        target = f"{self.base}/{parts.hostname}{parts.path or '/'}"
+        return f"{target}?{parts.query}" if parts.query else target
+
+    def restore(self, url: str) -> str:
+        """Inverse of rewrite() (scheme becomes https)."""
+        if not url.startswith(self.base + "/"):
+            return url
+        return "https://" + url[len(self.base) + 1:]
+
+    def __enter__(self) -> StubServer:
+        threading.Thread(target=self.httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+
+def load_validators(path: Path) -> dict[str, dict]:
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def save_validators(validators: dict[str, dict], path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(validators, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--max-connections", type=int, default=DEFAULT_MAX_CONNECTIONS, help="Requests in flight overall")
+    parser.add_argument("--per-host", type=int, default=DEFAULT_PER_HOST, help="Requests in flight per host")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT, help="Socket timeout per request (seconds)")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore and do not update cached validators")
+    parser.add_argument("--stub", action="store_true", help="Check against a local stub server instead of the network")
+    parser.add_argument("--report", type=Path, help="Write a JSON report here")
+    args = parser.parse_args()
+
+    sources = collect_sources()
+    validators_path = VALIDATORS_PATH if not args.stub else CACHE_DIR / "validators-stub.json"
+    validators = {} if args.no_cache else load_validators(validators_path)
+
+    start = time.perf_counter()
+    if args.stub:
+        with StubServer() as stub:
+            checks = asyncio.run(
+                check_all(sources, args.max_connections, args.per_host, args.timeout, validators, stub)
+            )
+    else:
+        checks = asyncio.run(check_all(sources, args.max_connections, args.per_host, args.timeout, validators))
+    elapsed = time.perf_counter() - start
+
+    if not args.no_cache:
+        save_validators(validators, validators_path)
+
+    counts = {k: sum(c.result == k for c in checks) for k in ("ok", "warn", "fail")}
+    external = sum(is_external(c.url) for c in checks)
+    print(f"[source-health] {len(checks)} sources ({external} external) checked in {elapsed:.2f}s"
+          f"{' against local stub' if args.stub else ''}")
+    print(f"ok={counts['ok']} warnings={counts['warn']} failures={counts['fail']}")
+    for check in checks:
+        if check.result == "ok":
+            continue
+        label = "FAIL" if check.result == "fail" else "WARN"
+        refs = ", ".join(check.references[:3]) + (" ..." if len(check.references) > 3 else "")
+        print(f"{label}: {check.url} - {check.detail} [{refs}]")
+
+    if args.report:
+        args.report.parent.mkdir(parents=True, exist_ok=True)
+        report = {
+            "checked_utc": dt.datetime.now(dt.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "seconds": round(elapsed, 3),
+            "stub": args.stub,
+            "counts": counts,
+            "checks": [asdict(c) for c in checks],
+        }
+        args.report.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"Saved: {args.report}")
+
+    return 1 if counts["fail"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
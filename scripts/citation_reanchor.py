@@ -0,0 +1,365 @@
+"""
+Re-anchor the line_ref column of research/memo-citation-backfill-matrix.csv.
+
+A line_ref is a bare line number, so every edit above a cited claim makes it
+point at the wrong line. This engine re-locates each claim instead:
+
+  - every line of every memo/research file is reduced to a set of shingles:
+    its index terms, adjacent-term pairs and normalised values (the tokenizer
+    and number parser from memo_claim_index, so "157.6M" and "157,600,000"
+    agree). Per file, shingle -> lines postings and IDF weights are cached in
+    .cache/citation_shingles.pkl and rebuilt only for files that changed.
+  - a claim's fingerprint is its claim_short plus, once it has been anchored,
+    the anchored line and its nonblank neighbours, kept per claim_id in
+    research/memo-citation-anchors.json.
+  - candidate lines are the union of the fingerprint's postings in the
+    claim's memo. Each is scored by the IDF-weighted share of claim_short it
+    contains and, when an anchor exists, weighted Jaccard similarity with the
+    anchored line and its neighbours. A proximity term around the old
+    line_ref, shifted by the median drift of the nearest unambiguously
+    re-anchored claims in the same file, decides between repeated mentions.
+
+Claims scoring below MIN_SCORE are reported as unresolved and left alone;
+near-ties are reported as ambiguous. Neither is written: --write rewrites
+the line_ref of every ok or moved claim in one pass (only that field; the
+rest of the CSV is untouched) and refreshes their anchors. A claim the engine
+cannot place is confirmed by hand with --pin, which writes the given line and
+anchors it so later runs can follow it.
+
+Usage:
+    uv run python scripts/citation_reanchor.py            # report old -> new line refs
+    uv run python scripts/citation_reanchor.py --write    # rewrite line_ref + anchors
+    uv run python scripts/citation_reanchor.py --check    # exit 1 if any line_ref is stale
+    uv run python scripts/citation_reanchor.py --pin MB009=201 --pin MB020=356
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import hashlib
+import json
+import math
+import pickle
+import statistics
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from check_governance_refresh import CITATION_MATRIX
+from memo_claim_index import corpus_paths, line_quantities, tokenize, value_key
+
+
+ROOT = Path(__file__).resolve().parent.parent
+MATRIX_PATH = ROOT / CITATION_MATRIX
+ANCHORS_PATH = ROOT / "research" / "memo-citation-anchors.json"
+SHINGLE_CACHE = ROOT / ".cache" / "citation_shingles.pkl"
+CACHE_VERSION = 1
+
+MIN_SCORE = 0.5
+AMBIGUITY_MARGIN = 0.05
+SHORT_WEIGHT, TEXT_WEIGHT, CONTEXT_WEIGHT = 0.4, 0.4, 0.2
+PROXIMITY_WEIGHT = 0.3
+PROXIMITY_SCALE = 20.0  # lines
+DRIFT_NEIGHBOURS = 3
+
+
+def shingles(text: str) -> frozenset[str]:
+    """Index terms, adjacent-term pairs and value keys of a piece of text."""
+    terms = tokenize(text)
+    pairs = (f"{a}_{b}" for a, b in zip(terms, terms[1:]))
+    values = (value_key(q.value) for q in line_quantities(text))
+    return frozenset([*terms, *pairs, *values])
+
+
+# =============================================================================
+# Shingle index
+# =============================================================================
+
+@dataclass
+class FileShingles:
+    stamp: tuple[int, int]
+    sha256: str
+    lines: list[frozenset[str]]  # index 0 is line 1
+    postings: dict[str, list[int]]  # shingle -> 1-based line numbers
+    idf: dict[str, float]
+
+    @classmethod
+    def build(cls, stamp: tuple[int, int], sha256: str, text: str) -> FileShingles:
+        lines = [shingles(line) for line in text.splitlines()]
+        postings: dict[str, list[int]] = {}
+        for lineno, feats in enumerate(lines, start=1):
+            for f in feats:
+                postings.setdefault(f, []).append(lineno)
+        n = sum(1 for feats in lines if feats)
+        idf = {f: math.log((n + 1) / len(ids)) + 1.0 for f, ids in postings.items()}
+        return cls(stamp, sha256, lines, postings, idf)
+
+    def weight(self, feature: str) -> float:
+        """IDF of a shingle; shingles absent from the file weigh as much as the rarest."""
+        return self.idf.get(feature, math.log(len(self.lines) + 2) + 1.0)
+
+    def neighbours(self, lineno: int) -> frozenset[str]:
+        """Shingles of the nearest nonblank line above and below."""
+        out: set[str] = set()
+        for step in (-1, 1):
+            i = lineno - 1 + step
+            while 0 <= i < len(self.lines) and not self.lines[i]:
+                i += step
+            if 0 <= i < len(self.lines):
+                out |= self.lines[i]
+        return frozenset(out)
+
+
+class ShingleIndex:
+    """FileShingles for the corpus, cached per file and rebuilt when a file's content changes."""
+
+    def __init__(self, files: dict[str, FileShingles]) -> None:
+        self.files = files
+
+    @classmethod
+    def open(cls, cache: Path = SHINGLE_CACHE) -> ShingleIndex:
+        cached: dict[str, FileShingles] = {}
+        try:
+            with cache.open("rb") as f:
+                meta, payload = pickle.load(f)
+            if meta.get("version") == CACHE_VERSION:
+                cached = payload
+        except (OSError, EOFError, pickle.UnpicklingError, ValueError, AttributeError):
+            pass
+
+        files: dict[str, FileShingles] = {}
+        dirty = False
+        for path in corpus_paths():
+            rel = path.relative_to(ROOT).as_posix()
+            st = path.stat()
+            stamp = (st.st_mtime_ns, st.st_size)
+            entry = cached.get(rel)
+            if entry is not None and entry.stamp == stamp:
+                files[rel] = entry
+                continue
+            data = path.read_bytes()
+            sha = hashlib.sha256(data).hexdigest()
+            if entry is not None and entry.sha256 == sha:
+                entry.stamp = stamp
+            else:
+                entry = FileShingles.build(stamp, sha, data.decode("utf-8"))
+            files[rel] = entry
+            dirty = True
+        if dirty or set(files) != set(cached):
+            cache.parent.mkdir(parents=True, exist_ok=True)
+            tmp = cache.with_suffix(".tmp")
+            with tmp.open("wb") as f:
+                pickle.dump(({"version": CACHE_VERSION}, files), f, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp.replace(cache)
+        return cls(files)
+
+
+# =============================================================================
+# Matching
+# =============================================================================
+
+@dataclass
+class Anchor:
+    claim_id: str
+    memo_path: str
+    old_line: int
+    new_line: int | None
+    score: float
+    runner_up: float
+    status: str  # ok / moved / ambiguous / unresolved / missing
+
+
+def _containment(fp: frozenset[str], feats: frozenset[str], fs: FileShingles) -> float:
+    total = sum(fs.weight(f) for f in fp)
+    return sum(fs.weight(f) for f in fp & feats) / total if total else 0.0
+
+
+def _jaccard(a: frozenset[str], b: frozenset[str], fs: FileShingles) -> float:
+    union = sum(fs.weight(f) for f in a | b)
+    return sum(fs.weight(f) for f in a & b) / union if union else 0.0
+
+
+def _scores(row: dict, anchor: dict | None, fs: FileShingles) -> dict[int, float]:
+    """Candidate line -> similarity to the claim's fingerprint, without proximity."""
+    short = shingles(row["claim_short"])
+    text = context = frozenset()
+    if anchor and anchor.get("claim_short") == row["claim_short"]:
+        text = shingles(anchor["text"])
+        context = shingles(anchor["before"]) | shingles(anchor["after"])
+
+    candidates = {lineno for f in short | text for lineno in fs.postings.get(f, ())}
+    scores = {}
+    for lineno in candidates:
+        feats = fs.lines[lineno - 1]
+        s = _containment(short, feats, fs)
+        if text:
+            s = SHORT_WEIGHT * s + TEXT_WEIGHT * _jaccard(text, feats, fs)
+            s += CONTEXT_WEIGHT * _jaccard(context, fs.neighbours(lineno), fs)
+        scores[lineno] = s
+    return scores
+
+
+def _local_shift(shifts: list[tuple[int, int]], line: int) -> float:
+    """Median drift of the nearest unambiguous claims in the same file; edits move whole regions."""
+    if not shifts:
+        return 0.0
+    nearest = sorted(shifts, key=lambda s: abs(s[0] - line))[:DRIFT_NEIGHBOURS]
+    return statistics.median(shift for _, shift in nearest)
+
+
+def reanchor(rows: list[dict], anchors: dict[str, dict], index: ShingleIndex) -> list[Anchor]:
+    """Best current line for every matrix row."""
+    scored = []
+    for row in rows:
+        fs = index.files.get(row["memo_path"])
+        scores = _scores(row, anchors.get(row["claim_id"]), fs) if fs else None
+        scored.append((row, fs, scores))
+
+    # Drift observed at the claims whose best line is unambiguous: (old line, shift) per file.
+    shifts: dict[str, list[tuple[int, int]]] = {}
+    for row, fs, scores in scored:
+        if not scores:
+            continue
+        ranked = sorted(scores.values(), reverse=True)
+        if ranked[0] >= MIN_SCORE and (len(ranked) == 1 or ranked[0] - ranked[1] >= AMBIGUITY_MARGIN):
+            best = max(scores, key=scores.get)
+            old = int(row["line_ref"])
+            shifts.setdefault(row["memo_path"], []).append((old, best - old))
+
+    results = []
+    for row, fs, scores in scored:
+        old = int(row["line_ref"])
+        if fs is None:
+            results.append(Anchor(row["claim_id"], row["memo_path"], old, None, 0.0, 0.0, "missing"))
+            continue
+        expected = old + _local_shift(shifts.get(row["memo_path"], []), old)
+        ranked = sorted(
+            scores.items(),
+            key=lambda kv: (kv[1] + PROXIMITY_WEIGHT * math.exp(-abs(kv[0] - expected) / PROXIMITY_SCALE), -kv[0]),
+            reverse=True,
+        )
+        if not ranked or ranked[0][1] < MIN_SCORE:
+            best = ranked[0][1] if ranked else 0.0
+            results.append(Anchor(row["claim_id"], row["memo_path"], old, None, best, 0.0, "unresolved"))
+            continue
+        line, score = ranked[0]
+        runner_up = max((s for l, s in ranked[1:]), default=0.0)
+        if runner_up > score - AMBIGUITY_MARGIN:
+            status = "ambiguous"
+        else:
+            status = "ok" if line == old else "moved"
+        results.append(Anchor(row["claim_id"], row["memo_path"], old, line, score, runner_up, status))
+    return results
+
+
+# =============================================================================
+# Matrix and anchors files
+# =============================================================================
+
+def load_matrix(path: Path = MATRIX_PATH) -> list[dict]:
+    with path.open(newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+def load_anchors(path: Path = ANCHORS_PATH) -> dict[str, dict]:
+    return json.loads(path.read_text(encoding="utf-8")) if path.exists() else {}
+
+
+def write_line_refs(results: list[Anchor], path: Path = MATRIX_PATH) -> int:
+    """Rewrite only the line_ref field of rows that moved; returns the number changed."""
+    new = {a.claim_id: a.new_line for a in results if a.status == "moved"}
+    lines = path.read_text(encoding="utf-8").splitlines(keepends=True)
+    header = next(csv.reader([lines[0]]))
+    id_col, ref_col = header.index("claim_id"), header.index("line_ref")
+    changed = 0
+    for i, raw in enumerate(lines[1:], start=1):
+        fields = raw.split(",", ref_col + 1)
+        claim_id = fields[id_col]
+        if claim_id in new and '"' not in ",".join(fields[: ref_col + 1]):
+            fields[ref_col] = str(new[claim_id])
+            lines[i] = ",".join(fields)
+            changed += 1
+    path.write_text("".join(lines), encoding="utf-8")
+    return changed
+
+
+def write_anchors(rows: list[dict], results: list[Anchor], anchors: dict[str, dict], path: Path = ANCHORS_PATH) -> None:
+    """Store the anchored line and its neighbours as each ok or moved claim's fingerprint."""
+    texts: dict[str, list[str]] = {}
+    by_id = {row["claim_id"]: row for row in rows}
+    for a in results:
+        if a.status not in ("ok", "moved"):
+            continue
+        lines = texts.setdefault(a.memo_path, (ROOT / a.memo_path).read_text(encoding="utf-8").splitlines())
+
+        def nonblank(i: int, step: int) -> str:
+            while 0 <= i < len(lines) and not lines[i].strip():
+                i += step
+            return lines[i].strip() if 0 <= i < len(lines) else ""
+
+        anchors[a.claim_id] = {
+            "memo_path": a.memo_path,
+            "line_ref": a.new_line,
+            "claim_short": by_id[a.claim_id]["claim_short"],
+            "text": lines[a.new_line - 1].strip(),
+            "before": nonblank(a.new_line - 2, -1),
+            "after": nonblank(a.new_line, 1),
+        }
+    path.write_text(json.dumps(dict(sorted(anchors.items())), indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--write", action="store_true", help="Rewrite line_ref and the anchors file")
+    mode.add_argument("--check", action="store_true", help="Exit 1 if any line_ref is stale or unresolved")
+    mode.add_argument("--pin", action="append", metavar="CLAIM=LINE", help="Set and anchor a claim's line by hand")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    rows = load_matrix()
+    anchors = load_anchors()
+    if args.pin:
+        by_id = {row["claim_id"]: row for row in rows}
+        pinned = []
+        for spec in args.pin:
+            claim_id, _, line = spec.partition("=")
+            if claim_id not in by_id or not line.isdigit():
+                parser.error(f"--pin expects CLAIM=LINE for a claim in the matrix, got {spec!r}")
+            row = by_id[claim_id]
+            old = int(row["line_ref"])
+            status = "ok" if int(line) == old else "moved"
+            pinned.append(Anchor(claim_id, row["memo_path"], old, int(line), 1.0, 0.0, status))
+        changed = write_line_refs(pinned)
+        write_anchors(rows, pinned, anchors)
+        for a in pinned:
+            print(f"{a.claim_id}: {a.memo_path}:{a.new_line} (was {a.old_line})")
+        print(f"Rewrote {changed} line_ref values; anchors in {ANCHORS_PATH.relative_to(ROOT)}")
+        return 0
+    results = reanchor(rows, anchors, ShingleIndex.open())
+    elapsed = (time.perf_counter() - start) * 1000
+
+    print(f"{'claim':<8} {'memo':<52} {'old':>5} {'new':>5} {'score':>6}  status")
+    for a in results:
+        new = "-" if a.new_line is None else str(a.new_line)
+        print(f"{a.claim_id:<8} {a.memo_path:<52} {a.old_line:>5} {new:>5} {a.score:>6.2f}  {a.status}")
+    counts = {s: sum(a.status == s for a in results) for s in ("ok", "moved", "ambiguous", "unresolved", "missing")}
+    print(", ".join(f"{n} {s}" for s, n in counts.items() if n) + f" ({len(results)} claims, {elapsed:.0f} ms)")
+
+    if args.write:
+        changed = write_line_refs(results)
+        write_anchors(rows, results, anchors)
+        print(f"Rewrote {changed} line_ref values in {MATRIX_PATH.relative_to(ROOT)}; "
+              f"anchors in {ANCHORS_PATH.relative_to(ROOT)}")
+    if args.check:
+        stale = [a for a in results if a.status != "ok"]
+        return 1 if stale else 0
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
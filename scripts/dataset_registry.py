@@ -0,0 +1,237 @@
+"""
+Registry of the CSV datasets in data/, with a typed binary cache.
+
+Every data/*.csv is registered under its file stem. Governed datasets (the
+ones scripts/check_governance_refresh.py checks) must carry the
+REQUIRED_METADATA_COLUMNS.
+
+load_dataset() parses a CSV once and keeps a pickled copy of the typed frame in
+.cache/datasets/<name>.pkl, keyed by the CSV's stat and sha256. Later loads
+(in any process) unpickle that copy instead of re-parsing text: an unchanged
+stat is trusted without reading the CSV, a changed stat with the same hash
+(touch, checkout, copy) re-stamps the cache, and a changed hash re-parses and
+re-caches. As in check_governance_refresh.GovernanceState, a stamp recorded
+within MTIME_SLACK_NS of the file's mtime is not trusted on stat alone. Within a process frames are memoized and
+handed out as shallow copies, which pandas copy-on-write keeps independent
+without copying data. Pickle is used rather than Parquet/Feather because
+pyarrow is not a dependency; the cache is local and rebuilt from the CSVs.
+
+write_dataset() writes a registered CSV and drops its cached copy, so the
+next load reflects exactly what is on disk.
+
+Usage:
+    from dataset_registry import load_dataset
+    df = load_dataset("category_company_map")
+
+    uv run python scripts/dataset_registry.py              # list datasets
+    uv run python scripts/dataset_registry.py --validate   # governance metadata check
+    uv run python scripts/dataset_registry.py --warm       # build every cache
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import pickle
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from check_governance_refresh import GOVERNED_CSVS, REQUIRED_METADATA_COLUMNS, GovernanceState
+
+
+ROOT = Path(__file__).resolve().parent.parent
+DATA_DIR = ROOT / "data"
+CACHE_DIR = ROOT / ".cache" / "datasets"
+CACHE_VERSION = 2
+# A stat stamp recorded this close to the file's mtime may predate a second write in the same tick.
+MTIME_SLACK_NS = GovernanceState.MTIME_SLACK_NS
+
+# pd.read_csv keyword overrides for datasets that need them.
+READ_OPTIONS: dict[str, dict] = {
+    "x402_daily_tx_reconstructed": {"parse_dates": ["date"]},
+}
+
+
+@dataclass(frozen=True)
+class Dataset:
+    name: str
+    path: str  # repo-relative
+    governed: bool = False
+    read_options: dict = field(default_factory=dict)
+
+    @property
+    def abspath(self) -> Path:
+        return ROOT / self.path
+
+
+def _discover() -> dict[str, Dataset]:
+    governed = set(GOVERNED_CSVS)
+    datasets = {}
+    for path in sorted(DATA_DIR.glob("*.csv")):
+        rel = path.relative_to(ROOT).as_posix()
+        datasets[path.stem] = Dataset(
+            name=path.stem,
+            path=rel,
+            governed=rel in governed,
+            read_options=READ_OPTIONS.get(path.stem, {}),
+        )
+    return datasets
+
+
+DATASETS: dict[str, Dataset] = _discover()
+
+# name -> ((mtime_ns, size), recorded_ns, frame) for this process.
+_MEMO: dict[str, tuple[tuple[int, int], int, pd.DataFrame]] = {}
+
+
+def register_dataset(name: str) -> Dataset:
+    """Register data/<name>.csv, which may not exist yet (a generated dataset)."""
+    path = (DATA_DIR / f"{name}.csv").relative_to(ROOT).as_posix()
+    dataset = Dataset(
+        name=name, path=path, governed=path in GOVERNED_CSVS, read_options=READ_OPTIONS.get(name, {})
+    )
+    DATASETS[name] = dataset
+    return dataset
+
+
+def get_dataset(name: str) -> Dataset:
+    try:
+        return DATASETS[name]
+    except KeyError:
+        raise KeyError(f"unknown dataset {name!r}; known: {', '.join(DATASETS)}") from None
+
+
+def _sha256(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _cache_path(name: str) -> Path:
+    return CACHE_DIR / f"{name}.pkl"
+
+
+def _trusted(stamp: tuple[int, int], recorded_ns: int, current: tuple[int, int]) -> bool:
+    """True if a stamp matches the file and was recorded well after its mtime."""
+    return stamp == current and recorded_ns - stamp[0] > MTIME_SLACK_NS
+
+
+def _read_cache(name: str, stamp: tuple[int, int], path: Path) -> pd.DataFrame | None:
+    """Cached frame if it was built from the CSV as it is now; checks stat, then hash."""
+    cache = _cache_path(name)
+    if not cache.exists():
+        return None
+    try:
+        with cache.open("rb") as f:
+            meta = pickle.load(f)
+            if meta.get("version") != CACHE_VERSION:
+                return None
+            if _trusted(tuple(meta["stamp"]), meta["recorded_ns"], stamp):
+                return pickle.load(f)
+            sha = _sha256(path)
+            if meta["sha256"] != sha:
+                return None
+            frame = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, KeyError, AttributeError):
+        return None
+    # Same content under a new stat: re-stamp so later loads take the stat fast path again.
+    _write_cache(name, stamp, sha, frame)
+    return frame
+
+
+def _write_cache(name: str, stamp: tuple[int, int], sha256: str, frame: pd.DataFrame) -> None:
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    cache = _cache_path(name)
+    tmp = cache.with_suffix(".tmp")
+    meta = {"version": CACHE_VERSION, "stamp": list(stamp), "sha256": sha256, "recorded_ns": time.time_ns()}
+    with tmp.open("wb") as f:
+        pickle.dump(meta, f, protocol=pickle.HIGHEST_PROTOCOL)
+        pickle.dump(frame, f, protocol=pickle.HIGHEST_PROTOCOL)
+    tmp.replace(cache)
+
+
+def load_dataset(name: str, use_cache: bool = True) -> pd.DataFrame:
+    """Typed frame for a registered dataset; parses the CSV only when it changed."""
+    dataset = get_dataset(name)
+    path = dataset.abspath
+    st = path.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+
+    memo = _MEMO.get(name)
+    if use_cache and memo is not None and _trusted(memo[0], memo[1], stamp):
+        return memo[2].copy(deep=False)
+
+    frame = _read_cache(name, stamp, path) if use_cache else None
+    if frame is None:
+        frame = pd.read_csv(path, **dataset.read_options)
+        if use_cache:
+            _write_cache(name, stamp, _sha256(path), frame)
+    if use_cache:
+        _MEMO[name] = (stamp, time.time_ns(), frame)
+    return frame.copy(deep=False)
+
+
+def write_dataset(name: str, frame: pd.DataFrame, **to_csv_kwargs) -> Path:
+    """Write a registered dataset's CSV (index=False by default) and drop its cached copy."""
+    dataset = get_dataset(name)
+    to_csv_kwargs.setdefault("index", False)
+    frame.to_csv(dataset.abspath, **to_csv_kwargs)
+    _MEMO.pop(name, None)
+    _cache_path(name).unlink(missing_ok=True)
+    return dataset.abspath
+
+
+def dataset_schema(name: str) -> dict[str, str]:
+    """Column -> dtype of the loaded frame."""
+    return {col: str(dtype) for col, dtype in load_dataset(name).dtypes.items()}
+
+
+def validate_dataset(name: str) -> list[str]:
+    """Problems with a dataset's governance metadata (governed datasets only)."""
+    dataset = get_dataset(name)
+    if not dataset.governed:
+        return []
+    missing = sorted(REQUIRED_METADATA_COLUMNS - set(load_dataset(name).columns))
+    return [f"{dataset.path} missing metadata columns: {', '.join(missing)}"] if missing else []
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--validate", action="store_true", help="Exit 1 if a governed dataset lacks metadata columns")
+    parser.add_argument("--warm", action="store_true", help="Parse every CSV and (re)build its binary cache")
+    args = parser.parse_args()
+
+    problems: list[str] = []
+    print(f"{'dataset':<58} {'rows':>5} {'cols':>5}  {'meta':>4}  {'parse ms':>8} {'cache ms':>8}")
+    print("-" * 98)
+    for name, dataset in DATASETS.items():
+        if args.warm:
+            _cache_path(name).unlink(missing_ok=True)
+        start = time.perf_counter()
+        pd.read_csv(dataset.abspath, **dataset.read_options)
+        parse_ms = (time.perf_counter() - start) * 1000
+        load_dataset(name)  # ensure the binary copy exists
+        _MEMO.pop(name, None)
+        start = time.perf_counter()
+        df = load_dataset(name)
+        cache_ms = (time.perf_counter() - start) * 1000
+
+        meta = len(REQUIRED_METADATA_COLUMNS & set(df.columns))
+        flag = "*" if dataset.governed else " "
+        print(f"{flag}{name:<57} {len(df):>5} {df.shape[1]:>5}  {meta:>2}/{len(REQUIRED_METADATA_COLUMNS)}"
+              f"  {parse_ms:>8.2f} {cache_ms:>8.2f}")
+        if args.validate:
+            problems.extend(validate_dataset(name))
+    print("\n* governed (must carry all metadata columns)")
+
+    for msg in problems:
+        print(f"FAIL: {msg}")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,475 @@
+"""
+Dependency graph between data objects, input files, generator jobs and outputs.
+
+Nodes:
+  - code:  a top-level object in a repo module, e.g. data/x402_data.py:CHAIN_DATA
+           or scripts/generate_charts.py:CATEGORIES,
+  - file:  a non-Python file read or written by a job (CSV, PNG),
+  - job:   a registered generator job (scripts/chart_registry.py), job:<name>.
+
+Edges (inputs -> job -> outputs) come from three places, recorded per edge:
+  - static:   chart_fingerprint.trace_sources() for code objects (the same
+              trace build_charts.py fingerprints and --watch uses, so
+              `affected` and `deps` agree with what a build reruns); path literals
+              passed to read_csv/open/read_text (reads) and savefig/to_csv/
+              write_text (writes), resolved through local and module-level
+              assignments such as OUT_DIR / "chart.png",
+  - declared: ChartJob.inputs / ChartJob.outputs,
+  - runtime:  (--trace) every job is run in a child interpreter with open()
+              instrumented; files under the repo it reads or writes are
+              recorded and writes are redirected to a temp directory, so the
+              tree is not modified.
+
+The graph is saved to .cache/dependency_graph.json together with the stat of
+every source it was built from. Queries rebuild the static part when sources
+changed and keep the last runtime trace.
+
+Usage:
+    uv run python scripts/dependency_graph.py build [--trace]
+    uv run python scripts/dependency_graph.py affected data/x402_data.py:CHAIN_DATA
+    uv run python scripts/dependency_graph.py affected data/category_company_map.csv --names
+    uv run python scripts/dependency_graph.py deps charts/fintech/fintech_funding_by_category.png
+    uv run python scripts/dependency_graph.py dot > deps.dot
+
+    # minimal rebuild after an edit:
+    uv run python scripts/build_charts.py --force $(uv run python scripts/dependency_graph.py affected data/x402_data.py --names)
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import builtins
+import fnmatch
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from collections import deque
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from chart_fingerprint import MODULE_SETUP, index_module, trace_sources
+from chart_registry import CHART_JOBS, ROOT, ChartJob
+
+
+GRAPH_PATH = ROOT / ".cache" / "dependency_graph.json"
+GRAPH_VERSION = 2
+SOURCE_GLOBS = ("*.py", "scripts/*.py", "data/*.py")
+
+READ_CALLS = {"read_csv", "read_json", "read_excel", "read_parquet", "loadtxt", "genfromtxt"}
+WRITE_CALLS = {"savefig", "to_csv", "to_json", "to_excel", "to_parquet", "imsave"}
+PATH_READS = {"read_text", "read_bytes"}
+PATH_WRITES = {"write_text", "write_bytes"}
+FILE_SUFFIXES = (".csv", ".png", ".json", ".txt", ".md", ".svg", ".pdf", ".parquet")
+
+
+# =============================================================================
+# Graph
+# =============================================================================
+
+class DependencyGraph:
+    """Directed graph with typed nodes and edges labelled by how they were found."""
+
+    def __init__(self) -> None:
+        self.nodes: dict[str, str] = {}
+        self.edges: dict[tuple[str, str], set[str]] = {}
+
+    def add_edge(self, src: str, dst: str, via: str) -> None:
+        for node in (src, dst):
+            self.nodes.setdefault(node, _kind(node))
+        self.edges.setdefault((src, dst), set()).add(via)
+
+    def drop_via(self, via: str) -> None:
+        for key in list(self.edges):
+            self.edges[key].discard(via)
+            if not self.edges[key]:
+                del self.edges[key]
+        used = {n for edge in self.edges for n in edge}
+        self.nodes = {n: k for n, k in self.nodes.items() if n in used}
+
+    def _adjacency(self, reverse: bool) -> dict[str, list[str]]:
+        adj: dict[str, list[str]] = {}
+        for src, dst in self.edges:
+            a, b = (dst, src) if reverse else (src, dst)
+            adj.setdefault(a, []).append(b)
+        return adj
+
+    def reachable(self, seeds: list[str], reverse: bool = False) -> list[str]:
+        """Nodes reachable from seeds (downstream, or upstream with reverse=True), BFS order."""
+        adj = self._adjacency(reverse)
+        seen = set(seeds)
+        order: list[str] = []
+        queue = deque(seeds)
+        while queue:
+            node = queue.popleft()
+            for nxt in sorted(adj.get(node, ())):
+                if nxt not in seen:
+                    seen.add(nxt)
+                    order.append(nxt)
+                    queue.append(nxt)
+        return order
+
+    def match(self, query: str) -> list[str]:
+        """Resolve a node id, job name, file path (all of its code objects) or glob."""
+        if query in self.nodes:
+            return [query]
+        if f"job:{query}" in self.nodes:
+            return [f"job:{query}"]
+        rel = query.rstrip("/")
+        prefix = [n for n in self.nodes if n.startswith(f"{rel}:")]
+        if prefix:
+            return sorted(prefix)
+        return sorted(n for n in self.nodes if fnmatch.fnmatch(n, query) or fnmatch.fnmatch(n, f"job:{query}"))
+
+    def to_json(self, sources: dict[str, list[int]], traced_utc: str | None) -> dict:
+        return {
+            "version": GRAPH_VERSION,
+            "created_utc": _now(),
+            "traced_utc": traced_utc,
+            "sources": sources,
+            "nodes": dict(sorted(self.nodes.items())),
+            "edges": sorted([src, dst, sorted(via)] for (src, dst), via in self.edges.items()),
+        }
+
+    @classmethod
+    def from_json(cls, payload: dict) -> DependencyGraph:
+        graph = cls()
+        graph.nodes = dict(payload["nodes"])
+        for src, dst, via in payload["edges"]:
+            graph.edges[(src, dst)] = set(via)
+        return graph
+
+    def to_dot(self) -> str:
+        shapes = {"code": "note", "file": "box", "job": "ellipse"}
+        lines = ["digraph dependencies {", "  rankdir=LR;"]
+        for node, kind in sorted(self.nodes.items()):
+            lines.append(f'  "{node}" [shape={shapes[kind]}];')
+        for (src, dst), via in sorted(self.edges.items()):
+            style = "" if "static" in via or "declared" in via else " [style=dashed]"
+            lines.append(f'  "{src}" -> "{dst}"{style};')
+        lines.append("}")
+        return "\n".join(lines)
+
+
+def _kind(node: str) -> str:
+    if node.startswith("job:"):
+        return "job"
+    return "code" if ".py:" in node else "file"
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+# =============================================================================
+# Static extraction
+# =============================================================================
+
+def _eval_path(expr: ast.expr, local: dict[str, ast.expr], index, depth: int = 0) -> str | None:
+    """Best-effort string value of a path expression; unknown bases (ROOT) become ''."""
+    if depth > 8:
+        return None
+    if isinstance(expr, ast.Constant) and isinstance(expr.value, str):
+        return expr.value
+    if isinstance(expr, ast.BinOp) and isinstance(expr.op, ast.Div):
+        left = _eval_path(expr.left, local, index, depth + 1)
+        right = _eval_path(expr.right, local, index, depth + 1)
+        if right is None:
+            return None
+        return f"{left}/{right}" if left else right
+    if isinstance(expr, ast.Call) and expr.args and isinstance(expr.func, ast.Name) and expr.func.id in ("str", "Path"):
+        return _eval_path(expr.args[0], local, index, depth + 1)
+    if isinstance(expr, ast.Name):
+        value = local.get(expr.id)
+        if value is None:
+            stmts = index.bindings.get(expr.id, [])
+            assigns = [s for s in stmts if isinstance(s, ast.Assign) and len(s.targets) == 1]
+            value = assigns[0].value if assigns else None
+        return _eval_path(value, local, index, depth + 1) if value is not None else ""
+    return None
+
+
+def _resolve_file(value: str | None) -> str | None:
+    """Map an evaluated path string to a repo-relative file path."""
+    if not value or not value.endswith(FILE_SUFFIXES):
+        return None
+    rel = value.lstrip("/")
+    if (ROOT / rel).exists():
+        return rel
+    matches = [p for p in ROOT.glob(f"**/{Path(rel).name}") if ".cache" not in p.parts and ".git" not in p.parts]
+    return matches[0].relative_to(ROOT).as_posix() if len(matches) == 1 else rel
+
+
+def static_io(module_path: Path, stmts: list[ast.stmt]) -> tuple[set[str], set[str]]:
+    """(reads, writes) of repo files referenced by path literals in the given statements."""
+    index = index_module(module_path)
+    reads: set[str] = set()
+    writes: set[str] = set()
+    for stmt in stmts:
+        local: dict[str, ast.expr] = {}
+        for node in ast.walk(stmt):
+            if isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+                local[node.targets[0].id] = node.value
+        for node in ast.walk(stmt):
+            if not isinstance(node, ast.Call):
+                continue
+            func = node.func
+            name = func.attr if isinstance(func, ast.Attribute) else func.id if isinstance(func, ast.Name) else ""
+            target: ast.expr | None = None
+            sink: set[str] | None = None
+            if name in PATH_READS | PATH_WRITES and isinstance(func, ast.Attribute):
+                target, sink = func.value, reads if name in PATH_READS else writes
+            elif name in READ_CALLS | WRITE_CALLS and node.args:
+                target, sink = node.args[0], reads if name in READ_CALLS else writes
+            elif name == "open" and node.args:
+                mode = node.args[1] if len(node.args) > 1 else next(
+                    (k.value for k in node.keywords if k.arg == "mode"), None
+                )
+                writing = isinstance(mode, ast.Constant) and any(c in str(mode.value) for c in "wax")
+                target, sink = node.args[0], writes if writing else reads
+            if target is None:
+                continue
+            rel = _resolve_file(_eval_path(target, local, index))
+            if rel:
+                sink.add(rel)
+    return reads, writes
+
+
+def _job_node(job: ChartJob) -> str:
+    return f"job:{job.name}"
+
+
+def build_static(jobs: list[ChartJob] | None = None) -> DependencyGraph:
+    graph = DependencyGraph()
+    for job in jobs or CHART_JOBS:
+        node = _job_node(job)
+        graph.nodes[node] = "job"
+        roots = None if job.func is None else [job.func]
+        for label, stmts in trace_sources(ROOT / job.script, roots).items():
+            # Import bindings are not objects; local import targets get their own label.
+            is_import = all(isinstance(s, (ast.Import, ast.ImportFrom)) for s in stmts)
+            if not label.endswith(f":{MODULE_SETUP}") and not is_import:
+                graph.add_edge(label, node, "static")
+                # A lazy frame's label also hashes its row list (CHAIN_DATA <- _CHAIN_DATA_ROWS).
+                module = label.rsplit(":", 1)[0]
+                for name, bound in index_module(ROOT / module).bindings.items():
+                    if any(b in stmts for b in bound):
+                        graph.add_edge(f"{module}:{name}", node, "static")
+            reads, writes = static_io(ROOT / label.rsplit(":", 1)[0], stmts)
+            for rel in reads:
+                graph.add_edge(rel, node, "static")
+            for rel in writes:
+                graph.add_edge(node, rel, "static")
+        for rel in job.inputs:
+            graph.add_edge(rel, node, "declared")
+        for rel in job.outputs:
+            graph.add_edge(node, rel, "declared")
+    return graph
+
+
+def source_stamps(jobs: list[ChartJob] | None = None) -> dict[str, list[int]]:
+    paths = {p for pattern in SOURCE_GLOBS for p in ROOT.glob(pattern)}
+    paths.update(ROOT / rel for job in jobs or CHART_JOBS for rel in job.inputs)
+    stamps = {}
+    for path in sorted(paths):
+        if path.exists():
+            st = path.stat()
+            stamps[path.relative_to(ROOT).as_posix()] = [st.st_mtime_ns, st.st_size]
+    return stamps
+
+
+# =============================================================================
+# Runtime tracing
+# =============================================================================
+
+def _trace_script(script: str) -> dict[str, dict[str, list[str]]]:
+    """Child-process body: run every job of a script with open() instrumented."""
+    os.environ["MPLBACKEND"] = "Agg"
+    from chart_registry import run_job
+
+    tmp = Path(tempfile.mkdtemp(prefix="dep-trace-"))
+    current: dict[str, set[str]] = {"reads": set(), "writes": set()}
+    real_open = builtins.open
+
+    def traced_open(file, mode="r", *args, **kwargs):
+        if isinstance(file, (str, os.PathLike)):
+            path = Path(os.fspath(file)).resolve()
+            if ROOT in path.parents and ".cache" not in path.parts and path.suffix != ".py":
+                rel = path.relative_to(ROOT).as_posix()
+                if any(c in mode for c in "wax+"):
+                    current["writes"].add(rel)
+                    file = tmp / rel.replace("/", "__")
+                else:
+                    current["reads"].add(rel)
+        return real_open(file, mode, *args, **kwargs)
+
+    builtins.open = io.open = traced_open
+    results = {}
+    try:
+        for job in (j for j in CHART_JOBS if j.script == script):
+            current["reads"], current["writes"] = set(), set()
+            try:
+                run_job(job)
+                error = None
+            except Exception as exc:  # recorded, not fatal: static edges remain
+                error = f"{type(exc).__name__}: {exc}"
+            results[job.name] = {
+                "reads": sorted(current["reads"]),
+                "writes": sorted(current["writes"]),
+                "error": error,
+            }
+    finally:
+        builtins.open = io.open = real_open
+        for f in tmp.iterdir():
+            f.unlink()
+        tmp.rmdir()
+    return results
+
+
+def trace_runtime(graph: DependencyGraph, jobs: list[ChartJob] | None = None) -> list[str]:
+    """Add runtime edges for every job; returns error lines."""
+    graph.drop_via("runtime")
+    errors = []
+    for script in dict.fromkeys(job.script for job in jobs or CHART_JOBS):
+        proc = subprocess.run(
+            [sys.executable, __file__, "--trace-child", script], capture_output=True, text=True, cwd=ROOT
+        )
+        if proc.returncode != 0:
+            errors.append(f"{script}: {(proc.stderr or proc.stdout).strip().splitlines()[-1:]}")
+            continue
+        for name, io_ in json.loads(proc.stdout.strip().splitlines()[-1]).items():
+            node = f"job:{name}"
+            for rel in io_["reads"]:
+                graph.add_edge(rel, node, "runtime")
+            for rel in io_["writes"]:
+                graph.add_edge(node, rel, "runtime")
+            if io_["error"]:
+                errors.append(f"{name}: {io_['error']}")
+    return errors
+
+
+# =============================================================================
+# Persistence
+# =============================================================================
+
+def save_graph(graph: DependencyGraph, path: Path, traced_utc: str | None) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(graph.to_json(source_stamps(), traced_utc), indent=1) + "\n", encoding="utf-8")
+    tmp.replace(path)
+
+
+def load_graph(path: Path = GRAPH_PATH) -> tuple[DependencyGraph, str | None]:
+    """Persisted graph, with its static part rebuilt when any source changed since."""
+    payload = None
+    if path.exists():
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        if payload.get("version") != GRAPH_VERSION:
+            payload = None
+    if payload is not None and payload["sources"] == source_stamps():
+        return DependencyGraph.from_json(payload), payload.get("traced_utc")
+
+    graph = build_static()
+    traced_utc = None
+    if payload is not None and payload.get("traced_utc"):
+        old = DependencyGraph.from_json(payload)
+        for (src, dst), via in old.edges.items():
+            if "runtime" in via:
+                graph.add_edge(src, dst, "runtime")
+        traced_utc = payload["traced_utc"]
+    save_graph(graph, path, traced_utc)
+    return graph, traced_utc
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def _print_nodes(title: str, graph: DependencyGraph, nodes: list[str]) -> None:
+    for kind, label in (("job", "jobs"), ("file", "files"), ("code", "code objects")):
+        group = [n for n in nodes if graph.nodes.get(n) == kind]
+        if group:
+            print(f"{title} {label} ({len(group)}):")
+            for node in group:
+                print(f"  {node.removeprefix('job:')}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--graph", type=Path, default=GRAPH_PATH, help="Persisted graph path")
+    parser.add_argument("--trace-child", help=argparse.SUPPRESS)
+    sub = parser.add_subparsers(dest="command")
+
+    p_build = sub.add_parser("build", help="Rebuild and save the graph")
+    p_build.add_argument("--trace", action="store_true", help="Also run every job to record runtime file I/O")
+
+    p_aff = sub.add_parser("affected", help="What rebuilds if these change")
+    p_aff.add_argument("targets", nargs="+", help="Node ids (data/x402_data.py:CHAIN_DATA), files, globs")
+    p_aff.add_argument("--names", action="store_true", help="Print affected job names only (for build_charts.py)")
+
+    p_deps = sub.add_parser("deps", help="Everything a job or output depends on")
+    p_deps.add_argument("targets", nargs="+", help="Job names, output paths or globs")
+
+    sub.add_parser("dot", help="Print the graph in Graphviz dot format")
+    args = parser.parse_args()
+
+    if args.trace_child:
+        print(json.dumps(_trace_script(args.trace_child)))
+        return 0
+    if args.command is None:
+        parser.print_help()
+        return 1
+
+    if args.command == "build":
+        graph = build_static()
+        traced_utc = None
+        if args.trace:
+            print(f"Tracing {len(CHART_JOBS)} job(s)...")
+            for line in trace_runtime(graph):
+                print(f"  warning: {line}")
+            traced_utc = _now()
+        save_graph(graph, args.graph, traced_utc)
+        counts = {k: sum(v == k for v in graph.nodes.values()) for k in ("code", "file", "job")}
+        print(f"{counts['job']} jobs, {counts['file']} files, {counts['code']} code objects, "
+              f"{len(graph.edges)} edges -> {args.graph}")
+        return 0
+
+    graph, traced_utc = load_graph(args.graph)
+    if args.command == "dot":
+        print(graph.to_dot())
+        return 0
+
+    seeds: list[str] = []
+    for target in args.targets:
+        found = graph.match(target)
+        if not found:
+            print(f"No node matches {target!r}")
+            return 1
+        seeds.extend(found)
+
+    if args.command == "affected":
+        nodes = graph.reachable(seeds)
+        jobs = [job.name for job in CHART_JOBS if f"job:{job.name}" in nodes]
+        if args.names:
+            print(" ".join(jobs))
+            return 0
+        shown = ", ".join(seeds[:5]) + (f" (+{len(seeds) - 5} more)" if len(seeds) > 5 else "")
+        print(f"Changing {shown}")
+        _print_nodes("rebuilds", graph, [f"job:{j}" for j in jobs])
+        _print_nodes("rewrites", graph, [n for n in nodes if graph.nodes[n] == "file"])
+    else:
+        nodes = graph.reachable(seeds, reverse=True)
+        print(f"{', '.join(s.removeprefix('job:') for s in seeds)} depends on")
+        _print_nodes("upstream", graph, nodes)
+    if traced_utc is None:
+        print("(static graph only; run `build --trace` to add runtime file I/O)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -17,6 +17,9 @@ import matplotlib.ticker as ticker
 import numpy as np
 from x402_data import DAILY_TX_MILESTONES, CUMULATIVE_TX
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from x402_daily_reconstruction import daily_tx_series
+
 # ---------------------------------------------------------------------------
 # Global style
 # ---------------------------------------------------------------------------
@@ -49,15 +52,18 @@ def build_chart_1():
     fig, ax = plt.subplots(figsize=(16, 9), dpi=150)
     fig.patch.set_facecolor(BG)
 
-    dates = DAILY_TX_MILESTONES["date"]
-    txs = DAILY_TX_MILESTONES["daily_tx"]
-
-    ax.plot(dates, txs, color=CYAN, linewidth=2.4, marker="o", markersize=7,
-            markerfacecolor="white", markeredgecolor=CYAN, markeredgewidth=1.5,
-            zorder=5)
+    # Continuous series reconstructed from the milestones and cumulative totals
+    daily = daily_tx_series()
+    ax.plot(daily["date"], daily["daily_tx"], color=CYAN, linewidth=2.4, zorder=4,
+            label="Reconstructed daily series")
 
     # Fill area under curve for visual weight
-    ax.fill_between(dates, txs, alpha=0.08, color=CYAN)
+    ax.fill_between(daily["date"], daily["daily_tx"], alpha=0.08, color=CYAN)
+
+    ax.plot(DAILY_TX_MILESTONES["date"], DAILY_TX_MILESTONES["daily_tx"],
+            linestyle="none", marker="o", markersize=7, markerfacecolor="white",
+            markeredgecolor=CYAN, markeredgewidth=1.5, zorder=5,
+            label="Reported / estimated milestones")
 
     ax.set_yscale("log")
     style_ax(ax,
@@ -106,7 +112,9 @@ def build_chart_1():
             bbox=dict(boxstyle="round,pad=0.3", fc=BG, ec=CYAN, alpha=0.85),
         )
 
-    ax.set_ylim(bottom=30)
+    ax.legend(loc="upper left", fontsize=12,
+              facecolor=BG, edgecolor=GRID_COLOR, labelcolor="white")
+    ax.set_ylim(30, DAILY_TX_MILESTONES["daily_tx"].max() * 4)  # headroom for the ATH label
     fig.tight_layout()
     fig.savefig(str(ROOT / "charts/x402/x402_01_daily_tx_trajectory.png"),
                 facecolor=fig.get_facecolor(), edgecolor="none")
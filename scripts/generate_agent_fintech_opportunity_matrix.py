@@ -242,9 +242,13 @@ def plot_chart(df: pd.DataFrame) -> Path:
     return out
 
 
-if __name__ == "__main__":
+def main() -> None:
     print("Generating agent-fintech startup opportunity matrix...")
     matrix = build_matrix()
     write_csv(matrix)
     plot_chart(matrix)
     print("Done.")
+
+
+if __name__ == "__main__":
+    main()
@@ -12,7 +12,8 @@ from pathlib import Path
 import textwrap
 
 import matplotlib.pyplot as plt
-import pandas as pd
+
+from dataset_registry import load_dataset
 
 
 def _wrap_company_list(raw: str, width: int = 48) -> str:
@@ -23,12 +24,11 @@ def _wrap_company_list(raw: str, width: int = 48) -> str:
 
 def generate_chart():
     root = Path(__file__).resolve().parent.parent
-    csv_path = root / "data" / "category_company_map.csv"
     out_dir = root / "charts" / "fintech"
     out_dir.mkdir(parents=True, exist_ok=True)
     out_path = out_dir / "fintech_category_company_map.png"
 
-    df = pd.read_csv(csv_path)
+    df = load_dataset("category_company_map")
 
     # Keep display order as defined in CSV.
     rows = []
@@ -509,7 +509,7 @@ def plot_type_group_mix_chart(type_mix_df: pd.DataFrame) -> None:
     print(f"Saved: {out_path}")
 
 
-if __name__ == "__main__":
+def main() -> None:
     print("Generating fintech cohort outcome split artifacts...")
     cohort_df = build_cohort_dataframe()
     type_mix_df = build_type_group_mix_dataframe(cohort_df)
@@ -517,3 +517,7 @@ if __name__ == "__main__":
     plot_chart(cohort_df)
     plot_type_group_mix_chart(type_mix_df)
     print("Done.")
+
+
+if __name__ == "__main__":
+    main()
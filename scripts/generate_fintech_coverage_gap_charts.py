@@ -278,7 +278,7 @@ def write_csv(df: pd.DataFrame, path: Path) -> None:
     print(f"Saved: {path}")
 
 
-if __name__ == "__main__":
+def main() -> None:
     print("Generating fintech coverage-gap datasets and charts...")
 
     geo = with_metadata(
@@ -318,3 +318,7 @@ if __name__ == "__main__":
     chart_value_creation_vs_destruction(cases)
 
     print("Done.")
+
+
+if __name__ == "__main__":
+    main()
@@ -16,6 +16,9 @@ Method:
     1) category maturity (older/more scaled categories skew later-stage),
     2) market-cycle regime by year (mania years skew mega rounds; winter years
        skew seed/early).
+  The model is evaluated as one categories x years x stages NumPy tensor;
+  stage_funding_tensor() takes batches of alternative maturity/step/multiplier
+  assumptions along leading axes.
 """
 
 from pathlib import Path
@@ -36,7 +39,7 @@ LAST_VERIFIED_UTC = "2026-02-09T18:41:00Z"
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from data.fintech_funding_data import FUNDING_BY_CATEGORY, YEARS
+from data.fintech_funding_data import CATEGORIES, YEARS, funding_matrix
 
 
 STAGES = [
@@ -88,39 +91,84 @@ YEAR_STAGE_MULTIPLIERS = {
 }
 
 
-def _category_maturity_score(category: str, year: int) -> float:
-    """Compute category maturity score in [0.05, 0.95]."""
-    base = CATEGORY_MATURITY_2015.get(category, 0.30)
-    maturity = base + ANNUAL_MATURITY_STEP * (year - min(YEARS))
-    return float(np.clip(maturity, 0.05, 0.95))
+# Baseline stage share = intercept + slope * maturity, in STAGES order.
+# At low maturity: more seed/early. At high maturity: more late/growth.
+# Seed 30% -> 8%, Early 45% -> 27%, Late 20% -> 40%, Growth 5% -> 25%.
+STAGE_INTERCEPTS = np.array([0.30, 0.45, 0.20, 0.05])
+STAGE_SLOPES = np.array([-0.22, -0.18, 0.20, 0.20])
+MATURITY_BOUNDS = (0.05, 0.95)
 
 
-def _base_stage_split_from_maturity(maturity: float) -> dict[str, float]:
-    """
-    Convert maturity score to baseline stage share.
+def maturity_vector() -> np.ndarray:
+    """CATEGORY_MATURITY_2015 aligned with CATEGORIES (0.30 when unset)."""
+    return np.array([CATEGORY_MATURITY_2015.get(c, 0.30) for c in CATEGORIES])
+
+
+def multiplier_matrix() -> np.ndarray:
+    """YEAR_STAGE_MULTIPLIERS as a years x stages array."""
+    return np.array([[YEAR_STAGE_MULTIPLIERS[y][s] for s in STAGES] for y in YEARS])
+
+
+def maturity_scores(
+    maturity_2015: np.ndarray, annual_step: float | np.ndarray = ANNUAL_MATURITY_STEP
+) -> np.ndarray:
+    """(..., categories) 2015 maturity -> (..., categories, years) clipped maturity scores."""
+    offsets = np.asarray(YEARS) - min(YEARS)
+    step = np.asarray(annual_step, dtype=float)[..., None, None]
+    return np.clip(np.asarray(maturity_2015)[..., :, None] + step * offsets, *MATURITY_BOUNDS)
 
-    At low maturity: more seed/early.
-    At high maturity: more late/growth.
-    """
-    split = {
-        "Seed / Pre-Seed": 0.30 - 0.22 * maturity,       # 30% -> 8%
-        "Early VC (Series A/B)": 0.45 - 0.18 * maturity,  # 45% -> 27%
-        "Late VC (Series C+)": 0.20 + 0.20 * maturity,    # 20% -> 40%
-        "Growth / Mega": 0.05 + 0.20 * maturity,          # 5%  -> 25%
-    }
-    total = sum(split.values())
-    return {k: v / total for k, v in split.items()}
 
+def _sum_stages(x: np.ndarray) -> np.ndarray:
+    """Left-to-right sum over the stage axis, keepdims (matches the scalar model bit for bit)."""
+    return ((x[..., 0] + x[..., 1]) + x[..., 2] + x[..., 3])[..., None]
 
-def _stage_split(category: str, year: int) -> dict[str, float]:
-    """Return normalized stage split for category-year after cycle adjustment."""
-    maturity = _category_maturity_score(category, year)
-    base_split = _base_stage_split_from_maturity(maturity)
-    multipliers = YEAR_STAGE_MULTIPLIERS[year]
 
-    adjusted = {stage: base_split[stage] * multipliers[stage] for stage in STAGES}
-    norm = sum(adjusted.values())
-    return {stage: adjusted[stage] / norm for stage in STAGES}
+def stage_share_tensor(maturity: np.ndarray, multipliers: np.ndarray) -> np.ndarray:
+    """
+    Normalized stage split after cycle adjustment.
+
+    maturity: (..., categories, years); multipliers: (..., years, stages).
+    Returns (..., categories, years, stages); leading axes broadcast, so a
+    batch of alternative assumptions is evaluated in one pass.
+    """
+    base = STAGE_INTERCEPTS + STAGE_SLOPES * maturity[..., None]
+    base = base / _sum_stages(base)
+    adjusted = base * np.asarray(multipliers)[..., None, :, :]
+    return adjusted / _sum_stages(adjusted)
+
+
+def stage_funding_tensor(
+    funding: np.ndarray,
+    maturity_2015: np.ndarray | None = None,
+    annual_step: float | np.ndarray = ANNUAL_MATURITY_STEP,
+    multipliers: np.ndarray | None = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Evaluate the stage model for funding shaped (..., categories, years).
+
+    Defaults to the module's point-estimate assumptions. Returns
+    (maturity, shares, stage_funding); shares are zero for empty category-years.
+    """
+    maturity_2015 = maturity_vector() if maturity_2015 is None else maturity_2015
+    multipliers = multiplier_matrix() if multipliers is None else multipliers
+    maturity = maturity_scores(maturity_2015, annual_step)
+    shares = stage_share_tensor(maturity, multipliers)
+    funding = np.asarray(funding, dtype=float)[..., None]
+    shares = np.where(funding > 0, shares, 0.0)
+    return maturity, shares, funding * shares
+
+
+def _compensated_sum(x: np.ndarray, axis: int) -> np.ndarray:
+    """Kahan sum along `axis`, in order; reproduces pandas groupby().sum() exactly."""
+    x = np.moveaxis(x, axis, 0)
+    total = np.zeros(x.shape[1:])
+    comp = np.zeros(x.shape[1:])
+    for value in x:
+        y = value - comp
+        t = total + y
+        comp = (t - total) - y
+        total = t
+    return total
 
 
 def _with_metadata(
@@ -142,31 +190,34 @@ def _with_metadata(
     return out
 
 
-def build_stage_dataframe() -> pd.DataFrame:
-    """Build year-category-stage funding dataset."""
-    rows: list[dict[str, float | int | str]] = []
-
-    for category, yearly in FUNDING_BY_CATEGORY.items():
-        for year in YEARS:
-            total_b = float(yearly.get(year, 0.0))
-            stage_share = _stage_split(category, year) if total_b > 0 else {s: 0.0 for s in STAGES}
-            maturity_score = _category_maturity_score(category, year)
+def build_stage_tensor() -> dict[str, np.ndarray]:
+    """Point-estimate stage model as rounded categories x years (x stages) arrays."""
+    funding = funding_matrix().T
+    maturity, shares, stage_funding = stage_funding_tensor(funding)
+    return {
+        "category_total_b": np.round(funding, 4),
+        "maturity_score": np.round(maturity, 3),
+        "stage_share_pct": np.round(shares * 100.0, 2),
+        "funding_b": np.round(stage_funding, 4),
+    }
 
-            for stage in STAGES:
-                share = stage_share[stage]
-                rows.append(
-                    {
-                        "year": year,
-                        "category": category,
-                        "stage": stage,
-                        "funding_b": round(total_b * share, 4),
-                        "stage_share_pct": round(share * 100.0, 2),
-                        "category_total_b": round(total_b, 4),
-                        "maturity_score": round(maturity_score, 3),
-                    }
-                )
 
-    return pd.DataFrame(rows)
+def build_stage_dataframe(tensor: dict[str, np.ndarray] | None = None) -> pd.DataFrame:
+    """Build year-category-stage funding dataset (long format, category-major)."""
+    tensor = build_stage_tensor() if tensor is None else tensor
+    n_cat, n_year, n_stage = tensor["funding_b"].shape
+    per_cell = (n_cat, n_year, n_stage)
+    return pd.DataFrame(
+        {
+            "year": np.broadcast_to(np.asarray(YEARS)[None, :, None], per_cell).ravel(),
+            "category": np.broadcast_to(np.asarray(CATEGORIES, dtype=object)[:, None, None], per_cell).ravel(),
+            "stage": np.broadcast_to(np.asarray(STAGES, dtype=object)[None, None, :], per_cell).ravel(),
+            "funding_b": tensor["funding_b"].ravel(),
+            "stage_share_pct": tensor["stage_share_pct"].ravel(),
+            "category_total_b": np.repeat(tensor["category_total_b"].ravel(), n_stage),
+            "maturity_score": np.repeat(tensor["maturity_score"].ravel(), n_stage),
+        }
+    )
 
 
 def chart_stage_over_time(df: pd.DataFrame) -> None:
@@ -406,7 +457,7 @@ def chart_stage_mix_latest_year(df: pd.DataFrame, year: int = 2025) -> None:
     print(f"Saved: {out}")
 
 
-def export_csvs(df: pd.DataFrame) -> None:
+def export_csvs(df: pd.DataFrame, tensor: dict[str, np.ndarray]) -> None:
     """Export detailed and summary stage datasets."""
     full_out = DATA_OUT / "fintech_funding_stage_year_category_estimated.csv"
     full_with_meta = _with_metadata(
@@ -417,23 +468,32 @@ def export_csvs(df: pd.DataFrame) -> None:
     full_with_meta.to_csv(full_out, index=False)
     print(f"Saved: {full_out}")
 
-    wide = (
-        df.pivot_table(
-            index=["year", "category", "category_total_b"],
-            columns="stage",
-            values="funding_b",
-            aggfunc="sum",
+    # Summary tables come straight from the categories x years x stages tensor,
+    # rows ordered by year then category name.
+    funding_b = tensor["funding_b"]
+    category_total_b = tensor["category_total_b"]
+    late_plus_growth_b = funding_b[..., STAGES.index("Late VC (Series C+)")] + funding_b[..., STAGES.index("Growth / Mega")]
+    late_stage_share_pct = (
+        np.divide(
+            late_plus_growth_b,
+            category_total_b,
+            out=np.zeros_like(category_total_b),
+            where=category_total_b > 0,
         )
-        .reset_index()
-        .rename_axis(None, axis=1)
-    )
-    wide["late_plus_growth_b"] = wide["Late VC (Series C+)"] + wide["Growth / Mega"]
-    wide["late_stage_share_pct"] = np.where(
-        wide["category_total_b"] > 0,
-        wide["late_plus_growth_b"] / wide["category_total_b"] * 100.0,
-        0.0,
+        * 100.0
     )
-    wide = wide.sort_values(["year", "category"])
+    by_name = np.argsort(CATEGORIES, kind="stable")
+    year_col = np.repeat(YEARS, len(CATEGORIES))
+    category_col = np.tile(np.asarray(CATEGORIES)[by_name], len(YEARS))
+
+    def year_major(values: np.ndarray) -> np.ndarray:
+        return values[by_name].T.ravel()
+
+    wide = pd.DataFrame({"year": year_col, "category": category_col, "category_total_b": year_major(category_total_b)})
+    for stage in sorted(STAGES):
+        wide[stage] = year_major(funding_b[..., STAGES.index(stage)])
+    wide["late_plus_growth_b"] = year_major(late_plus_growth_b)
+    wide["late_stage_share_pct"] = year_major(late_stage_share_pct)
     wide_out = DATA_OUT / "fintech_stage_breakdown_by_year_category_wide_estimated.csv"
     wide_with_meta = _with_metadata(
         wide,
@@ -443,10 +503,14 @@ def export_csvs(df: pd.DataFrame) -> None:
     wide_with_meta.to_csv(wide_out, index=False)
     print(f"Saved: {wide_out}")
 
-    stage_totals = (
-        df.groupby(["year", "stage"], as_index=False)["funding_b"]
-        .sum()
-        .sort_values(["year", "stage"])
+    stage_order = sorted(STAGES)
+    totals = _compensated_sum(funding_b, axis=0)  # years x stages
+    stage_totals = pd.DataFrame(
+        {
+            "year": np.repeat(YEARS, len(STAGES)),
+            "stage": np.tile(stage_order, len(YEARS)),
+            "funding_b": totals[:, [STAGES.index(s) for s in stage_order]].ravel(),
+        }
     )
     stage_totals_out = DATA_OUT / "fintech_stage_totals_by_year_estimated.csv"
     stage_totals_with_meta = _with_metadata(
@@ -457,23 +521,15 @@ def export_csvs(df: pd.DataFrame) -> None:
     stage_totals_with_meta.to_csv(stage_totals_out, index=False)
     print(f"Saved: {stage_totals_out}")
 
-    maturity = (
-        df[df["stage"].isin(["Late VC (Series C+)", "Growth / Mega"])]
-        .groupby(["year", "category"], as_index=False)["funding_b"]
-        .sum()
-        .rename(columns={"funding_b": "late_plus_growth_b"})
-        .merge(
-            df.groupby(["year", "category"], as_index=False)["category_total_b"].max(),
-            on=["year", "category"],
-            how="left",
-        )
-    )
-    maturity["late_stage_share_pct"] = np.where(
-        maturity["category_total_b"] > 0,
-        maturity["late_plus_growth_b"] / maturity["category_total_b"] * 100.0,
-        0.0,
+    maturity = pd.DataFrame(
+        {
+            "year": np.tile(YEARS, len(CATEGORIES)),
+            "category": np.repeat(np.asarray(CATEGORIES)[by_name], len(YEARS)),
+            "late_plus_growth_b": late_plus_growth_b[by_name].ravel(),
+            "category_total_b": category_total_b[by_name].ravel(),
+            "late_stage_share_pct": late_stage_share_pct[by_name].ravel(),
+        }
     )
-    maturity = maturity.sort_values(["category", "year"])
     maturity_out = DATA_OUT / "fintech_category_maturity_late_stage_share_estimated.csv"
     maturity_with_meta = _with_metadata(
         maturity,
@@ -486,8 +542,9 @@ def export_csvs(df: pd.DataFrame) -> None:
 
 def main() -> None:
     print("Building fintech stage model dataset...")
-    df = build_stage_dataframe()
-    export_csvs(df)
+    tensor = build_stage_tensor()
+    df = build_stage_dataframe(tensor)
+    export_csvs(df, tensor)
 
     print("Generating chart: stage over time...")
     chart_stage_over_time(df)
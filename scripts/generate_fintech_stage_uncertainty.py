@@ -0,0 +1,234 @@
+"""
+Monte Carlo uncertainty bands for the fintech stage-split model.
+
+Outputs:
+  - data/fintech_stage_totals_by_year_uncertainty_estimated.csv
+
+Method:
+  The point estimates in fintech_stage_totals_by_year_estimated.csv rest on
+  judgment calls. This script samples them and re-runs the vectorized stage
+  model (scripts/generate_fintech_stage_charts.py) for every draw:
+    1) CATEGORY_MATURITY_2015: normal noise per category, clipped to [0, 1],
+    2) ANNUAL_MATURITY_STEP: normal noise, floored at 0,
+    3) YEAR_STAGE_MULTIPLIERS: multiplicative lognormal noise per year-stage,
+    4) category-year funding totals: multiplicative lognormal noise whose
+       width follows the CONFIDENCE grade of the cell (H tight, L wide).
+  Draws are generated and reduced in fixed-size chunks. Each year-stage cell
+  feeds a fixed-bin streaming histogram, so memory stays bounded by the chunk
+  size no matter how many draws are requested. Percentiles are read off the
+  histograms (resolution: cell range / bins) and rounded to that resolution,
+  so they carry no more decimals than the bin width supports.
+
+Usage:
+  uv run python scripts/generate_fintech_stage_uncertainty.py
+  uv run python scripts/generate_fintech_stage_uncertainty.py --draws 1000000 --chunk-size 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from generate_fintech_stage_charts import (
+    ANNUAL_MATURITY_STEP,
+    CATEGORIES,
+    DATA_OUT,
+    STAGES,
+    YEARS,
+    _with_metadata,
+    funding_matrix,
+    maturity_vector,
+    multiplier_matrix,
+    stage_funding_tensor,
+)
+from data.fintech_funding_data import CONFIDENCE_CODES, confidence_matrix
+
+
+DEFAULT_DRAWS = 100_000
+DEFAULT_CHUNK_SIZE = 5_000
+DEFAULT_BINS = 2_000
+DEFAULT_SEED = 2015
+
+PERCENTILES = (5, 25, 50, 75, 95)
+
+# Lognormal sigma on category-year totals by CONFIDENCE grade (unrated = L).
+TOTAL_SIGMA_BY_CONFIDENCE = {"H": 0.05, "M": 0.15, "L": 0.30}
+MATURITY_SIGMA = 0.08
+ANNUAL_STEP_SIGMA = 0.01
+MULTIPLIER_SIGMA = 0.10
+
+# Histogram range for stage funding: a multiple of the point-estimate year total.
+RANGE_HEADROOM = 4.0
+
+
+class StreamingHistogram:
+    """Fixed-bin histograms for many cells at once; mergeable, O(cells x bins) memory."""
+
+    def __init__(self, lower: np.ndarray, upper: np.ndarray, bins: int):
+        self.lower = np.asarray(lower, dtype=float)
+        self.width = (np.asarray(upper, dtype=float) - self.lower) / bins
+        self.bins = bins
+        self.counts = np.zeros(self.lower.shape + (bins,), dtype=np.int64)
+        self.total = np.zeros(self.lower.shape)
+        self.n = 0
+        self.clipped = 0
+
+    def update(self, values: np.ndarray) -> None:
+        """Add a chunk shaped (draws, *cells)."""
+        idx = np.floor((values - self.lower) / self.width).astype(np.int64)
+        self.clipped += int(np.count_nonzero((idx < 0) | (idx >= self.bins)))
+        np.clip(idx, 0, self.bins - 1, out=idx)
+        cell = np.arange(self.lower.size).reshape(self.lower.shape)
+        flat = (cell * self.bins + idx).ravel()
+        self.counts += np.bincount(flat, minlength=self.counts.size).reshape(self.counts.shape)
+        self.total += values.sum(axis=0)
+        self.n += values.shape[0]
+
+    def merge(self, other: StreamingHistogram) -> None:
+        self.counts += other.counts
+        self.total += other.total
+        self.n += other.n
+        self.clipped += other.clipped
+
+    def mean(self) -> np.ndarray:
+        return self.total / self.n
+
+    def percentile(self, q: float) -> np.ndarray:
+        """Linear interpolation inside the bin where the CDF crosses q%."""
+        cdf = np.cumsum(self.counts, axis=-1)
+        target = q / 100.0 * self.n
+        b = np.minimum((cdf < target).sum(axis=-1), self.bins - 1)
+        below = np.take_along_axis(cdf, b[..., None], axis=-1)[..., 0] - np.take_along_axis(
+            self.counts, b[..., None], axis=-1
+        )[..., 0]
+        in_bin = np.take_along_axis(self.counts, b[..., None], axis=-1)[..., 0]
+        frac = np.divide(target - below, in_bin, out=np.zeros(b.shape), where=in_bin > 0)
+        return self.lower + (b + frac) * self.width
+
+
+def sample_parameters(rng: np.random.Generator, n: int) -> dict[str, np.ndarray]:
+    """Draw n parameter sets for stage_funding_tensor()."""
+    conf = confidence_matrix().T  # categories x years
+    sigma = np.full(conf.shape, TOTAL_SIGMA_BY_CONFIDENCE["L"])
+    for grade, code in CONFIDENCE_CODES.items():
+        sigma[conf == code] = TOTAL_SIGMA_BY_CONFIDENCE[grade]
+
+    return {
+        "funding": funding_matrix().T * np.exp(rng.standard_normal((n,) + conf.shape) * sigma),
+        "maturity_2015": np.clip(
+            maturity_vector() + rng.standard_normal((n, len(CATEGORIES))) * MATURITY_SIGMA, 0.0, 1.0
+        ),
+        "annual_step": np.maximum(ANNUAL_MATURITY_STEP + rng.standard_normal(n) * ANNUAL_STEP_SIGMA, 0.0),
+        "multipliers": multiplier_matrix() * np.exp(rng.standard_normal((n, len(YEARS), len(STAGES))) * MULTIPLIER_SIGMA),
+    }
+
+
+def simulate(
+    draws: int = DEFAULT_DRAWS,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    bins: int = DEFAULT_BINS,
+    seed: int = DEFAULT_SEED,
+) -> tuple[StreamingHistogram, StreamingHistogram]:
+    """Run the simulation; returns (stage funding $B, stage share of year %) reducers over years x stages."""
+    rng = np.random.default_rng(seed)
+    year_total = funding_matrix().sum(axis=1)
+    funding_hist = StreamingHistogram(
+        np.zeros((len(YEARS), len(STAGES))),
+        np.repeat(year_total[:, None] * RANGE_HEADROOM, len(STAGES), axis=1),
+        bins,
+    )
+    share_hist = StreamingHistogram(
+        np.zeros((len(YEARS), len(STAGES))), np.full((len(YEARS), len(STAGES)), 100.0), bins
+    )
+
+    done = 0
+    while done < draws:
+        n = min(chunk_size, draws - done)
+        params = sample_parameters(rng, n)
+        _, _, stage_funding = stage_funding_tensor(**params)  # n x categories x years x stages
+        by_year_stage = stage_funding.sum(axis=1)
+        funding_hist.update(by_year_stage)
+        share_hist.update(by_year_stage / by_year_stage.sum(axis=-1, keepdims=True) * 100.0)
+        done += n
+    return funding_hist, share_hist
+
+
+def round_to_resolution(values: np.ndarray, width: np.ndarray) -> np.ndarray:
+    """Round each cell to the coarsest decimal place not wider than its histogram bin."""
+    decimals = np.maximum(np.ceil(-np.log10(width)), 0).astype(int)
+    out = np.empty_like(values, dtype=float)
+    for d in np.unique(decimals):
+        mask = decimals == d
+        out[mask] = np.round(values[mask], d)
+    return out
+
+
+def bands_dataframe(funding_hist: StreamingHistogram, share_hist: StreamingHistogram) -> pd.DataFrame:
+    """Long year x stage table with point estimate, mean and percentile bands."""
+    _, _, point = stage_funding_tensor(funding_matrix().T)
+    point = point.sum(axis=0)
+    out = pd.DataFrame(
+        {
+            "year": np.repeat(YEARS, len(STAGES)),
+            "stage": np.tile(STAGES, len(YEARS)),
+            "point_estimate_b": np.round(point.ravel(), 4),
+            "mean_b": np.round(funding_hist.mean().ravel(), 4),
+        }
+    )
+    for q in PERCENTILES:
+        out[f"p{q}_b"] = round_to_resolution(funding_hist.percentile(q), funding_hist.width).ravel()
+    for q in PERCENTILES:
+        out[f"p{q}_share_pct"] = round_to_resolution(share_hist.percentile(q), share_hist.width).ravel()
+    out["draws"] = funding_hist.n
+    return out
+
+
+def export_bands(
+    draws: int = DEFAULT_DRAWS,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    bins: int = DEFAULT_BINS,
+    seed: int = DEFAULT_SEED,
+) -> Path:
+    """Simulate and write the uncertainty CSV."""
+    print(f"Simulating {draws:,} draws in chunks of {chunk_size:,}...")
+    start = time.perf_counter()
+    funding_hist, share_hist = simulate(draws, chunk_size, bins, seed)
+    elapsed = time.perf_counter() - start
+    print(f"Done in {elapsed:.2f}s ({draws / elapsed:,.0f} draws/s)")
+    if funding_hist.clipped:
+        print(f"Warning: {funding_hist.clipped} values fell outside the histogram range and were clamped")
+
+    bands = bands_dataframe(funding_hist, share_hist)
+    out = DATA_OUT / "fintech_stage_totals_by_year_uncertainty_estimated.csv"
+    _with_metadata(
+        bands,
+        dataset_name="fintech_stage_totals_by_year_uncertainty_estimated",
+        notes=(
+            "Monte Carlo bands for modeled stage totals: maturity, cycle multipliers and "
+            "confidence-graded category totals sampled; percentiles from streaming histograms."
+        ),
+        confidence="low",
+    ).to_csv(out, index=False)
+    print(f"Saved: {out}")
+    return out
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--draws", type=int, default=DEFAULT_DRAWS)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Draws held in memory at once")
+    parser.add_argument("--bins", type=int, default=DEFAULT_BINS, help="Histogram bins per year-stage cell")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    args = parser.parse_args()
+    export_bands(args.draws, args.chunk_size, args.bins, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+"""
+Weight-sweep rank stability for the agent-fintech startup opportunity matrix.
+
+Outputs:
+  - data/agent_fintech_opportunity_rank_stability.csv
+
+Method:
+  generate_agent_fintech_opportunity_matrix.py ranks OPPORTUNITIES with one
+  hand-picked WEIGHTS vector. Here the same criterion scores are re-ranked
+  under many weight vectors drawn from the probability simplex:
+    - uniform_simplex: flat Dirichlet, i.e. every weighting equally likely,
+    - centered: Dirichlet(CENTER_CONCENTRATION * WEIGHTS), i.e. reasonable
+      disagreement around the published weights.
+  Each chunk of samples is scored as one matrix multiply
+  (opportunities x criteria) @ (criteria x samples). Ranks are then reduced
+  into per-opportunity rank histograms, so millions of samples never sit in
+  memory at once. Pareto dominance is weight-free: if A scores >= B on every
+  criterion (and > on one), A outranks B under every weighting.
+
+Usage:
+  uv run python scripts/generate_opportunity_weight_sweep.py
+  uv run python scripts/generate_opportunity_weight_sweep.py --samples 5000000 --seed 7
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from generate_agent_fintech_opportunity_matrix import DATA_DIR, OPPORTUNITIES, WEIGHTS
+from generate_fintech_coverage_gap_charts import with_metadata
+
+
+CRITERIA = list(WEIGHTS.keys())
+DEFAULT_SAMPLES = 1_000_000
+DEFAULT_CHUNK_SIZE = 100_000
+DEFAULT_SEED = 22
+CENTER_CONCENTRATION = 50.0
+TOP_K = 3
+
+
+def criteria_matrix() -> np.ndarray:
+    """Opportunity x criterion scores (0-10), in OPPORTUNITIES / CRITERIA order."""
+    return np.array([[opp[c] for c in CRITERIA] for opp in OPPORTUNITIES], dtype=float)
+
+
+def sample_weights(rng: np.random.Generator, n: int, concentration: np.ndarray) -> np.ndarray:
+    """n weight vectors on the simplex as a criteria x samples matrix."""
+    return rng.dirichlet(concentration, size=n).T
+
+
+def ranks(scores: np.ndarray) -> np.ndarray:
+    """1-based competition ranks per column (1 = highest score)."""
+    return 1 + (scores[None, :, :] > scores[:, None, :]).sum(axis=1)
+
+
+def pareto_dominance(x: np.ndarray) -> np.ndarray:
+    """dominates[i, j] is True when opportunity i Pareto-dominates opportunity j."""
+    ge = (x[:, None, :] >= x[None, :, :]).all(axis=-1)
+    gt = (x[:, None, :] > x[None, :, :]).any(axis=-1)
+    return ge & gt
+
+
+def sweep(
+    concentration: np.ndarray,
+    samples: int = DEFAULT_SAMPLES,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    seed: int = DEFAULT_SEED,
+) -> dict[str, np.ndarray]:
+    """Stream weight samples; returns rank counts (opportunity x rank) and score moments."""
+    x = criteria_matrix()
+    n_opp = len(x)
+    rng = np.random.default_rng(seed)
+    rank_counts = np.zeros((n_opp, n_opp), dtype=np.int64)
+    score_sum = np.zeros(n_opp)
+    score_sq = np.zeros(n_opp)
+
+    done = 0
+    while done < samples:
+        n = min(chunk_size, samples - done)
+        scores = 10.0 * (x @ sample_weights(rng, n, concentration))  # opportunities x samples
+        r = ranks(scores)
+        flat = (np.arange(n_opp)[:, None] * n_opp + (r - 1)).ravel()
+        rank_counts += np.bincount(flat, minlength=n_opp * n_opp).reshape(n_opp, n_opp)
+        score_sum += scores.sum(axis=1)
+        score_sq += np.square(scores).sum(axis=1)
+        done += n
+    mean = score_sum / samples
+    return {
+        "rank_counts": rank_counts,
+        "score_mean": mean,
+        "score_std": np.sqrt(np.maximum(score_sq / samples - mean**2, 0.0)),
+    }
+
+
+def _rank_quantile(rank_counts: np.ndarray, q: float) -> np.ndarray:
+    cdf = np.cumsum(rank_counts, axis=1) / rank_counts.sum(axis=1, keepdims=True)
+    return 1 + (cdf < q).sum(axis=1)
+
+
+def stability_dataframe(label: str, result: dict[str, np.ndarray]) -> pd.DataFrame:
+    """Per-opportunity rank distribution summary for one sweep."""
+    x = criteria_matrix()
+    names = [opp["opportunity"] for opp in OPPORTUNITIES]
+    published = 10.0 * (x @ np.array([WEIGHTS[c] for c in CRITERIA]))
+    counts = result["rank_counts"]
+    prob = counts / counts.sum(axis=1, keepdims=True)
+    ranks_1 = np.arange(1, len(names) + 1)
+    dominates = pareto_dominance(x)
+
+    columns = {
+        "sweep": label,
+        "opportunity": names,
+        "published_rank": ranks(published[:, None])[:, 0],
+        "published_score_100": np.round(published, 1),
+        "mean_score_100": np.round(result["score_mean"], 2),
+        "score_std_100": np.round(result["score_std"], 2),
+        "mean_rank": np.round(prob @ ranks_1, 3),
+        "p5_rank": _rank_quantile(counts, 0.05),
+        "median_rank": _rank_quantile(counts, 0.50),
+        "p95_rank": _rank_quantile(counts, 0.95),
+        f"p_top_{TOP_K}": np.round(prob[:, :TOP_K].sum(axis=1), 4),
+    }
+    columns.update({f"p_rank_{r}": np.round(prob[:, r - 1], 4) for r in ranks_1})
+    columns["pareto_efficient"] = ~dominates.any(axis=0)
+    columns["dominated_by"] = [
+        "; ".join(names[i] for i in np.flatnonzero(dominates[:, j])) for j in range(len(names))
+    ]
+    columns["samples"] = int(counts[0].sum())
+    df = pd.DataFrame(columns)
+    return df.sort_values("published_rank", kind="stable").reset_index(drop=True)
+
+
+def export_rank_stability(
+    samples: int = DEFAULT_SAMPLES,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    seed: int = DEFAULT_SEED,
+) -> Path:
+    base = np.array([WEIGHTS[c] for c in CRITERIA])
+    sweeps = {
+        "uniform_simplex": np.ones(len(CRITERIA)),
+        f"centered_k{CENTER_CONCENTRATION:g}": CENTER_CONCENTRATION * base,
+    }
+
+    frames = []
+    for label, concentration in sweeps.items():
+        start = time.perf_counter()
+        result = sweep(concentration, samples, chunk_size, seed)
+        elapsed = time.perf_counter() - start
+        print(f"{label}: {samples:,} weight vectors in {elapsed:.2f}s ({samples / elapsed:,.0f}/s)")
+        frames.append(stability_dataframe(label, result))
+    out_df = pd.concat(frames, ignore_index=True)
+
+    for label, frame in out_df.groupby("sweep", sort=False):
+        print(f"\n--- {label} ---")
+        print(frame[["published_rank", "opportunity", "mean_rank", "p5_rank", "p95_rank", f"p_top_{TOP_K}"]]
+              .to_string(index=False))
+
+    out = DATA_DIR / "agent_fintech_opportunity_rank_stability.csv"
+    with_metadata(
+        out_df,
+        source_id="agent_fintech_opportunity_weight_sweep_v1",
+        source_url="scripts/generate_agent_fintech_opportunity_matrix.py",
+        source_capture_method="dirichlet_weight_sweep_over_published_criterion_scores",
+        confidence="medium",
+        status="supported",
+        notes=f"Re-ranks the opportunity matrix under {samples:,} sampled weightings per sweep (seed {seed}).",
+    ).to_csv(out, index=False)
+    print(f"\nSaved: {out}")
+    return out
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--samples", type=int, default=DEFAULT_SAMPLES, help="Weight vectors per sweep")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Weight vectors per matrix multiply")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    args = parser.parse_args()
+    export_rank_stability(args.samples, args.chunk_size, args.seed)
+
+
+if __name__ == "__main__":
+    main()
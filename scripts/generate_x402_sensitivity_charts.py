@@ -7,7 +7,7 @@ Charts:
   3) x402_14_risk_matrix.png
 
 Data source:
-  - x402-value-accrual-deep-dive.md
+  - x402-value-accrual-deep-dive.md (assumptions live in x402_scenario_engine.py)
 """
 
 from pathlib import Path
@@ -15,6 +15,15 @@ from pathlib import Path
 import matplotlib.pyplot as plt
 import numpy as np
 
+from x402_scenario_engine import (
+    COINBASE_COMMERCE_PER_BILLION,
+    COINBASE_PER_BILLION,
+    DISCOVERY_PER_BILLION,
+    LAYER_PER_BILLION,
+    revenue_grid,
+    with_range,
+)
+
 
 ROOT = Path(__file__).resolve().parent.parent
 OUT_DIR = ROOT / "charts" / "x402"
@@ -36,18 +45,10 @@ def _style_dark(ax: plt.Axes) -> None:
 
 def chart_layer_revenue_sensitivity() -> None:
     """Layer revenue sensitivity as annual x402 volume scales."""
-    # Per-$1B annual volume figures from x402-value-accrual-deep-dive.md.
-    per_billion = {
-        "Currency (USDC)": 45.0,
-        "Settlement (Base)": 10.0,
-        "Application": 880.0,
-        "Facilitator": 100.0,
-        "Infrastructure": 1.0,
-    }
-    discovery_low = 20.0
-    discovery_high = 80.0
-
     volumes = np.array([0.5, 1, 2, 5, 10], dtype=float)  # USD billions
+    grid = revenue_grid(with_range(LAYER_PER_BILLION, "Discovery", DISCOVERY_PER_BILLION), volumes)
+    discovery_low = grid.sel(layer="Discovery (low)", take_rate_multiplier=1.0, layer_share=1.0)
+    discovery_high = grid.sel(layer="Discovery (high)", take_rate_multiplier=1.0, layer_share=1.0)
 
     fig, ax = plt.subplots(figsize=(14, 8), dpi=170)
     fig.patch.set_facecolor(BG)
@@ -61,19 +62,19 @@ def chart_layer_revenue_sensitivity() -> None:
         "Infrastructure": "#A78BFA",
     }
 
-    for layer, per_b in per_billion.items():
-        ax.plot(volumes, per_b * volumes, marker="o", linewidth=2.6,
-                color=colors[layer], label=layer)
+    for layer in LAYER_PER_BILLION:
+        ax.plot(volumes, grid.sel(layer=layer, take_rate_multiplier=1.0, layer_share=1.0),
+                marker="o", linewidth=2.6, color=colors[layer], label=layer)
 
     ax.fill_between(
         volumes,
-        discovery_low * volumes,
-        discovery_high * volumes,
+        discovery_low,
+        discovery_high,
         color="#FBBF24",
         alpha=0.22,
         label="Discovery range (2-8% take)",
     )
-    ax.plot(volumes, ((discovery_low + discovery_high) / 2) * volumes,
+    ax.plot(volumes, (discovery_low + discovery_high) / 2,
             color="#FBBF24", linestyle="--", linewidth=2)
 
     ax.set_title("x402 Layer Revenue Sensitivity by Annual Volume", fontsize=20, fontweight="bold", color=TEXT, pad=16)
@@ -104,22 +105,17 @@ def chart_layer_revenue_sensitivity() -> None:
 def chart_coinbase_revenue_scenarios() -> None:
     """Coinbase direct x402-linked revenue by volume scenario."""
     volumes = np.array([1, 5, 10], dtype=float)  # USD billions
-
-    # Per-$1B assumptions from memo.
-    usdc_share = 25.0
-    base_fees = 7.5
-    facilitator_fees = 1.0
-    commerce_low = 2.0
-    commerce_high = 5.0
-    commerce_mid = (commerce_low + commerce_high) / 2
-
-    usdc_vals = usdc_share * volumes
-    base_vals = base_fees * volumes
-    fac_vals = facilitator_fees * volumes
-    comm_mid_vals = commerce_mid * volumes
-    total_low = (usdc_share + base_fees + facilitator_fees + commerce_low) * volumes
-    total_high = (usdc_share + base_fees + facilitator_fees + commerce_high) * volumes
-    total_mid = usdc_vals + base_vals + fac_vals + comm_mid_vals
+    grid = revenue_grid(with_range(COINBASE_PER_BILLION, "Commerce", COINBASE_COMMERCE_PER_BILLION), volumes)
+    point = grid.sel(take_rate_multiplier=1.0, layer_share=1.0)  # layers x volumes
+
+    usdc_vals, base_vals, fac_vals = (point[grid.layers.index(name)] for name in COINBASE_PER_BILLION)
+    direct = usdc_vals + base_vals + fac_vals
+    comm_low_vals = point[grid.layers.index("Commerce (low)")]
+    comm_high_vals = point[grid.layers.index("Commerce (high)")]
+    comm_mid_vals = (comm_low_vals + comm_high_vals) / 2
+    total_low = direct + comm_low_vals
+    total_high = direct + comm_high_vals
+    total_mid = direct + comm_mid_vals
 
     fig, ax = plt.subplots(figsize=(13, 8), dpi=170)
     fig.patch.set_facecolor(BG)
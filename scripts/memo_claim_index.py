@@ -0,0 +1,573 @@
+"""
+Inverted index of the numeric claims in memos/*.md and research/*.md.
+
+Every number in the markdown ("$51.8B", "75.41M tx", "94.06K buyers", "51%",
+"3.5x", "$600M+") is extracted as a claim with its file, line, column,
+normalised value and kind (usd, pct, multiple, count), plus the words around
+it. Words are indexed at three weights:
+
+  3  the claim's own clause, or for a table cell the cell and the row label
+  2  the rest of the line, and the table column header
+  1  the enclosing markdown headings
+
+so "x402 cumulative transactions" ranks "| Legacy cumulative transactions
+claim | 157.6M |" under an x402 heading above a line that merely mentions
+transactions somewhere. Values are indexed too: "157.6M" and "157,600,000"
+find the same claims.
+
+The index lives in .cache/claim_index.pkl with each file's mtime, size and
+sha256. Every query stats the corpus and re-tokenizes only files that
+changed, then answers from the postings without touching the rest of the
+markdown. ISO dates, clock times, years, "Feb 9" style days, list markers
+and numbers inside identifiers (x402, Q1, ERC-20) and URLs are not claims.
+
+extract_claims(), parse_quantity() and tokenize() are the shared extractor
+for the other memo tooling.
+
+Usage:
+    from memo_claim_index import open_index
+    hits = open_index().search("x402 cumulative transactions")
+
+    uv run python scripts/memo_claim_index.py query "where do we cite x402 cumulative transactions?"
+    uv run python scripts/memo_claim_index.py query 157.6M
+    uv run python scripts/memo_claim_index.py query "x402 volume" --kind usd --path "memos/*"
+    uv run python scripts/memo_claim_index.py build [--force]
+    uv run python scripts/memo_claim_index.py stats
+"""
+
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import hashlib
+import pickle
+import re
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import NamedTuple
+
+
+ROOT = Path(__file__).resolve().parent.parent
+CORPUS_GLOBS = ("memos/*.md", "research/*.md")
+INDEX_PATH = ROOT / ".cache" / "claim_index.pkl"
+INDEX_VERSION = 1
+
+LOCAL_WEIGHT = 3
+LINE_WEIGHT = 2
+HEADING_WEIGHT = 1
+
+
+# =============================================================================
+# Quantities
+# =============================================================================
+
+CURRENCIES = {"$": "usd", "€": "eur", "£": "gbp"}
+SCALES = {  # power of ten
+    "k": 3, "thousand": 3,
+    "m": 6, "mn": 6, "mm": 6, "million": 6,
+    "b": 9, "bn": 9, "billion": 9,
+    "t": 12, "tn": 12, "trillion": 12,
+}
+
+NUMBER_RE = re.compile(
+    r"""
+    (?<![\w.,#:$€£])(?<![A-Za-z]-)       # not inside a word, identifier, version or ref
+    (?P<cur>[$€£])?
+    (?P<num>\d{1,3}(?:,\d{3})+(?:\.\d+)?|\d+(?:\.\d+)?)
+    (?:
+        (?P<scale>[kKmMbBtT]|mn|mm|bn|tn)(?![A-Za-z])
+      | \s?(?P<word>thousand|million|billion|trillion)\b
+    )?
+    (?:
+        \s?(?P<pct>%|percent\b|bps\b)
+      | (?P<mult>x)(?![A-Za-z])
+    )?
+    (?P<plus>\+)?
+    (?:\s?(?P<code>USD|EUR|GBP)\b)?
+    (?![\w%$])
+    """,
+    re.VERBOSE,
+)
+DATE_TIME_RE = re.compile(r"\b\d{4}-\d{2}(?:-\d{2})?(?:T[\d:]+Z?)?\b|\b\d{1,2}:\d{2}(?::\d{2})?\b")
+URL_RE = re.compile(r"https?://\S+|\]\([^)]*\)")
+MONTH_DAY_RE = re.compile(
+    r"\b(?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\.?\s$", re.IGNORECASE
+)
+LIST_MARKER_RE = re.compile(r"[ \t>#]*$")
+CLAUSE_SEPARATORS = ("; ", ", ", ". ", ": ", "(", ")", " — ")
+RANGE_JOIN_RE = re.compile(r"\s?[-–]\s?|\s+to\s+")
+
+
+class Quantity(NamedTuple):
+    value: float
+    kind: str  # usd / eur / gbp / pct / multiple / count
+    plus: bool  # "$600M+", "10+": a lower bound
+
+
+def _quantity(m: re.Match) -> Quantity:
+    scale = SCALES.get((m["scale"] or m["word"] or "").lower(), 0)
+    value = float(f"{m['num'].replace(',', '')}e{scale}")  # "67.6B" -> 67600000000.0 exactly
+    kind = "count"
+    if m["cur"] or m["code"]:
+        kind = CURRENCIES.get(m["cur"], (m["code"] or "usd").lower())
+    elif m["pct"]:
+        kind = "pct"
+        if m["pct"] == "bps":
+            value /= 100
+    elif m["mult"]:
+        kind = "multiple"
+    return Quantity(value, kind, bool(m["plus"]))
+
+
+def parse_quantity(text: str) -> Quantity | None:
+    """Quantity for a string that is exactly one number ("157.6M", "$24.24M", "4%")."""
+    m = NUMBER_RE.fullmatch(text.strip())
+    return _quantity(m) if m else None
+
+
+def value_key(value: float) -> str:
+    """Index term for a value, to 4 significant digits."""
+    return f"={value:.4g}"
+
+
+def format_value(q: Quantity) -> str:
+    if q.kind == "pct":
+        return f"{q.value:g}%"
+    if q.kind == "multiple":
+        return f"{q.value:g}x"
+    for suffix, scale in (("T", 1e12), ("B", 1e9), ("M", 1e6), ("K", 1e3)):
+        if abs(q.value) >= scale:
+            text = f"{q.value / scale:.4g}{suffix}"
+            break
+    else:
+        text = f"{q.value:g}"
+    prefix = {"usd": "$", "eur": "€", "gbp": "£"}.get(q.kind, "")
+    return prefix + text + ("+" if q.plus else "")
+
+
+# =============================================================================
+# Tokens
+# =============================================================================
+
+STOPWORDS = frozenset("""
+    a an and are as at be by can cite cited do does for from has have how in is it its of on or our
+    per show shows that the their this to up vs was we were what where which while with
+""".split())
+TERM_ALIASES = {
+    "tx": "transaction", "txs": "transaction", "txn": "transaction", "txns": "transaction",
+    "vol": "volume", "yoy": "growth", "usd": "dollar",
+}
+WORD_RE = re.compile(r"[a-z0-9]+")
+NUMERIC_TOKEN_RE = re.compile(r"\d+[a-z]{0,2}")
+
+
+def normalise_term(word: str) -> str | None:
+    word = word.lower()
+    if word in STOPWORDS or NUMERIC_TOKEN_RE.fullmatch(word):
+        return None
+    word = TERM_ALIASES.get(word, word)
+    if len(word) > 4 and word.endswith("ies"):
+        word = word[:-3] + "y"
+    elif len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+        word = word[:-1]
+    return word
+
+
+def tokenize(text: str) -> list[str]:
+    """Normalised index terms in text, in order (stopwords and bare numbers dropped)."""
+    terms = []
+    for word in WORD_RE.findall(text.lower().replace("'", "")):
+        term = normalise_term(word)
+        if term:
+            terms.append(term)
+    return terms
+
+
+# =============================================================================
+# Claims
+# =============================================================================
+
+class Claim(NamedTuple):
+    path: str  # repo-relative
+    line: int  # 1-based
+    col: int  # 0-based, in the original line
+    raw: str
+    value: float
+    kind: str
+    plus: bool
+    text: str  # the stripped line
+    heading: str  # enclosing headings, outermost first, joined with " > "
+    label: str  # table row label, or the clause the number sits in
+    column: str  # table column header ("" outside tables)
+
+    @property
+    def quantity(self) -> Quantity:
+        return Quantity(self.value, self.kind, self.plus)
+
+    @property
+    def ref(self) -> str:
+        return f"{self.path}:{self.line}"
+
+
+def _blank(pattern: re.Pattern, text: str) -> str:
+    """text with pattern's matches replaced by spaces, keeping columns."""
+    return pattern.sub(lambda m: " " * len(m.group()), text)
+
+
+def _cells(line: str) -> list[tuple[int, int]]:
+    """(start, end) spans of a markdown table row's cells."""
+    bars = [i for i, ch in enumerate(line) if ch == "|" and (i == 0 or line[i - 1] != "\\")]
+    return [(a + 1, b) for a, b in zip(bars, bars[1:])]
+
+
+def _clause(line: str, start: int, end: int, lo: int = 0, hi: int | None = None) -> str:
+    """The clause around line[start:end] within line[lo:hi]: up to ; , . ( ) or a dash, at most 6 words before."""
+    hi = len(line) if hi is None else hi
+    lefts = [(line.rfind(sep, lo, start), len(sep)) for sep in CLAUSE_SEPARATORS]
+    left = max([i + n for i, n in lefts if i >= 0] + [lo])
+    rights = [i for i in (line.find(sep, end, hi) for sep in CLAUSE_SEPARATORS) if i >= 0]
+    right = min(rights + [hi])
+    words = list(re.finditer(r"\S+", line[left:start]))
+    if len(words) > 6:
+        left += words[-6].start()
+    return line[left:right].strip()
+
+
+def extract_claims(path: str, text: str) -> list[Claim]:
+    """Every numeric claim in a markdown document."""
+    claims: list[Claim] = []
+    headings: list[tuple[int, str]] = []
+    header_cells: list[str] = []
+    in_code = False
+
+    for lineno, line in enumerate(text.splitlines(), start=1):
+        stripped = line.strip()
+        if stripped.startswith("```"):
+            in_code = not in_code
+            continue
+        if in_code:
+            continue
+        if not stripped:
+            header_cells = []
+            continue
+        if stripped.startswith("#"):
+            level = len(stripped) - len(stripped.lstrip("#"))
+            headings = [h for h in headings if h[0] < level] + [(level, stripped.lstrip("#").strip())]
+
+        cells = _cells(line) if stripped.startswith("|") else []
+        if cells and set(stripped) <= set("|:- "):
+            continue  # table separator row
+        if not cells:
+            header_cells = []
+
+        matches, quantities = _scan_line(line)
+        if cells and not header_cells and not matches:
+            header_cells = [line[a:b].strip() for a, b in cells]
+            continue
+        if cells and not header_cells:
+            header_cells = [line[a:b].strip() for a, b in cells]
+
+        heading = " > ".join(h[1] for h in headings)
+        row_label = line[cells[0][0] : cells[0][1]].strip() if cells else ""
+        for m, q in zip(matches, quantities):
+            if cells:
+                idx = next((i for i, (a, b) in enumerate(cells) if a <= m.start() < b), 0)
+                clause = _clause(line, m.start(), m.end(), *cells[idx])
+                label = clause if idx == 0 else f"{row_label} | {clause}"
+                column = header_cells[idx] if idx < len(header_cells) else ""
+            else:
+                label, column = _clause(line, m.start(), m.end()), ""
+            claims.append(Claim(
+                path=path, line=lineno, col=m.start(), raw=m.group().strip(),
+                value=q.value, kind=q.kind, plus=q.plus,
+                text=stripped, heading=heading, label=label, column=column,
+            ))
+    return claims
+
+
+def _scan_line(line: str) -> tuple[list[re.Match], list[Quantity]]:
+    """Number matches in one line (positions as in line) and their quantities."""
+    scan = _blank(DATE_TIME_RE, _blank(URL_RE, line))
+    matches = [m for m in NUMBER_RE.finditer(scan) if not _skip(scan, m)]
+    quantities = [_quantity(m) for m in matches]
+    _join_ranges(scan, matches, quantities)
+    return matches, quantities
+
+
+def line_quantities(line: str) -> list[Quantity]:
+    """Quantities claimed in one line of markdown, by the same rules as extract_claims()."""
+    return _scan_line(line)[1]
+
+
+def _skip(line: str, m: re.Match) -> bool:
+    """Numbers that are not claims: bare years, calendar days, list markers."""
+    if m["cur"] or m["scale"] or m["word"] or m["pct"] or m["mult"] or m["plus"] or m["code"]:
+        return False
+    num = m["num"]
+    if len(num) == 4 and num.isdigit() and 1900 <= int(num) <= 2100:
+        return True
+    if MONTH_DAY_RE.search(line, 0, m.start()) and len(num) <= 2:
+        return True
+    if not LIST_MARKER_RE.fullmatch(line, 0, m.start()):
+        return False
+    # "1. item", "2) item", and section numbers such as "### 5.8 Regulatory Landscape"
+    return line[m.end() : m.end() + 1] in (".", ")") or line.lstrip().startswith("#")
+
+
+def _join_ranges(line: str, matches: list[re.Match], quantities: list[Quantity]) -> None:
+    """'20-30%', '$1-5B': the unit-less end of a range takes the other end's unit."""
+    for i in range(len(matches) - 1):
+        a, b = matches[i], matches[i + 1]
+        if not RANGE_JOIN_RE.fullmatch(line, a.end(), b.start()):
+            continue
+        qa, qb = quantities[i], quantities[i + 1]
+        scale_a = a["scale"] or a["word"]
+        if not scale_a and not a["pct"] and not a["mult"]:
+            scale = SCALES.get((b["scale"] or b["word"] or "").lower(), 0)
+            value = float(f"{a['num'].replace(',', '')}e{scale}") / (100 if b["pct"] == "bps" else 1)
+            kind = qb.kind if qa.kind == "count" else qa.kind
+            quantities[i] = Quantity(value, kind, qa.plus)
+        if qb.kind == "count" and qa.kind not in ("count", "pct", "multiple"):
+            quantities[i + 1] = Quantity(qb.value, qa.kind, qb.plus)
+
+
+def claim_terms(claim: Claim) -> dict[str, int]:
+    """Index term -> weight for one claim."""
+    terms: dict[str, int] = {}
+    for text, weight in ((claim.heading, HEADING_WEIGHT), (claim.text, LINE_WEIGHT),
+                         (claim.column, LINE_WEIGHT), (claim.label, LOCAL_WEIGHT)):
+        for term in tokenize(text):
+            if terms.get(term, 0) < weight:
+                terms[term] = weight
+    terms[value_key(claim.value)] = LOCAL_WEIGHT
+    return terms
+
+
+# =============================================================================
+# Index
+# =============================================================================
+
+def corpus_paths(root: Path = ROOT) -> list[Path]:
+    return sorted({p for pattern in CORPUS_GLOBS for p in root.glob(pattern)})
+
+
+def _stamp(path: Path) -> tuple[int, int]:
+    st = path.stat()
+    return st.st_mtime_ns, st.st_size
+
+
+class Hit(NamedTuple):
+    claim: Claim
+    matched: int  # distinct query terms matched
+    score: int  # summed term weights
+
+
+class ClaimIndex:
+    """Claims plus term -> [(claim id, weight)] postings, rebuilt per changed file."""
+
+    def __init__(self) -> None:
+        self.stamps: dict[str, tuple[int, int, str]] = {}  # path -> (mtime_ns, size, sha256)
+        self.files: dict[str, list[tuple]] = {}  # path -> claim tuples
+        self.claims: list[Claim] = []
+        self.postings: dict[str, list[tuple[int, int]]] = {}
+
+    # ---- persistence: header, search payload, per-file payload ---------------
+
+    @classmethod
+    def load(cls, path: Path = INDEX_PATH, full: bool = True) -> ClaimIndex:
+        index = cls()
+        try:
+            with path.open("rb") as f:
+                meta = pickle.load(f)
+                if meta.get("version") != INDEX_VERSION:
+                    return index
+                index.stamps = meta["stamps"]
+                claims, index.postings = pickle.load(f)
+                index.claims = [Claim(*c) for c in claims]
+                if full:
+                    index.files = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError, KeyError, TypeError):
+            return cls()
+        return index
+
+    def save(self, path: Path = INDEX_PATH) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        with tmp.open("wb") as f:
+            pickle.dump({"version": INDEX_VERSION, "stamps": self.stamps}, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(([tuple(c) for c in self.claims], self.postings), f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(self.files, f, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp.replace(path)
+
+    # ---- incremental update ---------------------------------------------------
+
+    def changed(self, paths: list[Path]) -> tuple[list[Path], list[str]]:
+        """Files whose stat differs from the index, and indexed files that are gone."""
+        current = {p.relative_to(ROOT).as_posix(): p for p in paths}
+        changed = [p for rel, p in current.items() if self.stamps.get(rel, (None, None))[:2] != _stamp(p)]
+        removed = [rel for rel in self.stamps if rel not in current]
+        return changed, removed
+
+    def update(self, paths: list[Path] | None = None, force: bool = False) -> list[str]:
+        """Re-extract files that changed (by content hash); returns their paths."""
+        paths = corpus_paths() if paths is None else paths
+        if force:
+            self.stamps, self.files = {}, {}
+        changed, removed = self.changed(paths)
+        if not changed and not removed:
+            return []
+        if not self.files and self.stamps:
+            self.__dict__.update(ClaimIndex.load(full=True).__dict__)
+
+        touched = list(removed)
+        for rel in removed:
+            self.stamps.pop(rel)
+            self.files.pop(rel, None)
+        for path in changed:
+            rel = path.relative_to(ROOT).as_posix()
+            data = path.read_bytes()
+            sha = hashlib.sha256(data).hexdigest()
+            old = self.stamps.get(rel)
+            self.stamps[rel] = (*_stamp(path), sha)
+            if old is not None and old[2] == sha and rel in self.files:
+                continue  # touched, not edited
+            self.files[rel] = [tuple(c) for c in extract_claims(rel, data.decode("utf-8"))]
+            touched.append(rel)
+        if touched or len(self.claims) != sum(map(len, self.files.values())):
+            self._rebuild_postings()
+        return touched
+
+    def _rebuild_postings(self) -> None:
+        self.claims = [Claim(*c) for rel in sorted(self.files) for c in self.files[rel]]
+        postings: dict[str, list[tuple[int, int]]] = defaultdict(list)
+        for cid, claim in enumerate(self.claims):
+            for term, weight in claim_terms(claim).items():
+                postings[term].append((cid, weight))
+        self.postings = dict(postings)
+
+    # ---- queries --------------------------------------------------------------
+
+    def search(
+        self,
+        query: str,
+        kind: str | None = None,
+        path: str | None = None,
+        value: float | None = None,
+        limit: int | None = 20,
+    ) -> list[Hit]:
+        """
+        Claims matching the query's words, best first. Numbers in the query
+        ("157.6M") become value filters; value matches to 4 significant digits.
+        """
+        words: list[str] = []
+        values = [] if value is None else [value]
+        for token in query.split():
+            q = parse_quantity(token.strip("?.,;:()\"'`"))
+            if q is not None:
+                values.append(q.value)
+            else:
+                words.extend(tokenize(token))
+        words = list(dict.fromkeys(words))
+
+        matched: Counter = Counter()
+        score: Counter = Counter()
+        for term in words:
+            for cid, weight in self.postings.get(term, ()):
+                matched[cid] += 1
+                score[cid] += weight
+        if values:
+            allowed = {cid for v in values for cid, _ in self.postings.get(value_key(v), ())}
+            if words:
+                matched = Counter({cid: n for cid, n in matched.items() if cid in allowed})
+            else:
+                matched = Counter(dict.fromkeys(allowed, 0))
+
+        hits = []
+        for cid, n in matched.items():
+            claim = self.claims[cid]
+            if kind and claim.kind != kind:
+                continue
+            if path and not fnmatch.fnmatch(claim.path, path):
+                continue
+            hits.append(Hit(claim, n, score[cid]))
+        hits.sort(key=lambda h: (-h.matched, -h.score, h.claim.path, h.claim.line, h.claim.col))
+        if words and hits:
+            # Keep claims matching most of the query; single-word overlaps are noise.
+            floor = max(1, min(len(words), hits[0].matched) - len(words) // 3)
+            hits = [h for h in hits if h.matched >= floor]
+        return hits[:limit] if limit else hits
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "files": len(self.stamps),
+            "claims": len(self.claims),
+            "terms": len(self.postings),
+            "postings": sum(map(len, self.postings.values())),
+        }
+
+
+def open_index(update: bool = True, force: bool = False) -> ClaimIndex:
+    """The on-disk index, brought up to date with the corpus (saved if anything changed)."""
+    paths = corpus_paths()
+    index = ClaimIndex.load(full=False)
+    if not update:
+        return index
+    if force or index.changed(paths) != ([], []):
+        index.update(paths, force=force)
+        index.save()
+    return index
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build", help="Index new and changed files")
+    build.add_argument("--force", action="store_true", help="Re-extract every file")
+    query = sub.add_parser("query", help="Claims matching words and/or values")
+    query.add_argument("text", help='e.g. "x402 cumulative transactions" or "157.6M"')
+    query.add_argument("--kind", choices=["usd", "eur", "gbp", "pct", "multiple", "count"])
+    query.add_argument("--path", help='fnmatch filter on the file, e.g. "memos/*"')
+    query.add_argument("--value", help="Only claims with this value, e.g. 75.41M")
+    query.add_argument("--limit", type=int, default=20)
+    sub.add_parser("stats", help="Index size and per-file claim counts")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    if args.command == "build":
+        paths = corpus_paths()
+        index = ClaimIndex.load(full=True)
+        touched = index.update(paths, force=args.force)
+        index.save()
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"{len(touched)} of {len(paths)} files re-indexed in {elapsed:.0f} ms")
+        print(", ".join(f"{k} {v:,}" for k, v in index.stats().items()))
+        return 0
+
+    index = open_index()
+    if args.command == "stats":
+        print(", ".join(f"{k} {v:,}" for k, v in index.stats().items()))
+        per_file = Counter(c.path for c in index.claims)
+        for rel in sorted(index.stamps):
+            print(f"  {per_file[rel]:>5}  {rel}")
+        return 0
+
+    value = None
+    if args.value:
+        q = parse_quantity(args.value)
+        if q is None:
+            parser.error(f"not a number: {args.value!r}")
+        value = q.value
+    hits = index.search(args.text, kind=args.kind, path=args.path, value=value, limit=args.limit)
+    elapsed = (time.perf_counter() - start) * 1000
+    width = max((len(h.claim.ref) for h in hits), default=0)
+    for h in hits:
+        c = h.claim
+        context = c.label if c.label != c.raw else c.text
+        print(f"{c.ref:<{width}}  {c.raw:>10}  {context[:110]}")
+    print(f"{len(hits)} claims ({elapsed:.1f} ms)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,201 @@
+"""
+Warm local render server for the registered charts.
+
+Keeps one Python process with matplotlib/numpy/pandas imported, the font
+cache loaded and generator scripts imported, and renders charts on request.
+Edited scripts or data modules are picked up automatically: before each
+request the server drops any repo module whose source changed on disk.
+Rendered outputs are recorded in the build manifest, so a later
+scripts/build_charts.py run does not redo them.
+
+Requests are handled one at a time (matplotlib is not thread-safe). The server
+binds to 127.0.0.1 only.
+
+Usage:
+    uv run python scripts/render_server.py serve [--port 8765] [--preload]
+    uv run python scripts/render_server.py render x402_03_chain_split "fintech_*"
+
+HTTP API:
+    GET  /health
+    GET  /jobs
+    POST /render   {"charts": ["x402_03_chain_split", "fintech_*"]}
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+import traceback
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from chart_registry import CHART_JOBS, invalidate_changed_modules, load_script, run_job, select_jobs
+
+
+DEFAULT_PORT = 8765
+
+
+def warm_up(preload: bool) -> float:
+    """Import plotting stack, resolve fonts, optionally import every generator."""
+    start = time.perf_counter()
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    from matplotlib import font_manager
+
+    import numpy  # noqa: F401
+    import pandas  # noqa: F401
+
+    font_manager.findfont(font_manager.FontProperties(family=matplotlib.rcParams["font.family"]))
+    fig, ax = plt.subplots()
+    ax.plot([0, 1], [0, 1])
+    fig.canvas.draw()
+    plt.close(fig)
+
+    if preload:
+        for script in dict.fromkeys(job.script for job in CHART_JOBS if job.func):
+            load_script(script)
+    return time.perf_counter() - start
+
+
+def render(patterns: list[str]) -> dict:
+    """Render matching jobs in-process; returns a JSON-serializable report."""
+    from build_charts import MANIFEST_PATH, load_manifest, record_outputs, save_manifest
+    from chart_fingerprint import job_dependencies
+
+    jobs = select_jobs(patterns)
+    if not jobs:
+        return {"ok": False, "error": f"no jobs match {patterns}", "results": []}
+
+    reloaded = invalidate_changed_modules()
+    manifest = load_manifest(MANIFEST_PATH)
+    results = []
+    for job in jobs:
+        deps = job_dependencies(job)
+        try:
+            seconds, log = run_job(job)
+        except Exception:
+            results.append({"job": job.name, "ok": False, "error": traceback.format_exc()})
+            continue
+        record_outputs(job, deps, manifest)
+        results.append({"job": job.name, "ok": True, "seconds": round(seconds, 3),
+                        "outputs": list(job.outputs), "log": log})
+    save_manifest(manifest, MANIFEST_PATH)
+    return {"ok": all(r["ok"] for r in results), "reloaded": reloaded, "results": results}
+
+
+class RenderHandler(BaseHTTPRequestHandler):
+    server_version = "ChartRenderServer/1"
+
+    def _send(self, status: int, payload: dict) -> None:
+        body = json.dumps(payload, indent=2).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        if self.path == "/health":
+            self._send(200, {"ok": True, "pid": os.getpid()})
+        elif self.path == "/jobs":
+            self._send(200, {"jobs": [{"name": j.name, "outputs": list(j.outputs)} for j in CHART_JOBS]})
+        else:
+            self._send(404, {"ok": False, "error": f"unknown path {self.path}"})
+
+    def do_POST(self) -> None:
+        if self.path != "/render":
+            self._send(404, {"ok": False, "error": f"unknown path {self.path}"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", "0"))
+            request = json.loads(self.rfile.read(length) or b"{}")
+            patterns = request.get("charts") or []
+            if isinstance(patterns, str):
+                patterns = [patterns]
+        except (ValueError, AttributeError) as exc:
+            self._send(400, {"ok": False, "error": f"bad request: {exc}"})
+            return
+        if not patterns:
+            self._send(400, {"ok": False, "error": "request must name at least one chart"})
+            return
+        report = render(patterns)
+        self._send(200 if report["ok"] else 500, report)
+
+    def log_message(self, fmt: str, *args) -> None:
+        sys.stderr.write(f"[render-server] {fmt % args}\n")
+
+
+def serve(port: int, preload: bool) -> int:
+    warm = warm_up(preload)
+    httpd = HTTPServer(("127.0.0.1", port), RenderHandler)
+    print(f"Render server warm in {warm:.2f}s; listening on http://127.0.0.1:{httpd.server_port}")
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        httpd.server_close()
+    return 0
+
+
+def request_render(patterns: list[str], port: int) -> int:
+    data = json.dumps({"charts": patterns}).encode("utf-8")
+    req = urllib.request.Request(
+        f"http://127.0.0.1:{port}/render",
+        data=data,
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(req) as resp:
+            report = json.loads(resp.read())
+    except urllib.error.HTTPError as exc:
+        report = json.loads(exc.read())
+    except urllib.error.URLError as exc:
+        print(f"Render server not reachable on port {port}: {exc.reason}")
+        print("Start it with: uv run python scripts/render_server.py serve")
+        return 2
+
+    if report.get("reloaded"):
+        print(f"reloaded: {', '.join(report['reloaded'])}")
+    if report.get("error"):
+        print(f"FAIL: {report['error']}")
+    for r in report.get("results", []):
+        if r["ok"]:
+            print(f"  [  ok] {r['job']:<45} {r['seconds']:7.2f}s")
+        else:
+            print(f"  [FAIL] {r['job']}\n{r['error']}")
+    print(f"round trip {time.perf_counter() - start:.2f}s")
+    return 0 if report.get("ok") else 1
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_serve = sub.add_parser("serve", help="Start the warm render server")
+    p_serve.add_argument("--port", type=int, default=DEFAULT_PORT)
+    p_serve.add_argument("--preload", action="store_true", help="Import every generator script up front")
+
+    p_render = sub.add_parser("render", help="Ask a running server to render charts")
+    p_render.add_argument("charts", nargs="+", help="Job names or globs (see build_charts.py --list)")
+    p_render.add_argument("--port", type=int, default=DEFAULT_PORT)
+
+    args = parser.parse_args()
+    if args.command == "serve":
+        return serve(args.port, args.preload)
+    return request_render(args.charts, args.port)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,338 @@
+"""
+Local SQLite warehouse of every dataset in the repo, plus a query CLI.
+
+Tables:
+  - every data/*.csv (via scripts/dataset_registry.py), named by file stem,
+  - research/*.csv, named research_<stem> (dashes become underscores),
+  - fintech_funding_data.py: fintech_funding (year x category, long, with
+    the CONFIDENCE grade), fintech_total_investment_kpmg,
+    fintech_total_vc_funding,
+  - x402_data.py: one x402_<name> table per lazy frame (DAILY_TX_MILESTONES,
+    CHAIN_DATA, ...), and x402_metrics (DEVELOPER_METRICS, PAYMENT_METRICS
+    and FORECASTS as group/key/value rows).
+
+Columns named year, category, stage, date, cohort, ... are indexed, plus a
+composite index over whichever of (year, category, stage) a table has.
+Dates are stored as ISO text.
+
+Builds are incremental: the _sources table records the sha256 of the file
+each table came from, and only tables whose source changed are reloaded.
+Querying needs only the standard library, so ad-hoc SQL runs without
+importing pandas or the data modules; the warehouse is built on first use.
+
+Usage:
+    uv run python scripts/warehouse.py build [--force]
+    uv run python scripts/warehouse.py tables
+    uv run python scripts/warehouse.py schema fintech_stage_totals_by_year_estimated
+    uv run python scripts/warehouse.py query "
+        SELECT s.year, s.stage, s.funding_b, v.vc_b
+        FROM fintech_stage_totals_by_year_estimated s
+        JOIN fintech_total_vc_funding v USING (year)
+        WHERE s.stage = 'Seed / Pre-Seed'"
+    uv run python scripts/warehouse.py query --csv "SELECT * FROM x402_chain_data" > chain.csv
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import hashlib
+import sqlite3
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+
+ROOT = Path(__file__).resolve().parent.parent
+WAREHOUSE_PATH = ROOT / ".cache" / "warehouse.sqlite"
+
+INDEX_COLUMNS = (
+    "year", "category", "stage", "date", "cohort", "as_of_date_utc", "week_start",
+    "metric_group", "metric_name", "opportunity", "source_id", "claim_id",
+)
+COMPOSITE_INDEX = ("year", "category", "stage")
+
+
+def _sha256(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+# =============================================================================
+# Table sources
+# =============================================================================
+# Each source is (table name, repo-relative file it is derived from, loader).
+# Loaders import pandas and the data modules lazily; queries never call them.
+
+def _dataset_loader(name: str):
+    def load():
+        from dataset_registry import load_dataset
+
+        return load_dataset(name)
+
+    return load
+
+
+def _csv_loader(path: Path):
+    def load():
+        import pandas as pd
+
+        return pd.read_csv(path)
+
+    return load
+
+
+def _fintech_tables() -> dict:
+    import pandas as pd
+
+    import fintech_funding_data as ffd
+
+    matrix = ffd.funding_matrix()
+    funding = pd.DataFrame(
+        {
+            "year": [y for y in ffd.YEARS for _ in ffd.CATEGORIES],
+            "category": list(ffd.CATEGORIES) * len(ffd.YEARS),
+            "funding_b": matrix.ravel(),
+        }
+    )
+    funding["confidence"] = [
+        ffd.CONFIDENCE.get(c, {}).get(y) for y, c in zip(funding["year"], funding["category"])
+    ]
+    kpmg = pd.DataFrame(
+        [(y, total, deals, note) for y, (total, deals, note) in ffd.TOTAL_FINTECH_INVESTMENT_KPMG.items()],
+        columns=["year", "total_b", "deals", "source_note"],
+    )
+    vc = pd.DataFrame(
+        [(y, vc_b, note) for y, (vc_b, note) in ffd.TOTAL_FINTECH_VC_FUNDING.items()],
+        columns=["year", "vc_b", "source_note"],
+    )
+    return {"fintech_funding": funding, "fintech_total_investment_kpmg": kpmg, "fintech_total_vc_funding": vc}
+
+
+def _x402_tables() -> dict:
+    import pandas as pd
+
+    import x402_data
+
+    tables = {f"x402_{name.lower()}": x402_data.load_frame(name) for name in x402_data._LAZY_FRAMES}
+    rows = [
+        (group, key, str(value))
+        for group, metrics in (
+            ("developer", x402_data.DEVELOPER_METRICS),
+            ("payment", x402_data.PAYMENT_METRICS),
+            ("forecast", x402_data.FORECASTS),
+        )
+        for key, value in metrics.items()
+    ]
+    tables["x402_metrics"] = pd.DataFrame(rows, columns=["metric_group", "metric_name", "value"])
+    return tables
+
+
+def table_sources() -> list[tuple[str, str, object]]:
+    """(table or module group, source file, loader) for everything the warehouse holds."""
+    sources = []
+    for path in sorted((ROOT / "data").glob("*.csv")):
+        sources.append((path.stem, path.relative_to(ROOT).as_posix(), _dataset_loader(path.stem)))
+    for path in sorted((ROOT / "research").glob("*.csv")):
+        table = "research_" + path.stem.replace("-", "_")
+        sources.append((table, path.relative_to(ROOT).as_posix(), _csv_loader(path)))
+    # Module groups load several tables at once; the group name keys _sources.
+    sources.append(("fintech_funding_data", "data/fintech_funding_data.py", _fintech_tables))
+    sources.append(("x402_data", "data/x402_data.py", _x402_tables))
+    return sources
+
+
+# =============================================================================
+# Build
+# =============================================================================
+
+def _prepare(frame):
+    """Dates as ISO text, everything else as-is."""
+    import pandas as pd
+
+    frame = frame.copy()
+    if isinstance(frame.index, pd.MultiIndex) or frame.index.name is not None:
+        frame = frame.reset_index()
+    for col in frame.columns:
+        if pd.api.types.is_datetime64_any_dtype(frame[col]):
+            frame[col] = frame[col].dt.strftime("%Y-%m-%d")
+    return frame
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _load_table(conn: sqlite3.Connection, table: str, frame) -> None:
+    frame = _prepare(frame)
+    conn.execute(f"DROP TABLE IF EXISTS {_quote(table)}")
+    frame.to_sql(table, conn, index=False)
+    columns = list(frame.columns)
+    for col in columns:
+        if col in INDEX_COLUMNS:
+            conn.execute(f"CREATE INDEX {_quote(f'ix_{table}_{col}')} ON {_quote(table)} ({_quote(col)})")
+    composite = [c for c in COMPOSITE_INDEX if c in columns]
+    if len(composite) > 1:
+        cols = ", ".join(_quote(c) for c in composite)
+        conn.execute(f"CREATE INDEX {_quote(f'ix_{table}_' + '_'.join(composite))} ON {_quote(table)} ({cols})")
+
+
+def build(path: Path = WAREHOUSE_PATH, force: bool = False, verbose: bool = True) -> int:
+    """(Re)load tables whose source file changed; returns the number of sources reloaded."""
+    for p in (ROOT, ROOT / "data"):
+        if str(p) not in sys.path:
+            sys.path.insert(0, str(p))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    start = time.perf_counter()
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS _sources ("
+        "name TEXT PRIMARY KEY, source TEXT, sha256 TEXT, tables TEXT, rows INTEGER, built_utc TEXT)"
+    )
+    recorded = {row[0]: row for row in conn.execute("SELECT name, sha256, tables FROM _sources")}
+
+    reloaded = 0
+    current = set()
+    for name, source, loader in table_sources():
+        current.add(name)
+        digest = _sha256(ROOT / source)
+        if not force and name in recorded and recorded[name][1] == digest:
+            continue
+        result = loader()
+        tables = result if isinstance(result, dict) else {name: result}
+        with conn:
+            for old in (recorded[name][2].split(",") if name in recorded else []):
+                if old not in tables:
+                    conn.execute(f"DROP TABLE IF EXISTS {_quote(old)}")
+            for table, frame in tables.items():
+                _load_table(conn, table, frame)
+            conn.execute(
+                "INSERT OR REPLACE INTO _sources VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    name,
+                    source,
+                    digest,
+                    ",".join(tables),
+                    sum(len(f) for f in tables.values()),
+                    datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                ),
+            )
+        reloaded += 1
+        if verbose:
+            print(f"  loaded {source} -> {', '.join(tables)}")
+
+    with conn:
+        for name in set(recorded) - current:
+            for old in recorded[name][2].split(","):
+                conn.execute(f"DROP TABLE IF EXISTS {_quote(old)}")
+            conn.execute("DELETE FROM _sources WHERE name = ?", (name,))
+    conn.execute("ANALYZE")
+    conn.close()
+    if verbose:
+        print(f"{reloaded} source(s) reloaded in {time.perf_counter() - start:.2f}s -> {path}")
+    return reloaded
+
+
+# =============================================================================
+# Query
+# =============================================================================
+
+def connect(path: Path = WAREHOUSE_PATH) -> sqlite3.Connection:
+    if not path.exists():
+        print(f"Building {path} (first use)...", file=sys.stderr)
+        build(path, verbose=False)
+    return sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+
+
+def _format_cell(value) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, float):
+        return f"{value:.6g}"
+    return str(value)
+
+
+def print_rows(columns: list[str], rows: list[tuple], limit: int | None) -> None:
+    shown = rows if limit is None else rows[:limit]
+    cells = [[_format_cell(v) for v in row] for row in shown]
+    widths = [min(60, max([len(c)] + [len(r[i]) for r in cells])) for i, c in enumerate(columns)]
+    print("  ".join(c.ljust(w) for c, w in zip(columns, widths)))
+    print("  ".join("-" * w for w in widths))
+    for row in cells:
+        print("  ".join(v[:w].ljust(w) for v, w in zip(row, widths)))
+    suffix = f" (showing {len(shown)})" if len(shown) < len(rows) else ""
+    print(f"({len(rows)} row{'s' if len(rows) != 1 else ''}){suffix}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--db", type=Path, default=WAREHOUSE_PATH, help="SQLite file")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_build = sub.add_parser("build", help="Load changed sources into the warehouse")
+    p_build.add_argument("--force", action="store_true", help="Reload every source")
+
+    p_query = sub.add_parser("query", help="Run a SQL query ('-' reads it from stdin)")
+    p_query.add_argument("sql")
+    p_query.add_argument("--csv", action="store_true", help="Write CSV to stdout instead of a table")
+    p_query.add_argument("--limit", type=int, default=200, help="Rows to print in table mode")
+
+    sub.add_parser("tables", help="List tables with row counts and sources")
+
+    p_schema = sub.add_parser("schema", help="Columns and indexes of a table")
+    p_schema.add_argument("table")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        build(args.db, force=args.force)
+        return 0
+
+    conn = connect(args.db)
+    if args.command == "tables":
+        sources = {}
+        for name, source, tables in conn.execute("SELECT name, source, tables FROM _sources"):
+            for table in tables.split(","):
+                sources[table] = source
+        rows = []
+        for (table,) in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE '\\_%' ESCAPE '\\' "
+            "AND name NOT LIKE 'sqlite_%' ORDER BY name"
+        ):
+            count = conn.execute(f"SELECT COUNT(*) FROM {_quote(table)}").fetchone()[0]
+            rows.append((table, count, sources.get(table, "")))
+        print_rows(["table", "rows", "source"], rows, None)
+    elif args.command == "schema":
+        columns = conn.execute(f"PRAGMA table_info({_quote(args.table)})").fetchall()
+        if not columns:
+            print(f"No table named {args.table!r}")
+            return 1
+        print_rows(["column", "type"], [(c[1], c[2]) for c in columns], None)
+        for (index,) in conn.execute(f"SELECT name FROM pragma_index_list({_quote(args.table)})"):
+            cols = [r[2] for r in conn.execute(f"PRAGMA index_info({_quote(index)})")]
+            print(f"index {index}: {', '.join(cols)}")
+    else:
+        sql = sys.stdin.read() if args.sql == "-" else args.sql
+        start = time.perf_counter()
+        try:
+            cursor = conn.execute(sql)
+        except sqlite3.Error as exc:
+            print(f"SQL error: {exc}")
+            return 1
+        rows = cursor.fetchall()
+        elapsed = time.perf_counter() - start
+        columns = [d[0] for d in cursor.description or []]
+        if args.csv:
+            writer = csv.writer(sys.stdout)
+            writer.writerow(columns)
+            writer.writerows(rows)
+        else:
+            print_rows(columns, rows, args.limit)
+            print(f"{elapsed * 1000:.1f} ms")
+    conn.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
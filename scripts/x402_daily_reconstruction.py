@@ -0,0 +1,277 @@
+"""
+Continuous daily x402 transaction series, reconstructed from sparse anchors.
+
+DAILY_TX_MILESTONES (17 daily readings) and CUMULATIVE_TX (running totals) in
+data/x402_data.py are the only hard numbers. This engine finds the one daily
+series d >= 0, launch to the last anchor, that best agrees with both at once:
+
+    minimise   sum_k  w_k   (log d[t_k] - log m_k)^2                  daily milestones
+             + sum_j  w_c   (log sum_{a_j < t <= b_j} d[t] - log dC_j)^2   cumulative increments
+             + lam   sum_t  (log d[t-1] - 2 log d[t] + log d[t+1])^2    smoothness
+             + w_cap sum_t  max(0, log d[t] - log max_k m_k)^2          no day above the peak milestone
+
+Working in log space keeps every day positive and makes a 50 tx/day launch and
+a 3M tx/day peak count equally. The problem is solved as stacked linear least
+squares (Levenberg-Marquardt, one np.linalg.lstsq per step, started from
+log-linear interpolation of the milestones). The cumulative totals weigh far
+more than the milestones, so they are met to a fraction of a percent; each
+increment is then rescaled onto its total exactly. cumulative_tx is the
+running sum of daily_tx from the first total (0 at launch), so its
+day-over-day difference is daily_tx and it passes through every total.
+
+The anchors disagree: the totals from mid-November to mid-January need ~2M
+tx/day, well above the 200K-800K daily readings there, and the late-October
+total is below what the October peaks imply. The milestones give way, and
+`anchor_report()` lists each anchor's residual. --check fails if a
+cumulative total misses by more than ANCHOR_TOLERANCE.
+
+The result is cached as the dataset x402_daily_tx_reconstructed
+(data/x402_daily_tx_reconstructed.csv). The milestone and cumulative anchors
+are stored alongside the series, so daily_tx_series() can tell when
+x402_data.py has changed and rebuilds the file instead of serving a stale one.
+
+Outputs:
+  - data/x402_daily_tx_reconstructed.csv
+    (date, daily_tx, cumulative_tx, milestone_tx, cumulative_anchor_tx)
+
+Usage:
+    from x402_daily_reconstruction import daily_tx_series
+    daily = daily_tx_series()          # dense frame, one row per day
+
+    uv run python scripts/x402_daily_reconstruction.py           # rebuild and print residuals
+    uv run python scripts/x402_daily_reconstruction.py --check   # exit 1 if stale or a total is missed
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from dataset_registry import load_dataset, register_dataset, write_dataset
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "data"))
+
+import x402_data
+
+
+DATASET_NAME = "x402_daily_tx_reconstructed"
+DATASET_PATH = register_dataset(DATASET_NAME).abspath
+
+MILESTONE_WEIGHT = 1.0
+ESTIMATED_MILESTONE_WEIGHT = 0.5
+CUMULATIVE_WEIGHT = 1e4
+CAP_WEIGHT = 1e4
+SMOOTHNESS = 4.0
+MAX_ITERATIONS = 500
+TOLERANCE = 1e-10
+ANCHOR_TOLERANCE = 0.03  # relative miss allowed on a cumulative total
+
+
+@dataclass(frozen=True)
+class DailyReconstruction:
+    dates: pd.DatetimeIndex
+    daily_tx: np.ndarray
+    milestones: pd.DataFrame  # date, daily_tx, weight
+    cumulative: pd.DataFrame  # date, cumulative_tx
+    iterations: int
+
+    def to_frame(self) -> pd.DataFrame:
+        frame = pd.DataFrame({"date": self.dates, "daily_tx": np.round(self.daily_tx).astype("int64")})
+        # Running total from the first cumulative total; that day's own transactions precede it.
+        first = self.cumulative.iloc[0]
+        after = (frame["date"] > first["date"]).to_numpy()
+        frame["cumulative_tx"] = first["cumulative_tx"] + np.cumsum(np.where(after, frame["daily_tx"], 0))
+        frame["milestone_tx"] = frame["date"].map(self.milestones.set_index("date")["daily_tx"]).astype("Int64")
+        frame["cumulative_anchor_tx"] = (
+            frame["date"].map(self.cumulative.set_index("date")["cumulative_tx"]).astype("Int64")
+        )
+        return frame
+
+    def anchor_report(self) -> pd.DataFrame:
+        """Every anchor with its fitted value and relative residual."""
+        frame = self.to_frame().set_index("date")
+        rows = [("daily", d, m, frame.at[d, "daily_tx"]) for d, m in zip(self.milestones["date"], self.milestones["daily_tx"])]
+        rows += [
+            ("cumulative", d, c, frame.at[d, "cumulative_tx"])
+            for d, c in zip(self.cumulative["date"], self.cumulative["cumulative_tx"])
+        ]
+        report = pd.DataFrame(rows, columns=["kind", "date", "target", "fitted"])
+        # Relative residual; a zero anchor (the launch-day total) is compared absolutely.
+        report["rel_error"] = (report["fitted"] - report["target"]) / report["target"].where(report["target"] != 0, 1)
+        return report
+
+    def anchor_misses(self, tolerance: float = ANCHOR_TOLERANCE) -> pd.DataFrame:
+        """Cumulative totals the series misses by more than `tolerance`."""
+        report = self.anchor_report()
+        held = report[report["kind"] == "cumulative"]
+        return held[held["rel_error"].abs() > tolerance]
+
+
+def _milestones() -> pd.DataFrame:
+    frame = x402_data.DAILY_TX_MILESTONES[["date", "daily_tx", "source"]].copy()
+    estimated = frame["source"].str.lower().str.startswith("est")
+    frame["weight"] = np.where(estimated, ESTIMATED_MILESTONE_WEIGHT, MILESTONE_WEIGHT)
+    return frame.drop(columns="source").sort_values("date", ignore_index=True)
+
+
+def _cumulative() -> pd.DataFrame:
+    return x402_data.CUMULATIVE_TX[["date", "cumulative_tx"]].sort_values("date", ignore_index=True)
+
+
+def reconstruct_daily_tx(
+    smoothness: float = SMOOTHNESS,
+    cumulative_weight: float = CUMULATIVE_WEIGHT,
+) -> DailyReconstruction:
+    """Least-squares daily series held to the cumulative totals and as close to the milestones as they allow."""
+    milestones = _milestones()
+    cumulative = _cumulative()
+    start = min(milestones["date"].min(), cumulative["date"].min())
+    end = max(milestones["date"].max(), cumulative["date"].max())
+    dates = pd.date_range(start, end, freq="D")
+    n = len(dates)
+    t = (dates - start).days.to_numpy()
+
+    m_idx = (milestones["date"] - start).dt.days.to_numpy()
+    m_log = np.log(milestones["daily_tx"].to_numpy(dtype=float))
+    m_w = np.sqrt(milestones["weight"].to_numpy())
+    cap = m_log.max()
+
+    # Cumulative increments over (a_j, b_j] as a day-membership matrix.
+    c_idx = (cumulative["date"] - start).dt.days.to_numpy()
+    increments = np.diff(cumulative["cumulative_tx"].to_numpy(dtype=float))
+    keep = increments > 0
+    lo, hi = c_idx[:-1][keep], c_idx[1:][keep]
+    members = ((t[None, :] > lo[:, None]) & (t[None, :] <= hi[:, None])).astype(float)
+    c_log = np.log(increments[keep])
+    c_w = np.sqrt(cumulative_weight)
+
+    # Second differences; their rows are linear in log d, so J is constant there.
+    d2 = np.zeros((n - 2, n))
+    rows = np.arange(n - 2)
+    d2[rows, rows], d2[rows, rows + 1], d2[rows, rows + 2] = 1.0, -2.0, 1.0
+    d2 *= np.sqrt(smoothness)
+
+    picker = np.zeros((len(m_idx), n))
+    picker[np.arange(len(m_idx)), m_idx] = 1.0
+    picker *= m_w[:, None]
+    cap_w = np.sqrt(CAP_WEIGHT)
+
+    def residuals(y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        x = np.exp(y)
+        sums = members @ x
+        over = np.maximum(y - cap, 0.0)
+        r = np.concatenate([m_w * (y[m_idx] - m_log), c_w * (np.log(sums) - c_log), d2 @ y, cap_w * over])
+        jac = np.vstack([picker, c_w * members * x[None, :] / sums[:, None], d2, cap_w * np.diag(over > 0)])
+        return r, jac
+
+    y = np.interp(t, m_idx, m_log)
+    r, jac = residuals(y)
+    cost = r @ r
+    damping = 1e-3
+    iterations = 0
+    for iterations in range(1, MAX_ITERATIONS + 1):
+        a = np.vstack([jac, np.sqrt(damping) * np.eye(n)])
+        b = np.concatenate([-r, np.zeros(n)])
+        step = np.linalg.lstsq(a, b, rcond=None)[0]
+        r_new, jac_new = residuals(y + step)
+        cost_new = r_new @ r_new
+        if cost_new < cost:
+            y, r, jac = y + step, r_new, jac_new
+            converged = cost - cost_new <= TOLERANCE * max(cost, 1.0)
+            cost = cost_new
+            damping = max(damping / 3.0, 1e-12)
+            if converged:
+                break
+        else:
+            damping *= 4.0
+            if damping > 1e10:
+                break
+
+    # The weighted fit leaves the totals a fraction of a percent off; put each increment on its total.
+    daily = np.exp(y)
+    scale = increments[keep] / (members @ daily)
+    daily *= np.where(members.any(axis=0), scale @ members, 1.0)
+    return DailyReconstruction(dates, daily, milestones[["date", "daily_tx", "weight"]], cumulative, iterations)
+
+
+# =============================================================================
+# Cached dataset
+# =============================================================================
+
+def _is_current(frame: pd.DataFrame) -> bool:
+    """True if the stored anchors are exactly the ones in x402_data.py now."""
+    stored_m = frame.loc[frame["milestone_tx"].notna(), ["date", "milestone_tx"]]
+    stored_c = frame.loc[frame["cumulative_anchor_tx"].notna(), ["date", "cumulative_anchor_tx"]]
+    milestones, cumulative = _milestones(), _cumulative()
+    return (
+        list(stored_m["date"]) == list(milestones["date"])
+        and list(stored_m["milestone_tx"]) == list(milestones["daily_tx"])
+        and list(stored_c["date"]) == list(cumulative["date"])
+        and list(stored_c["cumulative_anchor_tx"]) == list(cumulative["cumulative_tx"])
+    )
+
+
+def _read_cached() -> pd.DataFrame | None:
+    if not DATASET_PATH.exists():
+        return None
+    frame = load_dataset(DATASET_NAME)
+    return frame if _is_current(frame) else None
+
+
+def build_daily_tx_dataset(fit: DailyReconstruction | None = None) -> pd.DataFrame:
+    """Reconstruct the series (unless given) and write it to the dataset CSV."""
+    frame = (fit or reconstruct_daily_tx()).to_frame()
+    out = frame.copy()
+    out["date"] = out["date"].dt.strftime("%Y-%m-%d")
+    write_dataset(DATASET_NAME, out)
+    return frame
+
+
+def daily_tx_series() -> pd.DataFrame:
+    """Dense daily series, from the cached dataset unless its anchors are out of date."""
+    frame = _read_cached()
+    return frame if frame is not None else build_daily_tx_dataset()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--check", action="store_true", help="Exit 1 if the dataset is stale or misses a total")
+    args = parser.parse_args()
+
+    fit = reconstruct_daily_tx()
+    misses = fit.anchor_misses()
+    if args.check:
+        current = _read_cached() is not None
+        print(f"{DATASET_PATH.relative_to(ROOT)}: {'up to date' if current else 'STALE'}")
+        for row in misses.itertuples():
+            print(f"  cumulative total {row.date:%Y-%m-%d} missed by {row.rel_error:+.1%}")
+        return 0 if current and misses.empty else 1
+
+    build_daily_tx_dataset(fit)
+    report = fit.anchor_report()
+    print(f"{len(fit.dates)} days, {fit.iterations} iterations, "
+          f"peak {fit.daily_tx.max():,.0f} tx/day on {fit.dates[fit.daily_tx.argmax()]:%Y-%m-%d}")
+    print(report.to_string(
+        index=False,
+        formatters={
+            "date": lambda d: d.strftime("%Y-%m-%d"),
+            "target": "{:,.0f}".format,
+            "fitted": "{:,.0f}".format,
+            "rel_error": "{:+.1%}".format,
+        },
+    ))
+    print(f"\n{len(misses)} cumulative total(s) missed by more than {ANCHOR_TOLERANCE:.0%}")
+    print(f"Saved: {DATASET_PATH.relative_to(ROOT)}")
+    return 1 if len(misses) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,509 @@
+"""
+Streaming ingestion of raw x402 payment exports (Dune-style CSVs).
+
+Reads one or more exports of individual payments in fixed-size chunks, so a
+full-history export of tens of millions of rows is never loaded whole, and
+produces the tables that are otherwise summarised by hand into
+data/x402_data.py:
+
+  - chain_data.csv          CHAIN_DATA shape: date, <chain>_tx (cumulative),
+                            <chain>_pct, source
+  - facilitator_share.csv   FACILITATOR_SHARE shape: date, coinbase, dexter,
+                            payai, daydreams, others (% of that day's tx), source
+  - user_metrics.csv        USER_METRICS shape: date, buyers, sellers
+                            (cumulative unique addresses), source
+  - daily_activity.csv      long form: date, chain, facilitator, tx, volume_usd
+  - daily_users.csv         date, scope (all/chain/facilitator), key, new and
+                            cumulative unique buyers and sellers
+
+Method:
+  - Columns are matched by common Dune names (block_time/evt_block_time/day,
+    blockchain/chain, facilitator, payer/buyer/from, payee/seller/to,
+    amount_usd/value_usd, tx_hash/evt_tx_hash, evt_index/log_index); only
+    those columns are read.
+  - Per chunk, payments are grouped by day x chain x facilitator and added to
+    a running table, so chunk boundaries never matter.
+  - Buyers and sellers are tracked exactly as (64-bit address hash -> first
+    day seen) arrays, overall and per chain / facilitator, merged chunk by
+    chunk by keeping the earliest day, so results do not depend on row order
+    or chunking. These arrays grow with the number of distinct addresses, not
+    rows. A hash collision needs ~4e9 addresses to become likely, so counts
+    are exact in practice.
+  - Payments are deduplicated by their natural key: (chain, tx hash, log
+    index) when the export has a tx hash, otherwise (time, chain, buyer,
+    seller, amount). Keys are kept as sorted 64-bit hashes per day, so a
+    payment seen in an earlier export or chunk is dropped even when exports
+    overlap, and only the days a chunk touches are merged. This is the one
+    structure that grows with payments (8 bytes each); a hash collision
+    within a single day needs ~4e9 payments that day to become likely.
+  - State (running table, first-seen arrays, seen payment keys, ingested
+    files by sha256) is pickled with --state, so a later export adds only the
+    payments not already counted, even if its date range overlaps an earlier
+    one, and an export that was already ingested is skipped outright.
+
+Usage:
+    uv run python scripts/x402_payment_ingest.py exports/x402_payments_*.csv.gz
+    uv run python scripts/x402_payment_ingest.py new_week.csv --state .cache/x402_ingest/state.pkl
+    uv run python scripts/x402_payment_ingest.py export.csv --print-rows   # rows to paste into x402_data.py
+    uv run python scripts/x402_payment_ingest.py --make-sample /tmp/sample.csv --rows 2000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import pickle
+import re
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "data"))
+
+DEFAULT_OUT_DIR = ROOT / ".cache" / "x402_ingest"
+DEFAULT_CHUNK_ROWS = 1_000_000
+STATE_VERSION = 2
+
+# Canonical column -> accepted export column names (first match wins).
+COLUMN_ALIASES = {
+    "time": ("block_time", "evt_block_time", "block_timestamp", "timestamp", "block_date", "day", "date"),
+    "chain": ("blockchain", "chain", "network"),
+    "facilitator": ("facilitator", "facilitator_name", "facilitator_label"),
+    "buyer": ("buyer", "payer", "from", "tx_from", "sender"),
+    "seller": ("seller", "payee", "to", "recipient", "pay_to"),
+    "amount_usd": ("amount_usd", "value_usd", "usd_amount", "amount"),
+    "tx_hash": ("tx_hash", "evt_tx_hash", "hash", "transaction_hash"),
+    "log_index": ("evt_index", "log_index", "event_index"),
+}
+REQUIRED_COLUMNS = ("time", "chain", "facilitator", "buyer", "seller")
+
+# FACILITATOR_SHARE columns; anything else is "others".
+FACILITATORS = ("coinbase", "dexter", "payai", "daydreams")
+FACILITATOR_ALIASES = {
+    "coinbase": "coinbase", "coinbasecdp": "coinbase", "cdp": "coinbase",
+    "dexter": "dexter",
+    "payai": "payai",
+    "daydreams": "daydreams",
+}
+# CHAIN_DATA lists these first; other chains follow alphabetically.
+CHAIN_ORDER = ("base", "solana")
+
+
+def _normalise_facilitator(name: str) -> str:
+    key = re.sub(r"[^a-z0-9]", "", str(name).lower())
+    return FACILITATOR_ALIASES.get(key, "others")
+
+
+def resolve_columns(header: list[str]) -> dict[str, str]:
+    """Canonical name -> export column; raises if a required column is missing."""
+    lower = {h.lower(): h for h in header}
+    resolved = {}
+    for canonical, aliases in COLUMN_ALIASES.items():
+        for alias in aliases:
+            if alias in lower:
+                resolved[canonical] = lower[alias]
+                break
+    missing = [c for c in REQUIRED_COLUMNS if c not in resolved]
+    if missing:
+        wanted = "; ".join(f"{c}: {'/'.join(COLUMN_ALIASES[c])}" for c in missing)
+        raise ValueError(f"export lacks required columns ({wanted}); header: {', '.join(header)}")
+    return resolved
+
+
+def day_numbers(times: pd.Series) -> np.ndarray:
+    """Days since 1970-01-01 (int32) of timestamp strings; each distinct day is parsed once."""
+    codes, day_strings = pd.factorize(times.astype(str).str.slice(0, 10))
+    parsed = pd.to_datetime(pd.Index(day_strings), format="%Y-%m-%d")
+    return parsed.to_numpy().astype("datetime64[D]").astype(np.int64).astype(np.int32)[codes]
+
+
+def normalise_chain(chains: pd.Series) -> np.ndarray:
+    return chains.astype(str).str.lower().str.strip().to_numpy(dtype=object)
+
+
+def address_hashes(addresses: pd.Series) -> np.ndarray:
+    """64-bit hashes of case-folded addresses (the identity used for unique counts)."""
+    return pd.util.hash_array(addresses.astype(str).str.lower().to_numpy(dtype=object))
+
+
+def _value_hashes(values: pd.Series) -> np.ndarray:
+    """64-bit hash per value of a low-cardinality column; each distinct value is hashed once."""
+    codes, uniques = pd.factorize(values, use_na_sentinel=False)
+    folded = pd.Index(uniques).astype(str).str.lower().str.strip()
+    return pd.util.hash_array(folded.to_numpy(dtype=object))[codes]
+
+
+def payment_keys(chunk: pd.DataFrame) -> np.ndarray:
+    """64-bit hash of each payment's natural key (see the module docstring)."""
+    if "tx_hash" in chunk:
+        parts = [address_hashes(chunk["tx_hash"]), _value_hashes(chunk["chain"])]
+        if "log_index" in chunk:
+            parts.append(_value_hashes(chunk["log_index"]))
+    else:
+        parts = [
+            pd.util.hash_array(chunk["time"].astype(str).to_numpy(dtype=object)),
+            _value_hashes(chunk["chain"]),
+            address_hashes(chunk["buyer"]),
+            address_hashes(chunk["seller"]),
+        ]
+        if "amount_usd" in chunk:
+            parts.append(pd.util.hash_array(chunk["amount_usd"].astype(str).to_numpy(dtype=object)))
+    key = parts[0]
+    for part in parts[1:]:
+        key = key * _MIX ^ part
+    return key
+
+
+def iter_chunks(path: Path, chunk_rows: int = DEFAULT_CHUNK_ROWS):
+    """Chunks of an export with canonical column names (see COLUMN_ALIASES)."""
+    header = pd.read_csv(path, nrows=0).columns.tolist()
+    columns = resolve_columns(header)
+    rename = {v: k for k, v in columns.items()}
+    text_columns = [*REQUIRED_COLUMNS, "tx_hash", "log_index"]
+    reader = pd.read_csv(
+        path,
+        usecols=list(columns.values()),
+        dtype={columns[c]: "string" for c in text_columns if c in columns},
+        chunksize=chunk_rows,
+    )
+    for chunk in reader:
+        yield chunk.rename(columns=rename)
+
+
+# =============================================================================
+# Incremental state
+# =============================================================================
+
+SCOPES = ("all", "chain", "facilitator")
+_MIX = np.uint64(0x9E3779B97F4A7C15)
+
+
+def _merge_first_seen(known: tuple[np.ndarray, ...], new: tuple[np.ndarray, ...]) -> tuple[np.ndarray, ...]:
+    """Union of two (hash, first day, label) maps keeping each hash's earliest day; sorted by hash."""
+    h, d, label = (np.concatenate([a, b]) for a, b in zip(known, new))
+    order = np.lexsort((d, h))
+    h, d, label = h[order], d[order], label[order]
+    first = np.ones(len(h), dtype=bool)
+    first[1:] = h[1:] != h[:-1]
+    return h[first], d[first], label[first]
+
+
+def _empty_first_seen() -> tuple[np.ndarray, ...]:
+    return np.empty(0, dtype=np.uint64), np.empty(0, dtype=np.int32), np.empty(0, dtype=np.int16)
+
+
+@dataclass
+class IngestState:
+    # (day, chain, facilitator) -> tx, volume_usd
+    activity: pd.DataFrame = field(
+        default_factory=lambda: pd.DataFrame(
+            {"tx": pd.Series(dtype="int64"), "volume_usd": pd.Series(dtype="float64")},
+            index=pd.MultiIndex.from_arrays([[], [], []], names=["date", "chain", "facilitator"]),
+        )
+    )
+    # (role, scope) -> (address hash, first day seen as days since epoch, label index).
+    # Scope "all" hashes the address alone; "chain"/"facilitator" hash (label, address),
+    # so an address counts once per chain or facilitator it used.
+    first_seen: dict[tuple[str, str], tuple[np.ndarray, ...]] = field(
+        default_factory=lambda: {(role, scope): _empty_first_seen() for role in ("buyer", "seller") for scope in SCOPES}
+    )
+    labels: list[str] = field(default_factory=list)  # chain / facilitator names, indexed by label
+    # day (days since epoch) -> sorted payment key hashes already counted that day.
+    seen: dict[int, np.ndarray] = field(default_factory=dict)
+    files: dict[str, str] = field(default_factory=dict)  # sha256 -> file name
+    rows: int = 0
+    duplicates: int = 0
+
+    @classmethod
+    def load(cls, path: Path | None) -> "IngestState":
+        if path is None or not path.exists():
+            return cls()
+        with path.open("rb") as f:
+            payload = pickle.load(f)
+        if payload.get("version") != STATE_VERSION:
+            print(f"Ignoring state {path}: version {payload.get('version')} != {STATE_VERSION}")
+            return cls()
+        return payload["state"]
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        with tmp.open("wb") as f:
+            pickle.dump({"version": STATE_VERSION, "state": self}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp.replace(path)
+
+    def _label_codes(self, values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """State-wide label index and a hash per value (values are few distinct strings)."""
+        codes, uniques = pd.factorize(values)
+        for name in uniques:
+            if name not in self.labels:
+                self.labels.append(name)
+        index = np.array([self.labels.index(name) for name in uniques], dtype=np.int16)
+        hashes = pd.util.hash_array(np.asarray(uniques, dtype=object))
+        return index[codes], hashes[codes]
+
+    def _first_sightings(self, days: np.ndarray, keys: np.ndarray) -> np.ndarray:
+        """Mask of payments not counted before (in the state or earlier in this chunk); records them."""
+        keep = np.zeros(len(keys), dtype=bool)
+        order = np.argsort(days, kind="stable")
+        bounds = np.flatnonzero(np.diff(days[order])) + 1
+        for idx in np.split(order, bounds):
+            if not len(idx):
+                continue
+            day = int(days[idx[0]])
+            uniq, first = np.unique(keys[idx], return_index=True)
+            known = self.seen.get(day)
+            new = np.ones(len(uniq), dtype=bool) if known is None else ~np.isin(uniq, known, assume_unique=True)
+            keep[idx[first[new]]] = True
+            self.seen[day] = uniq if known is None else np.union1d(known, uniq[new])
+        return keep
+
+    def add_chunk(self, chunk: pd.DataFrame) -> None:
+        """Fold one chunk (canonical columns) into the running aggregates, skipping payments already counted."""
+        days = day_numbers(chunk["time"])
+        keep = self._first_sightings(days, payment_keys(chunk))
+        if not keep.all():
+            self.duplicates += int((~keep).sum())
+            chunk, days = chunk[keep], days[keep]
+        if chunk.empty:
+            return
+        chain = normalise_chain(chunk["chain"])
+        fac_codes, fac_names = pd.factorize(chunk["facilitator"])
+        facilitator = np.array([_normalise_facilitator(n) for n in fac_names], dtype=object)[fac_codes]
+        amount = (
+            pd.to_numeric(chunk["amount_usd"], errors="coerce").fillna(0.0)
+            if "amount_usd" in chunk
+            else pd.Series(0.0, index=chunk.index)
+        )
+
+        keys = pd.DataFrame({"date": days, "chain": chain, "facilitator": facilitator})
+        part = (
+            keys.assign(tx=1, volume_usd=amount.to_numpy())
+            .groupby(["date", "chain", "facilitator"], sort=False)
+            .sum()
+        )
+        self.activity = self.activity.add(part, fill_value=0).astype({"tx": "int64"})
+
+        scoped = {"all": (np.full(len(chunk), -1, dtype=np.int16), np.zeros(len(chunk), dtype=np.uint64))}
+        scoped["chain"] = self._label_codes(chain)
+        scoped["facilitator"] = self._label_codes(facilitator)
+        for role in ("buyer", "seller"):
+            address = address_hashes(chunk[role])
+            for scope, (label, label_hash) in scoped.items():
+                h = address ^ (label_hash * _MIX)
+                key = (role, scope)
+                self.first_seen[key] = _merge_first_seen(self.first_seen[key], (h, days, label))
+        self.rows += len(chunk)
+
+
+def ingest_file(state: IngestState, path: Path, chunk_rows: int = DEFAULT_CHUNK_ROWS, verbose: bool = True) -> bool:
+    """Stream one export into the state; returns False if it was already ingested."""
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    sha = digest.hexdigest()
+    if sha in state.files:
+        if verbose:
+            print(f"  skip {path.name}: already ingested as {state.files[sha]}")
+        return False
+
+    start, rows, duplicates = time.perf_counter(), 0, state.duplicates
+    for chunk in iter_chunks(path, chunk_rows):
+        state.add_chunk(chunk)
+        rows += len(chunk)
+        if verbose:
+            print(f"\r  {path.name}: {rows:,} rows", end="", flush=True)
+    state.files[sha] = path.name
+    if verbose:
+        elapsed = time.perf_counter() - start
+        skipped = state.duplicates - duplicates
+        print(f"\r  {path.name}: {rows:,} rows ({skipped:,} already counted) in {elapsed:.1f}s "
+              f"({rows / max(elapsed, 1e-9):,.0f} rows/s)")
+    return True
+
+
+# =============================================================================
+# Output tables (shapes of the x402_data.py constants)
+# =============================================================================
+
+def _dates(day_numbers) -> pd.Series:
+    return pd.Series(np.asarray(day_numbers, dtype="datetime64[D]").astype("datetime64[s]")).dt.strftime("%Y-%m-%d")
+
+
+def _source(state: IngestState) -> str:
+    return "x402 payment export: " + ", ".join(sorted(state.files.values()))
+
+
+def chain_data(state: IngestState) -> pd.DataFrame:
+    daily = state.activity["tx"].groupby(level=["date", "chain"]).sum().unstack("chain", fill_value=0)
+    chains = [c for c in CHAIN_ORDER if c in daily.columns] + sorted(set(daily.columns) - set(CHAIN_ORDER))
+    cumulative = daily[chains].sort_index().cumsum()
+    out = pd.DataFrame({"date": _dates(cumulative.index).to_numpy()})
+    for chain in chains:
+        out[f"{chain}_tx"] = cumulative[chain].to_numpy()
+    total = cumulative.sum(axis=1).to_numpy()
+    for chain in chains:
+        out[f"{chain}_pct"] = np.round(cumulative[chain].to_numpy() / total * 100, 1)
+    out["source"] = _source(state)
+    return out
+
+
+def facilitator_share(state: IngestState) -> pd.DataFrame:
+    daily = state.activity["tx"].groupby(level=["date", "facilitator"]).sum().unstack("facilitator", fill_value=0)
+    daily = daily.reindex(columns=[*FACILITATORS, "others"], fill_value=0).sort_index()
+    share = daily.div(daily.sum(axis=1), axis=0).mul(100).round(1)
+    out = pd.DataFrame({"date": _dates(share.index).to_numpy()})
+    for col in share.columns:
+        out[col] = share[col].to_numpy()
+    out["source"] = _source(state)
+    return out
+
+
+def _new_per_day(state: IngestState, role: str, scope: str = "all") -> pd.Series:
+    """Addresses first seen per (day, label); label is "" for scope "all"."""
+    _, days, label = state.first_seen[(role, scope)]
+    names = np.array(state.labels + [""], dtype=object)[label]  # -1 -> ""
+    return pd.Series(1, index=pd.MultiIndex.from_arrays([days, names])).groupby(level=[0, 1]).sum()
+
+
+def user_metrics(state: IngestState) -> pd.DataFrame:
+    days = state.activity.index.get_level_values("date").unique().sort_values()
+    out = pd.DataFrame({"date": _dates(days).to_numpy()})
+    for role in ("buyer", "seller"):
+        new = _new_per_day(state, role).droplevel(1)
+        out[f"{role}s"] = new.reindex(days, fill_value=0).cumsum().to_numpy()
+    out["source"] = _source(state)
+    return out
+
+
+def daily_users(state: IngestState) -> pd.DataFrame:
+    """New and cumulative unique buyers/sellers per day, overall and per chain / facilitator."""
+    frames = []
+    for scope in SCOPES:
+        new = pd.concat(
+            {f"new_{role}s": _new_per_day(state, role, scope) for role in ("buyer", "seller")}, axis=1
+        ).fillna(0).astype("int64")
+        new.index.names = ["date", "key"]
+        new = new.sort_index()
+        cumulative = new.groupby(level="key").cumsum().rename(columns=lambda c: c.removeprefix("new_"))
+        frame = pd.concat([new, cumulative], axis=1).reset_index()
+        frame.insert(1, "scope", scope)
+        frames.append(frame)
+    out = pd.concat(frames, ignore_index=True)
+    out["date"] = _dates(out["date"]).to_numpy()
+    return out[["date", "scope", "key", "new_buyers", "new_sellers", "buyers", "sellers"]]
+
+
+def daily_activity(state: IngestState) -> pd.DataFrame:
+    out = state.activity.sort_index().reset_index()
+    out["volume_usd"] = out["volume_usd"].round(2)
+    out["date"] = _dates(out["date"]).to_numpy()
+    return out
+
+
+OUTPUT_TABLES = {
+    "chain_data": ("CHAIN_DATA", chain_data),
+    "facilitator_share": ("FACILITATOR_SHARE", facilitator_share),
+    "user_metrics": ("USER_METRICS", user_metrics),
+    "daily_activity": (None, daily_activity),
+    "daily_users": (None, daily_users),
+}
+
+
+def format_rows(constant: str, frame: pd.DataFrame) -> str:
+    """A `_<CONSTANT>_ROWS = [...]` literal in the style of data/x402_data.py."""
+    def literal(value) -> str:
+        value = value.item() if hasattr(value, "item") else value
+        return json.dumps(value) if isinstance(value, str) else repr(value)
+
+    lines = [f"_{constant}_ROWS = ["]
+    for record in frame.to_dict("records"):
+        cells = ", ".join(f"{json.dumps(k)}: {literal(v)}" for k, v in record.items())
+        lines.append(f"    {{{cells}}},")
+    lines.append("]")
+    return "\n".join(lines)
+
+
+# =============================================================================
+# Sample export
+# =============================================================================
+
+def make_sample(path: Path, rows: int, seed: int = 0, chunk_rows: int = DEFAULT_CHUNK_ROWS) -> None:
+    """Synthetic export with Dune-style columns, written in chunks."""
+    rng = np.random.default_rng(seed)
+    start = np.datetime64("2025-10-01T00:00:00")
+    span_s = 120 * 86400
+    chains = np.array(["base", "solana"])
+    facilitators = np.array(["Coinbase CDP", "Dexter", "PayAI", "Daydreams", "Stakefy", "x402.rs"])
+    fac_p = np.array([0.35, 0.3, 0.15, 0.1, 0.05, 0.05])
+    n_buyers, n_sellers = max(rows // 20, 1), max(rows // 400, 1)
+    written = 0
+    with path.open("w", encoding="utf-8", newline="") as f:
+        while written < rows:
+            n = min(chunk_rows, rows - written)
+            t = start + np.sort(rng.integers(0, span_s, n)).astype("timedelta64[s]")
+            frame = pd.DataFrame(
+                {
+                    "block_time": pd.Series(t).dt.strftime("%Y-%m-%d %H:%M:%S.000 UTC"),
+                    "tx_hash": np.char.add("0x", np.char.zfill((np.arange(written, written + n) // 2).astype(str), 16)),
+                    "evt_index": np.arange(written, written + n) % 2,
+                    "blockchain": chains[(rng.random(n) < 0.3).astype(int)],
+                    "facilitator": facilitators[rng.choice(len(facilitators), n, p=fac_p)],
+                    "payer": np.char.add("0xb", rng.zipf(1.3, n).clip(max=n_buyers).astype(str)),
+                    "payee": np.char.add("0xs", rng.zipf(1.5, n).clip(max=n_sellers).astype(str)),
+                    "amount_usd": rng.lognormal(-0.5, 1.0, n).round(4),
+                }
+            )
+            frame.to_csv(f, header=written == 0, index=False)
+            written += n
+    print(f"Wrote {rows:,} sample payments to {path}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("exports", nargs="*", type=Path, help="Payment export CSV(s); .gz/.zip are fine")
+    parser.add_argument("--out-dir", type=Path, default=DEFAULT_OUT_DIR, help="Where to write the output tables")
+    parser.add_argument("--state", type=Path, help="Pickled ingest state to resume from and update")
+    parser.add_argument("--chunk-rows", type=int, default=DEFAULT_CHUNK_ROWS, help="Rows read per chunk")
+    parser.add_argument("--print-rows", action="store_true", help="Print x402_data.py row literals for the outputs")
+    parser.add_argument("--make-sample", type=Path, help="Write a synthetic export here and exit")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Rows for --make-sample")
+    args = parser.parse_args()
+
+    if args.make_sample:
+        make_sample(args.make_sample, args.rows, chunk_rows=args.chunk_rows)
+        return 0
+    if not args.exports and not args.state:
+        parser.error("give at least one export (or --state to re-emit tables)")
+
+    state = IngestState.load(args.state)
+    for path in args.exports:
+        ingest_file(state, path, args.chunk_rows)
+    if args.state:
+        state.save(args.state)
+    if state.activity.empty:
+        print("No payments ingested.")
+        return 1
+
+    args.out_dir.mkdir(parents=True, exist_ok=True)
+    print(f"\n{state.rows:,} payments ({state.duplicates:,} duplicates skipped), "
+          f"{len(state.first_seen['buyer', 'all'][0]):,} buyers, {len(state.first_seen['seller', 'all'][0]):,} sellers")
+    for name, (constant, build) in OUTPUT_TABLES.items():
+        frame = build(state)
+        out = args.out_dir / f"{name}.csv"
+        frame.to_csv(out, index=False)
+        print(f"Saved: {out} ({len(frame)} rows)")
+        if args.print_rows and constant:
+            print(format_rows(constant, frame))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
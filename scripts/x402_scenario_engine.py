@@ -0,0 +1,168 @@
+"""
+Scenario grid engine for x402 layer revenue.
+
+Revenue per layer = annual volume x take rate x layer share, evaluated over a
+dense grid as one broadcast NumPy product:
+
+    revenue[layer, volume, take_rate_multiplier, layer_share]   (USD millions)
+
+- volume: annual x402 volume in USD billions,
+- take rate: the layer's USD millions of revenue per $1B of volume
+  (x402-value-accrual-deep-dive.md), scaled by a multiplier axis,
+- layer share: fraction of volume that reaches the layer (e.g. Base's chain
+  share or Coinbase's facilitator share), applied to every layer.
+
+Grids are cached by assumption set (rates, volumes, multipliers, shares), so
+repeated slicing of the same sweep is free. Results are read-only.
+
+Usage:
+    from x402_scenario_engine import LAYER_PER_BILLION, revenue_grid
+
+    grid = revenue_grid(LAYER_PER_BILLION, np.geomspace(0.1, 100, 200),
+                        np.linspace(0.25, 2.0, 50), np.linspace(0.1, 1.0, 20))
+    grid.sel(layer="Facilitator", volume=10.0)   # take-rate x share plane
+
+    uv run python scripts/x402_scenario_engine.py  # 10^6-point sweep timing
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Mapping, Sequence
+
+import numpy as np
+
+
+# USD millions of annual revenue per $1B annual x402 volume (memo $1B table).
+LAYER_PER_BILLION = {
+    "Currency (USDC)": 45.0,
+    "Settlement (Base)": 10.0,
+    "Application": 880.0,
+    "Facilitator": 100.0,
+    "Infrastructure": 1.0,
+}
+DISCOVERY_PER_BILLION = {"low": 20.0, "high": 80.0}  # 2-8% take
+
+# Coinbase direct capture per $1B volume (memo Coinbase attribution table).
+COINBASE_PER_BILLION = {
+    "USDC reserve income share": 25.0,
+    "Base sequencer fees": 7.5,
+    "Facilitator fees": 1.0,
+}
+COINBASE_COMMERCE_PER_BILLION = {"low": 2.0, "high": 5.0}
+
+
+@dataclass(frozen=True)
+class ScenarioGrid:
+    layers: tuple[str, ...]
+    volumes: np.ndarray
+    take_rate_multipliers: np.ndarray
+    layer_shares: np.ndarray
+    revenue: np.ndarray  # USD millions, layers x volumes x multipliers x shares
+
+    @property
+    def size(self) -> int:
+        return self.revenue.size
+
+    def layer(self, name: str) -> np.ndarray:
+        """Revenue for one layer, volumes x multipliers x shares."""
+        return self.revenue[self.layers.index(name)]
+
+    def sel(
+        self,
+        layer: str | None = None,
+        volume: float | None = None,
+        take_rate_multiplier: float | None = None,
+        layer_share: float | None = None,
+    ) -> np.ndarray:
+        """Slice by exact layer name and nearest grid value on numeric axes; omitted axes are kept."""
+        index: list[int | slice] = [slice(None)] * 4
+        if layer is not None:
+            index[0] = self.layers.index(layer)
+        for axis, values, wanted in (
+            (1, self.volumes, volume),
+            (2, self.take_rate_multipliers, take_rate_multiplier),
+            (3, self.layer_shares, layer_share),
+        ):
+            if wanted is not None:
+                index[axis] = int(np.abs(values - wanted).argmin())
+        return self.revenue[tuple(index)]
+
+    def total(self, layers: Sequence[str] | None = None) -> np.ndarray:
+        """Revenue summed over the given layers (all by default)."""
+        idx = [self.layers.index(n) for n in layers] if layers is not None else slice(None)
+        return self.revenue[idx].sum(axis=0)
+
+
+def _frozen(values) -> np.ndarray:
+    arr = np.array(values, dtype=float)
+    arr.flags.writeable = False
+    return arr
+
+
+@lru_cache(maxsize=16)
+def _cached_grid(
+    rates: tuple[tuple[str, float], ...],
+    volumes: tuple[float, ...],
+    take_rate_multipliers: tuple[float, ...],
+    layer_shares: tuple[float, ...],
+) -> ScenarioGrid:
+    rate = np.array([r for _, r in rates])[:, None, None, None]
+    vol = np.array(volumes)[None, :, None, None]
+    mult = np.array(take_rate_multipliers)[None, None, :, None]
+    share = np.array(layer_shares)[None, None, None, :]
+    revenue = rate * vol * mult * share
+    revenue.flags.writeable = False
+    return ScenarioGrid(
+        layers=tuple(name for name, _ in rates),
+        volumes=_frozen(volumes),
+        take_rate_multipliers=_frozen(take_rate_multipliers),
+        layer_shares=_frozen(layer_shares),
+        revenue=revenue,
+    )
+
+
+def revenue_grid(
+    per_billion: Mapping[str, float],
+    volumes: Sequence[float] | np.ndarray,
+    take_rate_multipliers: Sequence[float] | np.ndarray = (1.0,),
+    layer_shares: Sequence[float] | np.ndarray = (1.0,),
+) -> ScenarioGrid:
+    """Evaluate (or fetch from cache) the revenue grid for one assumption set."""
+    return _cached_grid(
+        tuple((name, float(rate)) for name, rate in per_billion.items()),
+        tuple(np.asarray(volumes, dtype=float).ravel().tolist()),
+        tuple(np.asarray(take_rate_multipliers, dtype=float).ravel().tolist()),
+        tuple(np.asarray(layer_shares, dtype=float).ravel().tolist()),
+    )
+
+
+def with_range(per_billion: Mapping[str, float], label: str, low_high: Mapping[str, float]) -> dict[str, float]:
+    """Append '<label> (low)' / '<label> (high)' rate rows for a range assumption."""
+    out = dict(per_billion)
+    out[f"{label} (low)"] = low_high["low"]
+    out[f"{label} (high)"] = low_high["high"]
+    return out
+
+
+if __name__ == "__main__":
+    rates = with_range(LAYER_PER_BILLION, "Discovery", DISCOVERY_PER_BILLION)
+    volumes = np.linspace(0.5, 100.0, 200)
+    multipliers = np.linspace(0.25, 2.0, 36)
+    shares = np.linspace(0.05, 1.0, 20)
+
+    start = time.perf_counter()
+    grid = revenue_grid(rates, volumes, multipliers, shares)
+    cold = time.perf_counter() - start
+    start = time.perf_counter()
+    revenue_grid(rates, volumes, multipliers, shares)
+    warm = time.perf_counter() - start
+    print(f"{grid.size:,} scenario points in {cold * 1000:.1f} ms (cached lookup {warm * 1000:.2f} ms)")
+
+    plane = grid.sel(layer="Facilitator", volume=10.0)
+    print(f"Facilitator at $10B volume: ${plane.min():,.0f}M-${plane.max():,.0f}M across take-rate x share")
+    at_1b = grid.sel(volume=1.0, take_rate_multiplier=1.0, layer_share=1.0)
+    for name, value in zip(grid.layers, at_1b):
+        print(f"  {name:<22} ${value:>8,.1f}M at $1B volume")
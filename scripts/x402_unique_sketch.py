@@ -0,0 +1,326 @@
+"""
+HyperLogLog sketches of x402 buyers and sellers, per day and chain.
+
+Exact unique counts need every address of the window in memory and a full
+recount for each new window. A HyperLogLog sketch instead keeps m = 2^p
+one-byte registers per (day, chain, role). Sketches merge by taking the
+register-wise max, so the unique buyers (or sellers) of any date range and
+chain subset are estimated from the stored daily sketches without touching
+the raw payments. The relative standard error is 1.04 / sqrt(m), which is
+0.81% at the default p = 14 (16 KiB per sketch). Estimates use the classic
+HLL formula with linear counting for small cardinalities. Address hashes are
+64-bit, so no large-range correction is needed.
+
+Re-adding a payment never changes a register, so ingesting an export twice
+(or overlapping exports) is harmless.
+
+Store layout (.cache/x402_sketches/store.npz): one row of registers per
+(role, chain, day) key.
+
+Usage:
+    from x402_unique_sketch import SketchStore
+    store = SketchStore.load()
+    store.count("buyer", "2025-10-20", "2025-10-26")          # Estimate(value, low, high)
+    store.ratio("2025-11-01", "2025-11-30", chains=["solana"])
+
+    uv run python scripts/x402_unique_sketch.py build exports/x402_payments.csv
+    uv run python scripts/x402_unique_sketch.py count --start 2025-10-20 --end 2025-10-26
+    uv run python scripts/x402_unique_sketch.py series --window 7 --chain base
+    uv run python scripts/x402_unique_sketch.py build /tmp/sample.csv --exact   # compare to exact counts
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from x402_payment_ingest import DEFAULT_CHUNK_ROWS, address_hashes, day_numbers, iter_chunks, normalise_chain
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_STORE = ROOT / ".cache" / "x402_sketches" / "store.npz"
+DEFAULT_PRECISION = 14
+ROLES = ("buyer", "seller")
+CONFIDENCE_Z = 1.96  # Estimate.low / high are ~95% bounds
+
+
+# =============================================================================
+# HyperLogLog registers
+# =============================================================================
+
+def _bit_length(x: np.ndarray) -> np.ndarray:
+    """Bit length of each uint64 (0 for 0); exact, via 32-bit halves in float64."""
+    hi = (x >> np.uint64(32)).astype(np.float64)
+    lo = (x & np.uint64(0xFFFFFFFF)).astype(np.float64)
+    return np.where(hi > 0, 32 + np.frexp(hi)[1], np.frexp(lo)[1])
+
+
+def register_updates(hashes: np.ndarray, precision: int) -> tuple[np.ndarray, np.ndarray]:
+    """(register index, rank) for each 64-bit hash."""
+    hashes = np.asarray(hashes, dtype=np.uint64)
+    index = (hashes >> np.uint64(64 - precision)).astype(np.int64)
+    rest = hashes << np.uint64(precision)  # remaining 64 - p bits, left-aligned
+    rank = np.minimum(65 - _bit_length(rest), 64 - precision + 1).astype(np.uint8)
+    return index, rank
+
+
+def _alpha(m: int) -> float:
+    return {16: 0.673, 32: 0.697, 64: 0.709}.get(m, 0.7213 / (1 + 1.079 / m))
+
+
+def estimate_registers(registers: np.ndarray) -> np.ndarray:
+    """Cardinality estimate per row of a (..., m) register array."""
+    registers = np.atleast_2d(registers)
+    m = registers.shape[-1]
+    raw = _alpha(m) * m * m / np.sum(np.ldexp(1.0, -registers.astype(np.int64)), axis=-1)
+    zeros = np.count_nonzero(registers == 0, axis=-1)
+    with np.errstate(divide="ignore"):
+        linear = m * np.log(m / np.maximum(zeros, 1))
+    return np.where((raw <= 2.5 * m) & (zeros > 0), linear, raw)
+
+
+@dataclass(frozen=True)
+class Estimate:
+    value: float
+    low: float
+    high: float
+
+    def __str__(self) -> str:
+        fmt = ",.0f" if self.value >= 100 else ".2f"
+        return f"{self.value:{fmt}} [{self.low:{fmt}}, {self.high:{fmt}}]"
+
+
+# =============================================================================
+# Sketch store
+# =============================================================================
+
+class SketchStore:
+    """Daily HyperLogLog sketches keyed by (role, chain, day)."""
+
+    def __init__(self, precision: int = DEFAULT_PRECISION):
+        if not 4 <= precision <= 18:
+            raise ValueError(f"precision must be in [4, 18], got {precision}")
+        self.precision = precision
+        self.m = 1 << precision
+        self.keys = pd.DataFrame({"role": pd.Series(dtype=object), "chain": pd.Series(dtype=object),
+                                  "day": pd.Series(dtype="int32")})
+        self.registers = np.zeros((0, self.m), dtype=np.uint8)
+        self._rows: dict[tuple[str, str, int], int] = {}
+
+    @property
+    def relative_error(self) -> float:
+        """Relative standard error of any estimate from this store."""
+        return 1.04 / np.sqrt(self.m)
+
+    # -- persistence -----------------------------------------------------------
+
+    @classmethod
+    def load(cls, path: Path = DEFAULT_STORE) -> "SketchStore":
+        with np.load(path, allow_pickle=False) as data:
+            store = cls(int(data["precision"]))
+            store.keys = pd.DataFrame(
+                {"role": data["role"].astype(object), "chain": data["chain"].astype(object), "day": data["day"]}
+            )
+            store.registers = data["registers"]
+        store._rows = {key: i for i, key in enumerate(store.keys.itertuples(index=False, name=None))}
+        return store
+
+    def save(self, path: Path = DEFAULT_STORE) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.stem + ".tmp.npz")
+        np.savez_compressed(
+            tmp,
+            precision=self.precision,
+            role=self.keys["role"].to_numpy(dtype=str),
+            chain=self.keys["chain"].to_numpy(dtype=str),
+            day=self.keys["day"].to_numpy(dtype=np.int32),
+            registers=self.registers,
+        )
+        tmp.replace(path)
+
+    # -- ingestion -------------------------------------------------------------
+
+    def _row_indices(self, role: str, chains: np.ndarray, days: np.ndarray) -> np.ndarray:
+        """Register row per element, adding rows for unseen (role, chain, day) keys."""
+        pair_codes, pairs = pd.factorize(pd.MultiIndex.from_arrays([chains, days]))
+        rows = np.empty(len(pairs), dtype=np.int64)
+        new = []
+        for i, (chain, day) in enumerate(pairs):
+            key = (role, chain, int(day))
+            if key not in self._rows:
+                self._rows[key] = len(self._rows)
+                new.append(key)
+            rows[i] = self._rows[key]
+        if new:
+            self.keys = pd.concat(
+                [self.keys, pd.DataFrame(new, columns=["role", "chain", "day"]).astype({"day": "int32"})],
+                ignore_index=True,
+            )
+            self.registers = np.vstack([self.registers, np.zeros((len(new), self.m), dtype=np.uint8)])
+        return rows[pair_codes]
+
+    def add(self, role: str, chains: np.ndarray, days: np.ndarray, hashes: np.ndarray) -> None:
+        """Add address hashes seen on (chain, day) pairs, one element per payment."""
+        if role not in ROLES:
+            raise ValueError(f"role must be one of {ROLES}, got {role!r}")
+        rows = self._row_indices(role, chains, days)
+        index, rank = register_updates(hashes, self.precision)
+        np.maximum.at(self.registers.reshape(-1), rows * self.m + index, rank)
+
+    def add_chunk(self, chunk: pd.DataFrame) -> None:
+        """Fold a canonical export chunk (see x402_payment_ingest.iter_chunks) into the store."""
+        days = day_numbers(chunk["time"])
+        chains = normalise_chain(chunk["chain"])
+        for role in ROLES:
+            self.add(role, chains, days, address_hashes(chunk[role]))
+
+    # -- queries ---------------------------------------------------------------
+
+    def _select(self, role: str, start=None, end=None, chains=None) -> np.ndarray:
+        mask = (self.keys["role"] == role).to_numpy().copy()
+        if start is not None:
+            mask &= self.keys["day"].to_numpy() >= _day(start)
+        if end is not None:
+            mask &= self.keys["day"].to_numpy() <= _day(end)
+        if chains is not None:
+            mask &= self.keys["chain"].isin([c.lower() for c in chains]).to_numpy()
+        return np.flatnonzero(mask)
+
+    def merged(self, role: str, start=None, end=None, chains=None) -> np.ndarray:
+        """Union sketch (registers) of a role over an inclusive date range and chain subset."""
+        rows = self._select(role, start, end, chains)
+        if not len(rows):
+            return np.zeros(self.m, dtype=np.uint8)
+        return self.registers[rows].max(axis=0)
+
+    def _bounds(self, value: float) -> Estimate:
+        spread = CONFIDENCE_Z * self.relative_error * value
+        return Estimate(float(value), float(max(value - spread, 0.0)), float(value + spread))
+
+    def count(self, role: str, start=None, end=None, chains=None) -> Estimate:
+        """Approximate unique addresses of a role in [start, end] on the given chains."""
+        return self._bounds(estimate_registers(self.merged(role, start, end, chains))[0])
+
+    def ratio(self, start=None, end=None, chains=None) -> Estimate:
+        """Buyer:seller ratio with ~95% bounds (independent relative errors combined)."""
+        buyers = self.count("buyer", start, end, chains).value
+        sellers = self.count("seller", start, end, chains).value
+        if sellers == 0:
+            return Estimate(float("nan"), float("nan"), float("nan"))
+        value = buyers / sellers
+        spread = CONFIDENCE_Z * np.sqrt(2) * self.relative_error * value
+        return Estimate(value, max(value - spread, 0.0), value + spread)
+
+    def series(self, window: int | None = None, chains=None) -> pd.DataFrame:
+        """Per-day buyers, sellers and ratio over trailing `window` days (None = since first day)."""
+        days = np.sort(self.keys["day"].unique())
+        if not len(days):
+            return pd.DataFrame(columns=["date", "buyers", "sellers", "ratio"])
+        span = np.arange(days.min(), days.max() + 1)
+        out = {"date": pd.Series(span.astype("datetime64[D]")).dt.strftime("%Y-%m-%d")}
+        for role in ROLES:
+            daily = np.zeros((len(span), self.m), dtype=np.uint8)
+            for day in span:
+                rows = self._select(role, day, day, chains)
+                if len(rows):
+                    daily[day - span[0]] = self.registers[rows].max(axis=0)
+            if window is None:
+                merged = np.maximum.accumulate(daily, axis=0)
+            else:
+                merged = np.stack([daily[max(0, i - window + 1) : i + 1].max(axis=0) for i in range(len(span))])
+            out[f"{role}s"] = np.round(estimate_registers(merged)).astype(np.int64)
+        frame = pd.DataFrame(out)
+        frame["ratio"] = (frame["buyers"] / frame["sellers"].replace(0, np.nan)).round(2)
+        return frame
+
+
+def _day(value) -> int:
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    return int(np.datetime64(pd.Timestamp(value).date(), "D").astype(np.int64))
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def _exact_counts(paths: list[Path], chunk_rows: int) -> dict[str, int]:
+    seen = {role: set() for role in ROLES}
+    for path in paths:
+        for chunk in iter_chunks(path, chunk_rows):
+            for role in ROLES:
+                seen[role].update(address_hashes(chunk[role]).tolist())
+    return {role: len(values) for role, values in seen.items()}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--store", type=Path, default=DEFAULT_STORE, help="Sketch store (.npz)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_build = sub.add_parser("build", help="Add payment exports to the store")
+    p_build.add_argument("exports", nargs="+", type=Path)
+    p_build.add_argument("--precision", type=int, default=DEFAULT_PRECISION, help="log2 registers per sketch (new store)")
+    p_build.add_argument("--chunk-rows", type=int, default=DEFAULT_CHUNK_ROWS)
+    p_build.add_argument("--exact", action="store_true", help="Also count exactly and report the error")
+
+    for name, help_text in (("count", "Unique buyers, sellers and ratio for a window"),
+                            ("series", "Daily trailing-window (or since-launch) unique counts")):
+        p = sub.add_parser(name, help=help_text)
+        p.add_argument("--chain", action="append", help="Restrict to chain(s); repeatable")
+        if name == "count":
+            p.add_argument("--start", help="First day (inclusive), YYYY-MM-DD")
+            p.add_argument("--end", help="Last day (inclusive), YYYY-MM-DD")
+        else:
+            p.add_argument("--window", type=int, help="Trailing window in days (default: since first day)")
+            p.add_argument("--csv", type=Path, help="Write the series here")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        store = SketchStore.load(args.store) if args.store.exists() else SketchStore(args.precision)
+        start = time.perf_counter()
+        rows = 0
+        for path in args.exports:
+            for chunk in iter_chunks(path, args.chunk_rows):
+                store.add_chunk(chunk)
+                rows += len(chunk)
+        store.save(args.store)
+        elapsed = time.perf_counter() - start
+        print(f"{rows:,} payments in {elapsed:.1f}s; {len(store.keys)} sketches "
+              f"({store.registers.nbytes / 1e6:.1f} MB) -> {args.store}")
+        print(f"relative standard error: {store.relative_error:.2%}")
+        if args.exact:
+            exact = _exact_counts(args.exports, args.chunk_rows)
+            for role in ROLES:
+                est = store.count(role)
+                print(f"{role}s: {est}  exact {exact[role]:,}  error {est.value / exact[role] - 1:+.2%}")
+        return 0
+
+    if not args.store.exists():
+        print(f"No sketch store at {args.store}; run `build` first.")
+        return 1
+    store = SketchStore.load(args.store)
+    if args.command == "count":
+        for role in ROLES:
+            print(f"{role}s: {store.count(role, args.start, args.end, args.chain)}")
+        print(f"buyer:seller ratio: {store.ratio(args.start, args.end, args.chain)}")
+        print(f"(~95% bounds; relative standard error {store.relative_error:.2%})")
+    else:
+        frame = store.series(args.window, args.chain)
+        if args.csv:
+            frame.to_csv(args.csv, index=False)
+            print(f"Saved: {args.csv}")
+        else:
+            print(frame.to_string(index=False))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())